@@ -6,10 +6,11 @@ Usage:
     python -m nfl_agent.scripts.get_articles
 """
 
-import json
+import asyncio
+import orjson
 from pathlib import Path
 from nfl_agent.src.utils.espn_client import ESPNClient
-from nfl_agent.src.tools.article_fetcher.utils import fetch_articles_for_team
+from nfl_agent.src.tools.article_fetcher.utils import afetch_articles_for_teams
 
 
 def main():
@@ -30,34 +31,36 @@ def main():
     client = ESPNClient()
 
     # Get all team IDs
-    team_mapping = client._load_team_mapping()
+    team_mapping = client.team_mapping
     team_ids = list(team_mapping.values())
 
     print(f"Fetching articles for {len(team_ids)} teams...")
+    results = asyncio.run(
+        afetch_articles_for_teams([int(team_id) for team_id in team_ids])
+    )
 
-    all_articles = []
+    total_articles = 0
     articles_by_team = {}
 
-    for team_name, team_id in team_mapping.items():
-        print(f"Fetching articles for {team_name} (ID: {team_id})...")
-        try:
-            articles = fetch_articles_for_team(int(team_id))
+    # Stream articles to disk one at a time instead of building one big list.
+    # The output is still a JSON array, with one article per line.
+    with open(output_file, "wb", buffering=1 << 20) as f:
+        f.write(b"[")
+        for (team_name, team_id), articles in zip(team_mapping.items(), results):
+            print(f"Articles for {team_name} (ID: {team_id}):")
+            if isinstance(articles, Exception):
+                print(f"  Error fetching articles for {team_name}: {articles}")
+                articles_by_team[team_name] = 0
+                continue
             articles_by_team[team_name] = len(articles)
-            # Convert Pydantic models to dicts for JSON serialization
             for article in articles:
-                article_dict = article.model_dump(mode="json")
-                all_articles.append(article_dict)
+                f.write(b",\n" if total_articles else b"\n")
+                f.write(orjson.dumps(article.model_dump(mode="json"), default=str))
+                total_articles += 1
             print(f"  Found {len(articles)} articles")
-        except Exception as e:
-            print(f"  Error fetching articles for {team_name}: {e}")
-            articles_by_team[team_name] = 0
-
-    # Save all articles to JSON file
-    print(f"\nSaving {len(all_articles)} total articles to {output_file}...")
-    with open(output_file, "w") as f:
-        json.dump(all_articles, f, indent=2, default=str)
+        f.write(b"\n]\n")
 
-    print(f"✓ Successfully saved articles to {output_file}")
+    print(f"\n✓ Successfully saved {total_articles} articles to {output_file}")
     print("\nSummary by team:")
     for team_name, count in sorted(articles_by_team.items()):
         print(f"  {team_name}: {count} articles")
@@ -46,7 +46,7 @@ def main():
         output_path.parent.mkdir(parents=True, exist_ok=True)
         serializable_result = {"messages": messages_to_dict(result["messages"])}
         with open(output_path, "w") as f:
-            json.dump(serializable_result, f, indent=4)
+            f.write(json.dumps(serializable_result, indent=4))
 
         # sleep for 5 seconds
         time.sleep(5)
@@ -13,18 +13,22 @@ Usage:
 """
 
 import argparse
-import json
+import bisect
 import re
 import sys
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Literal
 
+import orjson
 from rich.text import Text
-from textual import on
+from textual import on, work
 from textual.app import App, ComposeResult
 from textual.binding import Binding
 from textual.containers import Horizontal, Vertical, VerticalScroll
+from textual.message import Message
+from textual.timer import Timer
 from textual.widgets import (
     Button,
     Footer,
@@ -45,11 +49,22 @@ DEFAULT_TEAM_INFO_DIR = (
 DEFAULT_OUTPUT_DIR = (
     Path(__file__).parent.parent / "experiments" / "artifacts" / "summary_eval"
 )
+PAIRS_CACHE_PATH = DEFAULT_OUTPUT_DIR.parent / "_pairs_cache.json"
+
+TEAM_INFO_STEM_RE = re.compile(r"article_(\d+)_team_info")
 
 
 EvalMode = Literal["accuracy", "completeness", "relevance"]
 
+# team_info fields holding a list of facts
+LIST_FACT_CATEGORIES = ("injuries", "strengths", "problem_areas", "relevant_players")
+
+# Delay before re-rendering highlighted content, so rapid searches and
+# match navigation collapse into a single render
+CONTENT_UPDATE_DEBOUNCE = 0.05
+
 
+@lru_cache(maxsize=1024)
 def format_timestamp(ts: str) -> str:
     """Format ISO timestamp to readable format."""
     try:
@@ -61,38 +76,70 @@ def format_timestamp(ts: str) -> str:
 
 def extract_all_facts(team_info: dict) -> list[dict]:
     """Extract all facts from team_info with their categories."""
-    facts = []
-
-    if team_info.get("coaching_summary"):
-        facts.append(
-            {"category": "coaching_summary", "fact": team_info["coaching_summary"]}
-        )
-
-    for category in ["injuries", "strengths", "problem_areas", "relevant_players"]:
-        items = team_info.get(category) or []
-        for item in items:
-            facts.append({"category": category, "fact": item})
-
+    coaching_summary = team_info.get("coaching_summary")
+    facts = (
+        [{"category": "coaching_summary", "fact": coaching_summary}]
+        if coaching_summary
+        else []
+    )
+    facts.extend(
+        {"category": category, "fact": item}
+        for category in LIST_FACT_CATEGORIES
+        for item in team_info.get(category) or ()
+    )
     return facts
 
 
 def find_article_pairs(
-    articles_dir: Path, team_info_dir: Path
+    articles_dir: Path,
+    team_info_dir: Path,
+    cache_path: Path | None = PAIRS_CACHE_PATH,
 ) -> list[tuple[int, Path, Path]]:
-    """Find matching article and team_info file pairs."""
+    """
+    Find matching article and team_info file pairs.
+
+    The result is cached in cache_path and reused until either directory's
+    mtime changes (i.e. a file is added, removed or renamed).
+    """
+    key = [
+        str(articles_dir),
+        str(team_info_dir),
+        articles_dir.stat().st_mtime_ns,
+        team_info_dir.stat().st_mtime_ns,
+    ]
+
+    if cache_path is not None and cache_path.exists():
+        try:
+            cached = orjson.loads(cache_path.read_bytes())
+        except orjson.JSONDecodeError:
+            cached = {}
+        if cached.get("key") == key:
+            return [
+                (article_id, Path(article_file), Path(team_info_file))
+                for article_id, article_file, team_info_file in cached["pairs"]
+            ]
+
     pairs = []
 
     for team_info_file in sorted(team_info_dir.glob("article_*_team_info.json")):
-        filename = team_info_file.stem
-        parts = filename.split("_")
-        if len(parts) >= 2:
-            try:
-                article_id = int(parts[1])
-                article_file = articles_dir / f"article_{article_id}.json"
-                if article_file.exists():
-                    pairs.append((article_id, article_file, team_info_file))
-            except ValueError:
-                continue
+        match = TEAM_INFO_STEM_RE.fullmatch(team_info_file.stem)
+        if not match:
+            continue
+        article_id = int(match.group(1))
+        article_file = articles_dir / f"article_{article_id}.json"
+        if article_file.exists():
+            pairs.append((article_id, article_file, team_info_file))
+
+    if cache_path is not None:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        cache_path.write_bytes(
+            orjson.dumps(
+                {
+                    "key": key,
+                    "pairs": [[a_id, str(a), str(t)] for a_id, a, t in pairs],
+                }
+            )
+        )
 
     return pairs
 
@@ -100,16 +147,14 @@ def find_article_pairs(
 def load_score_file(score_path: Path) -> dict:
     """Load existing score file or return empty dict."""
     if score_path.exists():
-        with open(score_path) as f:
-            return json.load(f)
+        return orjson.loads(score_path.read_bytes())
     return {}
 
 
 def save_score_file(score_path: Path, data: dict) -> None:
     """Save score data to JSON file."""
     score_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(score_path, "w") as f:
-        json.dump(data, f, indent=2)
+    score_path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
 
 
 def mode_already_complete(score_data: dict, mode: str) -> bool:
@@ -161,6 +206,17 @@ class ArticlePanel(VerticalScroll):
         self.search_term = ""
         self.match_positions: list[int] = []
         self.current_match = -1
+        # Content with all matches highlighted, keyed by (article id, search term)
+        self._base_styled_text: Text | None = None
+        self._base_styled_key: tuple[int, str] | None = None
+        # Offsets of every newline in the content, for mapping matches to lines
+        self._line_offsets: list[int] = []
+        # Child widgets, resolved once on mount
+        self._headline_label: Label | None = None
+        self._published_label: Label | None = None
+        self._description_label: Label | None = None
+        self._content_display: Static | None = None
+        self._pending_update: Timer | None = None
 
     def compose(self) -> ComposeResult:
         yield Label(
@@ -172,40 +228,53 @@ class ArticlePanel(VerticalScroll):
         yield Static("", id="article-content-display")
 
     def on_mount(self) -> None:
-        """Initialize content display."""
+        """Resolve child widgets and initialize content display."""
+        self._headline_label = self.query_one("#article-headline", Label)
+        self._published_label = self.query_one("#article-published", Label)
+        self._description_label = self.query_one("#article-description", Label)
+        self._content_display = self.query_one("#article-content-display", Static)
         self._update_all_fields()
 
     def _update_all_fields(self) -> None:
         """Update all article fields."""
-        try:
-            headline_label = self.query_one("#article-headline", Label)
-            published_label = self.query_one("#article-published", Label)
-            description_label = self.query_one("#article-description", Label)
-        except Exception:
+        self._update_header_fields()
+        self._do_update_content_display()
+
+    def _update_header_fields(self) -> None:
+        """Update the headline, published date and description labels."""
+        if self._headline_label is None:
             return
 
         if not self.article:
-            headline_label.update("No article loaded")
-            published_label.update("")
-            description_label.update("")
-            self._update_content_display()
+            self._headline_label.update("No article loaded")
+            self._published_label.update("")
+            self._description_label.update("")
             return
 
         headline = self.article.get("headline", "No headline")
         description = self.article.get("description", "")
         published = format_timestamp(self.article.get("published", ""))
 
-        headline_label.update(f"📰 {headline}")
-        published_label.update(f"📅 {published}")
-        description_label.update(f"📝 {description}" if description else "")
+        self._headline_label.update(f"📰 {headline}")
+        self._published_label.update(f"📅 {published}")
+        self._description_label.update(f"📝 {description}" if description else "")
 
-        self._update_content_display()
+    def _schedule_content_update(self) -> None:
+        """Re-render the content after a short delay, replacing any pending render."""
+        if self._pending_update is not None:
+            self._pending_update.stop()
+        self._pending_update = self.set_timer(
+            CONTENT_UPDATE_DEBOUNCE, self._do_update_content_display
+        )
 
-    def _update_content_display(self) -> None:
+    def _do_update_content_display(self) -> None:
         """Update the article content with optional search highlighting."""
-        try:
-            display = self.query_one("#article-content-display", Static)
-        except Exception:
+        if self._pending_update is not None:
+            self._pending_update.stop()
+            self._pending_update = None
+
+        display = self._content_display
+        if display is None:
             return
 
         if not self.article:
@@ -215,18 +284,11 @@ class ArticlePanel(VerticalScroll):
         content = self.article.get("fetched_content", "No content available")
 
         if self.search_term:
-            # Highlight search matches using Rich Text
-            text = Text(content)
-            pattern = re.compile(re.escape(self.search_term), re.IGNORECASE)
-
-            # Find all matches and store positions
-            self.match_positions = [m.start() for m in pattern.finditer(content)]
-
-            # Highlight all matches
-            for match in pattern.finditer(content):
-                text.stylize("bold black on yellow", match.start(), match.end())
+            if self._base_styled_text is None:
+                self._base_styled_text = self._build_base_styled_text(content)
 
-            # Extra highlight for current match
+            # Only the current match overlay changes between navigations
+            text = self._base_styled_text.copy()
             if self.match_positions and 0 <= self.current_match < len(
                 self.match_positions
             ):
@@ -235,24 +297,70 @@ class ArticlePanel(VerticalScroll):
 
             display.update(text)
         else:
+            # Release the highlighted copy so its style spans can be freed
+            self._invalidate_styled_text()
             self.match_positions = []
             self.current_match = -1
             display.update(content)
 
+    def _find_matches(self) -> None:
+        """Store the start position of every search match in the content."""
+        content = self.article.get("fetched_content", "") if self.article else ""
+        term = self.search_term
+
+        if term.lower() == term.upper():
+            # No cased characters (e.g. numbers), so a plain scan finds the
+            # same matches as the case-insensitive regex
+            positions = []
+            length = len(term)
+            i = content.find(term)
+            while i >= 0:
+                positions.append(i)
+                i = content.find(term, i + length)
+            self.match_positions = positions
+            return
+
+        pattern = re.compile(re.escape(term), re.IGNORECASE)
+        self.match_positions = [m.start() for m in pattern.finditer(content)]
+
+    def _build_base_styled_text(self, content: str) -> Text:
+        """Highlight all search matches."""
+        text = Text(content)
+        length = len(self.search_term)
+        for pos in self.match_positions:
+            text.stylize("bold black on yellow", pos, pos + length)
+        return text
+
+    def _invalidate_styled_text(self) -> None:
+        """Drop the cached highlighted content."""
+        self._base_styled_text = None
+        self._base_styled_key = None
+
     def update_article(self, article: dict) -> None:
         """Update the displayed article."""
         self.article = article
         self.search_term = ""
         self.match_positions = []
         self.current_match = -1
-        self._update_all_fields()
+        self._invalidate_styled_text()
+        content = (article or {}).get("fetched_content", "")
+        self._line_offsets = [i for i, c in enumerate(content) if c == "\n"]
+        self._update_header_fields()
+        self._do_update_content_display()
         self.scroll_home()
 
     def search(self, term: str) -> int:
         """Search for term in article. Returns number of matches."""
         self.search_term = term.strip()
         self.current_match = 0 if self.search_term else -1
-        self._update_content_display()
+
+        key = (id(self.article), self.search_term)
+        if self.search_term and self._base_styled_key != key:
+            self._invalidate_styled_text()
+            self._base_styled_key = key
+            self._find_matches()
+
+        self._schedule_content_update()
         return len(self.match_positions)
 
     def next_match(self) -> int:
@@ -260,16 +368,8 @@ class ArticlePanel(VerticalScroll):
         if not self.match_positions:
             return -1
         self.current_match = (self.current_match + 1) % len(self.match_positions)
-        self._update_content_display()
-        # Estimate scroll position (rough approximation)
-        if self.article:
-            content = self.article.get("fetched_content", "")
-            if content and self.match_positions:
-                # Scroll to approximate position
-                pos = self.match_positions[self.current_match]
-                # Estimate line number (assume ~80 chars per line)
-                approx_line = pos // 80
-                self.scroll_to(y=approx_line, animate=False)
+        self._schedule_content_update()
+        self._scroll_to_current_match()
         return self.current_match
 
     def prev_match(self) -> int:
@@ -277,22 +377,25 @@ class ArticlePanel(VerticalScroll):
         if not self.match_positions:
             return -1
         self.current_match = (self.current_match - 1) % len(self.match_positions)
-        self._update_content_display()
-        # Estimate scroll position
-        if self.article:
-            content = self.article.get("fetched_content", "")
-            if content and self.match_positions:
-                pos = self.match_positions[self.current_match]
-                approx_line = pos // 80
-                self.scroll_to(y=approx_line, animate=False)
+        self._schedule_content_update()
+        self._scroll_to_current_match()
         return self.current_match
 
+    def _scroll_to_current_match(self) -> None:
+        """Scroll to the line containing the current match."""
+        if not self.match_positions:
+            return
+        pos = self.match_positions[self.current_match]
+        line = bisect.bisect_left(self._line_offsets, pos)
+        self.scroll_to(y=line, animate=False)
+
     def clear_search(self) -> None:
         """Clear search highlighting."""
         self.search_term = ""
         self.match_positions = []
         self.current_match = -1
-        self._update_content_display()
+        self._invalidate_styled_text()
+        self._do_update_content_display()
 
 
 class FactPanel(VerticalScroll):
@@ -470,6 +573,24 @@ class EvaluationApp(App):
         Binding("pagedown", "page_down", "Page Down", show=False),
     ]
 
+    class ArticleLoaded(Message):
+        """Posted once an article pair has been read from disk."""
+
+        def __init__(
+            self,
+            pair_index: int,
+            article: dict,
+            team_info: dict,
+            score_path: Path,
+            score_data: dict,
+        ) -> None:
+            super().__init__()
+            self.pair_index = pair_index
+            self.article = article
+            self.team_info = team_info
+            self.score_path = score_path
+            self.score_data = score_data
+
     def __init__(
         self,
         pairs: list[tuple[int, Path, Path]],
@@ -494,6 +615,8 @@ class EvaluationApp(App):
         self.facts = []
         self.score_data = {}
         self.score_path = None
+        # True when score_data has changes not yet written to score_path
+        self._score_dirty = False
 
         # Mode-specific state
         self.accuracy_details = []
@@ -502,6 +625,8 @@ class EvaluationApp(App):
 
         self.evaluated_count = 0
         self.skipped_count = 0
+        # True while the next article is being read in a worker thread
+        self.loading = False
 
     def compose(self) -> ComposeResult:
         yield Header()
@@ -536,70 +661,102 @@ class EvaluationApp(App):
         yield Footer()
 
     def on_mount(self) -> None:
-        """Initialize the first article."""
+        """Resolve widgets and initialize the first article."""
+        self._article_panel = self.query_one("#article-panel", ArticlePanel)
+        self._fact_panel = self.query_one("#fact-panel", FactPanel)
+        self._question_label = self.query_one("#question-label", Label)
+        self._notes_input = self.query_one("#notes-input", Input)
+        self._missing_area = self.query_one("#missing-facts-area", TextArea)
+        self._yes_btn = self.query_one("#yes-btn", Button)
+        self._no_btn = self.query_one("#no-btn", Button)
+        self._skip_btn = self.query_one("#skip-btn", Button)
+        self._progress_label = self.query_one("#progress-label", Label)
+        self._status_bar = self.query_one("#status-bar", Static)
+        self._search_container = self.query_one("#search-container")
+        self._search_status = self.query_one("#search-status", Label)
+        self._search_input = self.query_one("#search-input", Input)
+
         self.load_next_article()
 
     def load_next_article(self) -> None:
         """Load the next article that needs evaluation."""
-        while self.current_pair_index < len(self.pairs):
-            article_id, article_path, team_info_path = self.pairs[
-                self.current_pair_index
-            ]
+        if self.current_pair_index < len(self.pairs):
+            self.loading = True
+            self._load_pair(self.current_pair_index)
+            return
 
-            with open(article_path) as f:
-                self.article = json.load(f)
+        # No more articles
+        self.loading = False
+        self.show_completion()
 
-            with open(team_info_path) as f:
-                self.team_info = json.load(f)
+    @work(thread=True, exclusive=True)
+    def _load_pair(self, pair_index: int) -> None:
+        """Read an article pair off the UI thread."""
+        article_id, article_path, team_info_path = self.pairs[pair_index]
 
-            self.score_path = self.output_dir / f"{article_id}_summary_score.json"
-            self.score_data = load_score_file(self.score_path)
-            self.score_data["id"] = article_id
+        article = orjson.loads(article_path.read_bytes())
+        team_info = orjson.loads(team_info_path.read_bytes())
 
-            self.facts = extract_all_facts(self.team_info)
+        score_path = self.output_dir / f"{article_id}_summary_score.json"
+        score_data = load_score_file(score_path)
+        score_data["id"] = article_id
 
-            if not self.facts:
-                self.skipped_count += 1
-                self.current_pair_index += 1
-                continue
+        self.post_message(
+            self.ArticleLoaded(pair_index, article, team_info, score_path, score_data)
+        )
 
-            # Check which modes need to run
-            modes_needed = []
-            for mode in self.modes:
-                if self.overwrite or not mode_already_complete(self.score_data, mode):
-                    modes_needed.append(mode)
+    def on_evaluation_app_article_loaded(self, message: ArticleLoaded) -> None:
+        """Start evaluating a loaded article, or skip to the next one."""
+        if message.pair_index != self.current_pair_index:
+            return
 
-            if not modes_needed:
-                self.skipped_count += 1
-                self.current_pair_index += 1
-                continue
+        self.article = message.article
+        self.team_info = message.team_info
+        self.score_path = message.score_path
+        self.score_data = message.score_data
 
-            # Found an article to evaluate
-            self.modes = modes_needed
-            self.current_mode_index = 0
-            self.current_fact_index = 0
-            self.accuracy_details = []
-            self.relevance_details = []
-            self.completeness_has_missing = None
+        self.facts = extract_all_facts(self.team_info)
 
-            self.update_display()
+        if not self.facts:
+            self.skipped_count += 1
+            self.current_pair_index += 1
+            self.load_next_article()
             return
 
-        # No more articles
-        self.show_completion()
+        # Check which modes need to run
+        modes_needed = []
+        for mode in self.modes:
+            if self.overwrite or not mode_already_complete(self.score_data, mode):
+                modes_needed.append(mode)
+
+        if not modes_needed:
+            self.skipped_count += 1
+            self.current_pair_index += 1
+            self.load_next_article()
+            return
+
+        # Found an article to evaluate
+        self.modes = modes_needed
+        self.current_mode_index = 0
+        self.current_fact_index = 0
+        self.accuracy_details = []
+        self.relevance_details = []
+        self.completeness_has_missing = None
+        self.loading = False
+
+        self.update_display()
 
     def update_display(self) -> None:
         """Update all display elements."""
-        article_panel = self.query_one("#article-panel", ArticlePanel)
-        article_panel.update_article(self.article)
+        self._article_panel.update_article(self.article)
 
-        fact_panel = self.query_one("#fact-panel", FactPanel)
-        question_label = self.query_one("#question-label", Label)
-        notes_input = self.query_one("#notes-input", Input)
-        missing_area = self.query_one("#missing-facts-area", TextArea)
-        yes_btn = self.query_one("#yes-btn", Button)
-        no_btn = self.query_one("#no-btn", Button)
-        skip_btn = self.query_one("#skip-btn", Button)
+        fact_panel = self._fact_panel
+        question_label = self._question_label
+        notes_input = self._notes_input
+        missing_area = self._missing_area
+        yes_btn = self._yes_btn
+        no_btn = self._no_btn
+        skip_btn = self._skip_btn
 
         # Reset visibility
         notes_input.add_class("hidden")
@@ -651,8 +808,8 @@ class EvaluationApp(App):
 
     def update_progress(self) -> None:
         """Update progress indicators."""
-        progress = self.query_one("#progress-label", Label)
-        status = self.query_one("#status-bar", Static)
+        progress = self._progress_label
+        status = self._status_bar
 
         current_mode = self.modes[self.current_mode_index]
         article_num = self.current_pair_index + 1
@@ -677,60 +834,49 @@ class EvaluationApp(App):
 
     def action_scroll_up(self) -> None:
         """Scroll article panel up."""
-        panel = self.query_one("#article-panel", ArticlePanel)
-        panel.scroll_up(animate=False)
+        self._article_panel.scroll_up(animate=False)
 
     def action_scroll_down(self) -> None:
         """Scroll article panel down."""
-        panel = self.query_one("#article-panel", ArticlePanel)
-        panel.scroll_down(animate=False)
+        self._article_panel.scroll_down(animate=False)
 
     def action_page_up(self) -> None:
         """Page up in article panel."""
-        panel = self.query_one("#article-panel", ArticlePanel)
-        panel.scroll_page_up(animate=False)
+        self._article_panel.scroll_page_up(animate=False)
 
     def action_page_down(self) -> None:
         """Page down in article panel."""
-        panel = self.query_one("#article-panel", ArticlePanel)
-        panel.scroll_page_down(animate=False)
+        self._article_panel.scroll_page_down(animate=False)
 
     def action_open_search(self) -> None:
         """Open the search bar."""
-        search_container = self.query_one("#search-container")
-        search_input = self.query_one("#search-input", Input)
-        search_container.remove_class("hidden")
-        search_input.focus()
+        self._search_container.remove_class("hidden")
+        self._search_input.focus()
 
     def action_close_search(self) -> None:
         """Close the search bar and clear search."""
-        search_container = self.query_one("#search-container")
-        search_status = self.query_one("#search-status", Label)
-        search_input = self.query_one("#search-input", Input)
-        article_panel = self.query_one("#article-panel", ArticlePanel)
-
-        search_container.add_class("hidden")
-        search_status.add_class("hidden")
-        search_input.value = ""
-        article_panel.clear_search()
+        self._search_container.add_class("hidden")
+        self._search_status.add_class("hidden")
+        self._search_input.value = ""
+        self._article_panel.clear_search()
 
     def action_next_match(self) -> None:
         """Go to next search match."""
-        panel = self.query_one("#article-panel", ArticlePanel)
+        panel = self._article_panel
         if panel.match_positions:
             idx = panel.next_match()
             self._update_search_status(idx, len(panel.match_positions))
 
     def action_prev_match(self) -> None:
         """Go to previous search match."""
-        panel = self.query_one("#article-panel", ArticlePanel)
+        panel = self._article_panel
         if panel.match_positions:
             idx = panel.prev_match()
             self._update_search_status(idx, len(panel.match_positions))
 
     def _update_search_status(self, current: int, total: int) -> None:
         """Update the search status label."""
-        search_status = self.query_one("#search-status", Label)
+        search_status = self._search_status
         if total > 0:
             search_status.update(
                 f"🔍 Match {current + 1} of {total} (f=next, F=prev, Esc=close)"
@@ -744,7 +890,7 @@ class EvaluationApp(App):
     def on_search_submitted(self, event: Input.Submitted) -> None:
         """Handle search input submission."""
         search_term = event.value.strip()
-        panel = self.query_one("#article-panel", ArticlePanel)
+        panel = self._article_panel
 
         if search_term:
             count = panel.search(search_term)
@@ -753,8 +899,7 @@ class EvaluationApp(App):
             panel.focus()
         else:
             panel.clear_search()
-            search_status = self.query_one("#search-status", Label)
-            search_status.add_class("hidden")
+            self._search_status.add_class("hidden")
 
     def action_answer_yes(self) -> None:
         """Handle yes answer."""
@@ -780,10 +925,15 @@ class EvaluationApp(App):
     @on(Button.Pressed, "#skip-btn")
     def on_skip_pressed(self) -> None:
         """Handle moving to next article in completeness mode."""
+        if self.loading:
+            return
         self.finish_completeness_mode()
 
     def handle_answer(self, answer: bool) -> None:
         """Process the user's answer."""
+        if self.loading:
+            return
+
         current_mode = self.modes[self.current_mode_index]
 
         if current_mode == "accuracy":
@@ -825,12 +975,13 @@ class EvaluationApp(App):
 
         self.score_data["accuracy_score"] = round(accuracy_score, 4)
         self.score_data["accuracy_details"] = self.accuracy_details
+        self._score_dirty = True
 
         self.advance_mode()
 
     def finish_completeness_mode(self) -> None:
         """Finish completeness mode."""
-        missing_area = self.query_one("#missing-facts-area", TextArea)
+        missing_area = self._missing_area
         missing_text = missing_area.text.strip()
         missing_facts = (
             [f.strip() for f in missing_text.split("\n") if f.strip()]
@@ -842,6 +993,7 @@ class EvaluationApp(App):
 
         self.score_data["completeness_score"] = completeness_score
         self.score_data["missing_facts"] = missing_facts
+        self._score_dirty = True
 
         # Reset for next article
         missing_area.clear()
@@ -859,6 +1011,7 @@ class EvaluationApp(App):
 
         self.score_data["relevance_score"] = round(relevance_score, 4)
         self.score_data["relevance_details"] = self.relevance_details
+        self._score_dirty = True
 
         self.advance_mode()
 
@@ -869,7 +1022,7 @@ class EvaluationApp(App):
 
         if self.current_mode_index >= len(self.modes):
             # Done with all modes for this article
-            save_score_file(self.score_path, self.score_data)
+            self._save_score_data()
             self.evaluated_count += 1
 
             self.current_pair_index += 1
@@ -883,8 +1036,13 @@ class EvaluationApp(App):
 
     def save_current_progress(self) -> None:
         """Save current progress before quitting."""
-        if self.score_path:
+        self._save_score_data()
+
+    def _save_score_data(self) -> None:
+        """Write score_data to disk if it changed since the last write."""
+        if self.score_path and self._score_dirty:
             save_score_file(self.score_path, self.score_data)
+            self._score_dirty = False
 
     def show_completion(self) -> None:
         """Show completion message and exit."""
@@ -16,15 +16,41 @@ Usage:
 """
 
 import argparse
-import json
+import asyncio
+import hashlib
+import math
+import os
+import re
 import sys
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
+from typing import Callable, Iterator
 
+import httpx
+import orjson
 from dotenv import load_dotenv
-from langchain_openai import ChatOpenAI
+from langchain_core.runnables import Runnable, RunnableLambda
+from langchain_openai import ChatOpenAI, OpenAIEmbeddings
+from openai import (
+    APIConnectionError,
+    APITimeoutError,
+    InternalServerError,
+    RateLimitError,
+)
 from pydantic import BaseModel, Field
+from tenacity import (
+    retry,
+    retry_if_exception_type,
+    stop_after_attempt,
+    wait_random_exponential,
+)
+from tqdm import tqdm
 
+from nfl_agent.src.utils.llm_cache import LLMCache
+from nfl_agent.src.utils.semantic_cache import SemanticCache
 from nfl_agent.src.utils.settings import LLMSettings, get_setting, get_chat_model
 
 load_dotenv()
@@ -41,6 +67,17 @@ class LLMJudgeSettings(LLMSettings):
     llm_model_name: str = "gpt-4o"
     temperature: float = 0.0  # Low temperature for consistent judging
 
+    # Per-mode judge models - per-fact yes/no checks do fine on a smaller model
+    accuracy_model: str = "gpt-4o-mini"
+    completeness_model: str = "gpt-4o"
+    relevance_model: str = "gpt-4o-mini"
+
+    def for_mode(self, mode: str) -> "LLMJudgeSettings":
+        """Return a copy whose llm_model_name is the model for the given mode."""
+        return self.model_copy(
+            update={"llm_model_name": getattr(self, f"{mode}_model")}
+        )
+
 
 # =============================================================================
 # Pydantic Response Models
@@ -55,6 +92,20 @@ class AccuracyJudgment(BaseModel):
     )
 
 
+class AccuracyItem(AccuracyJudgment):
+    """Accuracy judgment for one numbered fact within a batch."""
+
+    id: int = Field(description="The number of the fact being judged")
+
+
+class BatchAccuracyJudgment(BaseModel):
+    """Response model for accuracy evaluation of a numbered batch of facts."""
+
+    results: list[AccuracyItem] = Field(
+        description="One judgment per numbered fact, in the order given"
+    )
+
+
 class CompletenessJudgment(BaseModel):
     """Response model for completeness evaluation."""
 
@@ -79,15 +130,30 @@ class RelevanceJudgment(BaseModel):
     )
 
 
+class RelevanceItem(RelevanceJudgment):
+    """Relevance judgment for one numbered fact within a batch."""
+
+    id: int = Field(description="The number of the fact being judged")
+
+
+class BatchRelevanceJudgment(BaseModel):
+    """Response model for relevance evaluation of a numbered batch of facts."""
+
+    results: list[RelevanceItem] = Field(
+        description="One judgment per numbered fact, in the order given"
+    )
+
+
 # =============================================================================
 # Judge Prompts
 # =============================================================================
 
 
-ACCURACY_SYSTEM_PROMPT = """You are an expert fact-checker evaluating the accuracy of AI-extracted facts from NFL articles.
+_ACCURACY_ROLE = """You are an expert fact-checker evaluating the accuracy of AI-extracted facts from NFL articles.
+"""
 
-Your task: Given a full article text and a single alleged fact sourced from that text, determine if the fact is CORRECT. Do not provide reasoning for your judgment.
-Guidelines:
+
+_ACCURACY_GUIDELINES = """Guidelines:
 - Mark YES (correct=true) ONLY if the fact can be directly verified from the article text
 - Mark NO (correct=false) if the fact cannot be assumed from the article, even if it seems plausible
 - Focus ONLY on factual correctness - do not evaluate clinical significance or relevance
@@ -97,16 +163,62 @@ Guidelines:
 """
 
 
-ACCURACY_USER_PROMPT = """## Source Article:
-{article_content}
+# Per-fact wording, used when a batch response has to be retried fact by fact
+ACCURACY_SYSTEM_PROMPT = (
+    _ACCURACY_ROLE
+    + """
+Your task: Given a full article text and a single alleged fact sourced from that text, determine if the fact is CORRECT. Do not provide reasoning for your judgment.
+"""
+    + _ACCURACY_GUIDELINES
+)
 
-## Fact to Verify:
+
+ACCURACY_BATCH_SYSTEM_PROMPT = (
+    _ACCURACY_ROLE
+    + """
+Your task: Given a full article text and a numbered list of alleged facts sourced from that text, determine for each fact independently whether it is CORRECT. Do not provide reasoning for your judgment.
+"""
+    + _ACCURACY_GUIDELINES
+)
+
+
+def _passages_system_prefix(system_prompt: str) -> str:
+    """System prefix for --passages-k, which sends only retrieved excerpts."""
+    return (
+        system_prompt.replace(
+            "Given a full article text", "Given excerpts retrieved from an article"
+        )
+        + "- Only the excerpts most related to the facts are shown; judge against them\n"
+        + "\n\n## Source Article Excerpts:\n"
+    )
+
+
+# The article context is appended to this prefix so calls sharing the same
+# article context get a byte-identical system prompt, letting OpenAI's automatic
+# prompt caching kick in
+ACCURACY_SYSTEM_PREFIX = ACCURACY_SYSTEM_PROMPT + "\n\n## Source Article:\n"
+ACCURACY_BATCH_SYSTEM_PREFIX = ACCURACY_BATCH_SYSTEM_PROMPT + "\n\n## Source Article:\n"
+
+# Used instead when --passages-k sends only retrieved excerpts of the article
+ACCURACY_PASSAGES_SYSTEM_PREFIX = _passages_system_prefix(ACCURACY_SYSTEM_PROMPT)
+ACCURACY_BATCH_PASSAGES_SYSTEM_PREFIX = _passages_system_prefix(
+    ACCURACY_BATCH_SYSTEM_PROMPT
+)
+
+
+ACCURACY_USER_PROMPT = """## Fact to Verify:
 Category: {category}
 Fact: {fact}
 
 Is this fact accurately extracted from the source article?"""
 
 
+ACCURACY_BATCH_USER_PROMPT = """## Facts to Verify:
+{facts_list}
+
+Judge each numbered fact independently. For every fact, return its id and whether it is accurately extracted from the source article."""
+
+
 COMPLETENESS_SYSTEM_PROMPT = """You are an expert evaluator assessing the completeness of AI-extracted facts from NFL articles.
 
 Your task: Given a full article text and the complete list of facts extracted by an AI, determine if any facts relevant to the specified team were MISSED.
@@ -134,16 +246,40 @@ COMPLETENESS_USER_PROMPT = """## Team Being Evaluated:
 Are there any facts relevant to the {team_name} from the article that were MISSED by the extraction?"""
 
 
-RELEVANCE_SYSTEM_PROMPT = """You are an expert NFL analyst evaluating whether extracted facts are relevant for predicting game outcomes for a specific team.
+_RELEVANCE_ROLE = """You are an expert NFL analyst evaluating whether extracted facts are relevant for predicting game outcomes for a specific team.
+"""
 
-Your task: Given a single fact and the team being evaluated, determine if the fact is RELEVANT for predicting game outcomes for that team.
 
-Guidelines:
+_RELEVANCE_GUIDELINES = """Guidelines:
 - Consider whether this fact would influence betting lines, fantasy decisions, or game outcome predictions for the specified team
 - Relevant facts include: injuries to key players, player performance trends, coaching insights, matchup advantages/disadvantages, and any information affecting team strength
 - Less relevant facts include: historical trivia, off-field news unrelated to performance, general commentary, or facts about other teams that don't directly impact the specified team
+"""
+
+
+# Per-fact wording, used when a batch response has to be retried fact by fact
+RELEVANCE_SYSTEM_PROMPT = (
+    _RELEVANCE_ROLE
+    + """
+Your task: Given a single fact and the team being evaluated, determine if the fact is RELEVANT for predicting game outcomes for that team.
 
+"""
+    + _RELEVANCE_GUIDELINES
+    + """
 Only provide notes if the fact is NOT relevant (relevant=false), explaining why. If relevant, leave notes empty."""
+)
+
+
+RELEVANCE_BATCH_SYSTEM_PROMPT = (
+    _RELEVANCE_ROLE
+    + """
+Your task: Given a numbered list of facts and the team being evaluated, determine for each fact independently if it is RELEVANT for predicting game outcomes for that team.
+
+"""
+    + _RELEVANCE_GUIDELINES
+    + """
+Only provide notes for facts that are NOT relevant (relevant=false), explaining why. For relevant facts, leave notes empty."""
+)
 
 
 RELEVANCE_USER_PROMPT = """## Team Being Evaluated:
@@ -156,6 +292,15 @@ Fact: {fact}
 Is this fact relevant for predicting game outcomes for the {team_name}?"""
 
 
+RELEVANCE_BATCH_USER_PROMPT = """## Team Being Evaluated:
+{team_name}
+
+## Facts to Evaluate:
+{facts_list}
+
+Judge each numbered fact independently. For every fact, return its id and whether it is relevant for predicting game outcomes for the {team_name}."""
+
+
 # =============================================================================
 # Default Paths
 # =============================================================================
@@ -173,6 +318,49 @@ DEFAULT_OUTPUT_DIR = (
     / "summary_eval_llm_judge"
 )
 
+# Maximum number of concurrent judge requests per article
+DEFAULT_PARALLELISM = 8
+
+# Number of facts judged per LLM call in accuracy/relevance modes
+DEFAULT_BATCH_SIZE = 10
+
+# Embedding model and cosine similarity cutoff for the semantic verdict cache
+SEMANTIC_CACHE_EMBEDDING_MODEL = "text-embedding-3-small"
+DEFAULT_SEMANTIC_CACHE_THRESHOLD = 0.95
+
+# Transient OpenAI errors worth retrying
+RETRYABLE_ERRORS = (
+    RateLimitError,
+    APITimeoutError,
+    APIConnectionError,
+    InternalServerError,
+)
+
+# Attempts per judge call; the OpenAI client's own retries are disabled so
+# this is the only retry layer
+MAX_ATTEMPTS = 6
+
+# All evaluation modes, in the order they run
+ALL_MODES = ["accuracy", "completeness", "relevance"]
+
+# Modes that read the article's fetched_content
+CONTENT_MODES = {"accuracy", "completeness"}
+
+# Article passages retrieved per fact for accuracy judging (0 sends the full article)
+DEFAULT_PASSAGES_K = 0
+
+# Approximate size in characters of each retrievable article passage
+PASSAGE_WINDOW = 400
+
+ARTICLE_FILENAME_RE = re.compile(r"article_(\d+)\.json")
+TEAM_INFO_FILENAME_RE = re.compile(r"article_(\d+)_team_info\.json")
+
+SENTENCE_SPLIT_RE = re.compile(r"(?<=[.!?])\s+")
+TOKEN_RE = re.compile(r"[a-z0-9']+")
+
+# Number of articles evaluated concurrently
+DEFAULT_WORKERS = 8
+
 
 # =============================================================================
 # Helper Functions
@@ -198,40 +386,55 @@ def extract_all_facts(team_info: dict) -> list[dict]:
     return facts
 
 
-def find_article_pairs(
+def iter_article_pairs(
     articles_dir: Path, team_info_dir: Path
-) -> list[tuple[int, Path, Path]]:
-    """Find matching article and team_info file pairs."""
-    pairs = []
+) -> Iterator[tuple[int, Path, Path]]:
+    """Yield matching article and team_info file pairs, ordered by article id."""
+    article_ids = set()
+    with os.scandir(articles_dir) as entries:
+        for entry in entries:
+            match = ARTICLE_FILENAME_RE.fullmatch(entry.name)
+            if match:
+                article_ids.add(int(match.group(1)))
+
+    team_info_paths = {}
+    with os.scandir(team_info_dir) as entries:
+        for entry in entries:
+            match = TEAM_INFO_FILENAME_RE.fullmatch(entry.name)
+            if match and (article_id := int(match.group(1))) in article_ids:
+                team_info_paths[article_id] = Path(entry.path)
+
+    for article_id in sorted(team_info_paths):
+        yield (
+            article_id,
+            articles_dir / f"article_{article_id}.json",
+            team_info_paths[article_id],
+        )
+
 
-    for team_info_file in sorted(team_info_dir.glob("article_*_team_info.json")):
-        filename = team_info_file.stem
-        parts = filename.split("_")
-        if len(parts) >= 2:
-            try:
-                article_id = int(parts[1])
-                article_file = articles_dir / f"article_{article_id}.json"
-                if article_file.exists():
-                    pairs.append((article_id, article_file, team_info_file))
-            except ValueError:
-                continue
+def load_article_minimal(article_path: Path, need_content: bool) -> dict:
+    """Load an article, skipping the file entirely when content isn't needed.
 
-    return pairs
+    The judge only reads ``fetched_content`` from articles, so when none of
+    the needed modes use it (e.g. relevance-only runs) the up-to-50KB article
+    JSON is neither read nor parsed.
+    """
+    if not need_content:
+        return {}
+    return orjson.loads(article_path.read_bytes())
 
 
 def load_score_file(score_path: Path) -> dict:
     """Load existing score file or return empty dict."""
     if score_path.exists():
-        with open(score_path) as f:
-            return json.load(f)
+        return orjson.loads(score_path.read_bytes())
     return {}
 
 
 def save_score_file(score_path: Path, data: dict) -> None:
     """Save score data to JSON file."""
     score_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(score_path, "w") as f:
-        json.dump(data, f, indent=2)
+    score_path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
 
 
 def mode_already_complete(score_data: dict, mode: str) -> bool:
@@ -245,10 +448,244 @@ def mode_already_complete(score_data: dict, mode: str) -> bool:
     return False
 
 
-def get_llm_client() -> ChatOpenAI:
-    """Get configured LLM client for judge evaluations."""
-    settings = get_setting(LLMJudgeSettings)
-    return get_chat_model(settings)
+def get_llm_client(
+    settings: LLMJudgeSettings | None = None,
+    http_client: httpx.Client | None = None,
+) -> ChatOpenAI:
+    """Get configured LLM client for judge evaluations.
+
+    Pass a shared http_client so every client and worker thread reuses one
+    connection pool instead of reconnecting. Client retries are off, since
+    invoke_with_retry already retries transient errors.
+    """
+    return get_chat_model(
+        settings or get_setting(LLMJudgeSettings),
+        http_client=http_client,
+        max_retries=0,
+    )
+
+
+@retry(
+    retry=retry_if_exception_type(RETRYABLE_ERRORS),
+    wait=wait_random_exponential(min=1, max=60),
+    stop=stop_after_attempt(MAX_ATTEMPTS),
+    reraise=True,
+    before_sleep=lambda retry_state: tqdm.write(
+        f"    {type(retry_state.outcome.exception()).__name__}, waiting "
+        f"{retry_state.next_action.sleep:.1f}s before retry {retry_state.attempt_number}/{MAX_ATTEMPTS}..."
+    ),
+)
+def invoke_with_retry(chain: Runnable, messages: list[dict]):
+    """Invoke chain, retrying transient OpenAI errors with jittered backoff."""
+    return chain.invoke(messages)
+
+
+def structured_chain(
+    llm: ChatOpenAI, model_cls: type[BaseModel], cache: LLMCache | None = None
+) -> Runnable:
+    """Build a retrying structured output chain, routed through the disk cache if given."""
+    structured = llm.with_structured_output(model_cls)
+    chain = RunnableLambda(lambda messages: invoke_with_retry(structured, messages))
+    return cache.wrap(chain, model_cls, llm.model_name) if cache else chain
+
+
+@dataclass(frozen=True)
+class JudgeChains:
+    """Structured output chains for every judge call, built once per run."""
+
+    accuracy: Runnable
+    batch_accuracy: Runnable
+    completeness: Runnable
+    relevance: Runnable
+    batch_relevance: Runnable
+
+
+def build_judge_chains(
+    llms: dict[str, ChatOpenAI], cache: LLMCache | None = None
+) -> JudgeChains:
+    """Build all judge chains up front so schemas are compiled only once.
+
+    Args:
+        llms: LLM client to use for each mode
+        cache: Optional disk cache wrapping every chain
+    """
+    return JudgeChains(
+        accuracy=structured_chain(llms["accuracy"], AccuracyJudgment, cache),
+        batch_accuracy=structured_chain(llms["accuracy"], BatchAccuracyJudgment, cache),
+        completeness=structured_chain(
+            llms["completeness"], CompletenessJudgment, cache
+        ),
+        relevance=structured_chain(llms["relevance"], RelevanceJudgment, cache),
+        batch_relevance=structured_chain(
+            llms["relevance"], BatchRelevanceJudgment, cache
+        ),
+    )
+
+
+def _split_passages(article_content: str, window: int) -> list[str]:
+    """Split article text into sentence-aligned passages of about window chars."""
+    passages = []
+    current = ""
+    for sentence in SENTENCE_SPLIT_RE.split(article_content.strip()):
+        if current and len(current) + len(sentence) + 1 > window:
+            passages.append(current)
+            current = sentence
+        else:
+            current = f"{current} {sentence}" if current else sentence
+    if current:
+        passages.append(current)
+    return passages
+
+
+def select_relevant_passages(
+    article_content: str,
+    fact: str | list[str],
+    k: int = DEFAULT_PASSAGES_K,
+    window: int = PASSAGE_WINDOW,
+) -> str:
+    """Select the article passages most similar to a fact using TF-IDF.
+
+    Args:
+        article_content: Full article text
+        fact: Fact text, or several facts whose top passages are combined
+        k: Number of passages to keep per fact
+        window: Approximate passage size in characters
+
+    Returns:
+        Selected passages in article order joined with "...", or the full
+        article if it has no more than k passages
+    """
+    passages = _split_passages(article_content, window)
+    if len(passages) <= k:
+        return article_content
+
+    passage_tokens = [Counter(TOKEN_RE.findall(p.lower())) for p in passages]
+    doc_freq = Counter(token for tokens in passage_tokens for token in tokens)
+    idf = {
+        token: math.log(len(passages) / count) + 1 for token, count in doc_freq.items()
+    }
+    norms = [math.sqrt(sum(tokens.values())) or 1.0 for tokens in passage_tokens]
+
+    selected = set()
+    for query in [fact] if isinstance(fact, str) else fact:
+        query_tokens = set(TOKEN_RE.findall(query.lower()))
+        scores = [
+            sum(tokens[t] * idf[t] for t in query_tokens if t in tokens) / norm
+            for tokens, norm in zip(passage_tokens, norms)
+        ]
+        selected.update(
+            sorted(range(len(passages)), key=scores.__getitem__, reverse=True)[:k]
+        )
+
+    return " ... ".join(passages[i] for i in sorted(selected))
+
+
+def judge_with_semantic_cache(
+    facts: list[dict],
+    cache_keys: list[str],
+    namespace: str,
+    model_cls: type[BaseModel],
+    semantic_cache: SemanticCache | None,
+    judge: Callable[[list[dict]], list],
+) -> list:
+    """Reuse verdicts for near-duplicate facts, judging only the rest.
+
+    Args:
+        facts: Facts to judge
+        cache_keys: Text embedded for each fact's similarity lookup
+        namespace: Cache namespace; verdicts are only shared within it
+        model_cls: Judgment model the cached verdicts are restored as
+        semantic_cache: Cache to consult, or None to judge every fact
+        judge: Callable judging a list of facts, returning one result per fact
+
+    Returns:
+        One judgment per fact, in the same order as facts
+    """
+    if semantic_cache is None or not facts:
+        return judge(facts)
+
+    vectors = semantic_cache.embed(cache_keys)
+    cached = semantic_cache.lookup(namespace, vectors)
+    miss_indices = [i for i, value in enumerate(cached) if value is None]
+
+    results = [model_cls(**value) if value is not None else None for value in cached]
+    if miss_indices:
+        fresh = judge([facts[i] for i in miss_indices])
+        for i, result in zip(miss_indices, fresh):
+            results[i] = result
+        semantic_cache.add(
+            namespace,
+            vectors[miss_indices],
+            [
+                result.model_dump(include=set(model_cls.model_fields))
+                for result in fresh
+            ],
+        )
+
+    return results
+
+
+def content_hash(text: str) -> str:
+    """Short exact hash of text, for scoping semantic cache namespaces."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()[:16]
+
+
+def format_numbered_facts(facts: list[dict]) -> str:
+    """Format facts as a numbered list (starting at 1) for batch prompts."""
+    return "\n".join(
+        f"{i}. [{fact['category']}] {fact['fact']}" for i, fact in enumerate(facts, 1)
+    )
+
+
+def judge_facts(
+    facts: list[dict],
+    batch_chain: Runnable,
+    single_chain: Runnable,
+    build_batch_messages: Callable[[list[dict]], list[dict]],
+    build_single_messages: Callable[[dict], list[dict]],
+    batch_size: int,
+    parallelism: int,
+) -> list:
+    """Judge facts in numbered batches, one LLM call per batch.
+
+    Batch results are mapped back to facts by id. If a batch does not return
+    exactly one result per fact, its facts are re-judged with per-fact calls.
+
+    Returns:
+        One judgment per fact, in the same order as facts
+    """
+    batches = [facts[i : i + batch_size] for i in range(0, len(facts), batch_size)]
+    batch_results = batch_chain.batch(
+        [build_batch_messages(b) for b in batches],
+        config={"max_concurrency": parallelism},
+    )
+
+    judgments: list = []
+    retry_indices: list[int] = []
+    for batch, batch_result in zip(batches, batch_results):
+        by_id = {item.id: item for item in batch_result.results}
+        expected_ids = range(1, len(batch) + 1)
+        if len(batch_result.results) == len(batch) and all(
+            i in by_id for i in expected_ids
+        ):
+            judgments.extend(by_id[i] for i in expected_ids)
+        else:
+            tqdm.write(
+                f"    Batch returned {len(batch_result.results)}/{len(batch)} "
+                "results, falling back to per-fact calls"
+            )
+            retry_indices.extend(range(len(judgments), len(judgments) + len(batch)))
+            judgments.extend([None] * len(batch))
+
+    if retry_indices:
+        retried = single_chain.batch(
+            [build_single_messages(facts[i]) for i in retry_indices],
+            config={"max_concurrency": parallelism},
+        )
+        for i, result in zip(retry_indices, retried):
+            judgments[i] = result
+
+    return judgments
 
 
 # =============================================================================
@@ -261,34 +698,89 @@ def run_accuracy_mode(
     team_info: dict,
     facts: list[dict],
     score_data: dict,
-    llm: ChatOpenAI,
+    chains: JudgeChains,
+    parallelism: int = DEFAULT_PARALLELISM,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    passages_k: int = DEFAULT_PASSAGES_K,
+    semantic_cache: SemanticCache | None = None,
 ) -> dict:
-    """Run accuracy evaluation using LLM judge."""
-    print(f"  Running accuracy evaluation on {len(facts)} facts...")
+    """Run accuracy evaluation using LLM judge.
+
+    With passages_k > 0 each call only sees the article passages retrieved for
+    its facts; with passages_k == 0 every call gets the full article.
+    """
+    tqdm.write(f"  Running accuracy evaluation on {len(facts)} facts...")
 
-    accuracy_details = []
     article_content = article.get("fetched_content", "No content available")
+    # Built once per article, not per call, when every call sees the full article
+    full_system_prompts = (
+        {
+            True: ACCURACY_BATCH_SYSTEM_PREFIX + article_content,
+            False: ACCURACY_SYSTEM_PREFIX + article_content,
+        }
+        if passages_k <= 0
+        else None
+    )
 
-    # Create structured output chain
-    accuracy_chain = llm.with_structured_output(AccuracyJudgment)
+    def build_system_prompt(batch: list[dict], batched: bool) -> str:
+        if full_system_prompts is not None:
+            return full_system_prompts[batched]
+        passages = select_relevant_passages(
+            article_content, [fact["fact"] for fact in batch], k=passages_k
+        )
+        prefix = (
+            ACCURACY_BATCH_PASSAGES_SYSTEM_PREFIX
+            if batched
+            else ACCURACY_PASSAGES_SYSTEM_PREFIX
+        )
+        return prefix + passages
 
-    for i, fact in enumerate(facts):
-        print(f"    Evaluating fact {i + 1}/{len(facts)}...", end=" ", flush=True)
+    def build_batch_messages(batch: list[dict]) -> list[dict]:
+        return [
+            {"role": "system", "content": build_system_prompt(batch, batched=True)},
+            {
+                "role": "user",
+                "content": ACCURACY_BATCH_USER_PROMPT.format(
+                    facts_list=format_numbered_facts(batch),
+                ),
+            },
+        ]
 
-        messages = [
-            {"role": "system", "content": ACCURACY_SYSTEM_PROMPT},
+    def build_single_messages(fact: dict) -> list[dict]:
+        return [
+            {"role": "system", "content": build_system_prompt([fact], batched=False)},
             {
                 "role": "user",
                 "content": ACCURACY_USER_PROMPT.format(
-                    article_content=article_content,
                     category=fact["category"],
                     fact=fact["fact"],
                 ),
             },
         ]
 
-        result: AccuracyJudgment = accuracy_chain.invoke(messages)
+    results: list[AccuracyJudgment] = judge_with_semantic_cache(
+        facts,
+        [fact["fact"] for fact in facts],
+        # Only facts about this exact article text, judged with the same
+        # passages setting, may share verdicts
+        f"accuracy_{content_hash(article_content)}_k{passages_k}",
+        AccuracyJudgment,
+        semantic_cache,
+        lambda to_judge: judge_facts(
+            to_judge,
+            chains.batch_accuracy,
+            chains.accuracy,
+            build_batch_messages,
+            build_single_messages,
+            batch_size,
+            parallelism,
+        ),
+    )
 
+    # Count correct facts while building details to avoid a second pass
+    accuracy_details = []
+    correct_count = 0
+    for fact, result in zip(facts, results):
         accuracy_details.append(
             {
                 "category": fact["category"],
@@ -296,18 +788,19 @@ def run_accuracy_mode(
                 "correct": result.correct,
             }
         )
+        correct_count += result.correct
 
-        status = "✓" if result.correct else "✗"
-        print(status)
+    tqdm.write("    " + "".join("✓" if d["correct"] else "✗" for d in accuracy_details))
 
     # Calculate accuracy score
-    correct_count = sum(1 for d in accuracy_details if d["correct"])
     accuracy_score = correct_count / len(accuracy_details) if accuracy_details else 0.0
 
     score_data["accuracy_score"] = round(accuracy_score, 4)
     score_data["accuracy_details"] = accuracy_details
 
-    print(f"  Accuracy: {correct_count}/{len(accuracy_details)} = {accuracy_score:.1%}")
+    tqdm.write(
+        f"  Accuracy: {correct_count}/{len(accuracy_details)} = {accuracy_score:.1%}"
+    )
 
     return score_data
 
@@ -317,20 +810,23 @@ def run_completeness_mode(
     team_info: dict,
     facts: list[dict],
     score_data: dict,
-    llm: ChatOpenAI,
+    chains: JudgeChains,
+    max_chars: int | None = None,
 ) -> dict:
-    """Run completeness evaluation using LLM judge."""
-    print("  Running completeness evaluation...")
+    """Run completeness evaluation using LLM judge.
+
+    Completeness needs the whole article, so it is only truncated to max_chars.
+    """
+    tqdm.write("  Running completeness evaluation...")
 
     article_content = article.get("fetched_content", "No content available")
+    if max_chars:
+        article_content = article_content[:max_chars]
     team_name = team_info.get("name", "Unknown Team")
 
     # Format facts list for prompt
     facts_formatted = "\n".join(f"- [{f['category']}] {f['fact']}" for f in facts)
 
-    # Create structured output chain
-    completeness_chain = llm.with_structured_output(CompletenessJudgment)
-
     messages = [
         {"role": "system", "content": COMPLETENESS_SYSTEM_PROMPT},
         {
@@ -343,7 +839,7 @@ def run_completeness_mode(
         },
     ]
 
-    result: CompletenessJudgment = completeness_chain.invoke(messages)
+    result: CompletenessJudgment = chains.completeness.invoke(messages)
 
     # Score is 1.0 if complete, 0.0 if missing facts
     completeness_score = 1.0 if result.complete else 0.0
@@ -353,9 +849,9 @@ def run_completeness_mode(
     score_data["completeness_reasoning"] = result.reasoning
 
     if result.complete:
-        print("  Completeness: ✓ All facts extracted")
+        tqdm.write("  Completeness: ✓ All facts extracted")
     else:
-        print(f"  Completeness: ✗ Missing {len(result.missing_facts)} facts")
+        tqdm.write(f"  Completeness: ✗ Missing {len(result.missing_facts)} facts")
 
     return score_data
 
@@ -365,21 +861,23 @@ def run_relevance_mode(
     team_info: dict,
     facts: list[dict],
     score_data: dict,
-    llm: ChatOpenAI,
+    chains: JudgeChains,
+    parallelism: int = DEFAULT_PARALLELISM,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    semantic_cache: SemanticCache | None = None,
 ) -> dict:
     """Run relevance evaluation using LLM judge."""
-    print(f"  Running relevance evaluation on {len(facts)} facts...")
+    tqdm.write(f"  Running relevance evaluation on {len(facts)} facts...")
 
-    relevance_details = []
     team_name = team_info.get("name", "Unknown Team")
 
-    # Create structured output chain
-    relevance_chain = llm.with_structured_output(RelevanceJudgment)
-
+    # Partition up front: relevant_players are assumed relevant and get their
+    # details immediately, the rest are judged and slotted back in by index
+    relevance_details: list[dict | None] = []
+    judged_facts = []
+    judged_indices = []
     for i, fact in enumerate(facts):
-        # Skip relevance judgment for relevant_players - assume they are relevant
         if fact["category"] == "relevant_players":
-            print(f"    Skipping fact {i + 1}/{len(facts)} (relevant_players)... ⊘")
             relevance_details.append(
                 {
                     "category": fact["category"],
@@ -388,11 +886,29 @@ def run_relevance_mode(
                     "notes": "",
                 }
             )
-            continue
-
-        print(f"    Evaluating fact {i + 1}/{len(facts)}...", end=" ", flush=True)
+        else:
+            relevance_details.append(None)
+            judged_facts.append(fact)
+            judged_indices.append(i)
+
+    skipped = len(facts) - len(judged_facts)
+    if skipped:
+        tqdm.write(f"    Skipping {skipped} relevant_players facts... ⊘")
+
+    def build_batch_messages(batch: list[dict]) -> list[dict]:
+        return [
+            {"role": "system", "content": RELEVANCE_BATCH_SYSTEM_PROMPT},
+            {
+                "role": "user",
+                "content": RELEVANCE_BATCH_USER_PROMPT.format(
+                    team_name=team_name,
+                    facts_list=format_numbered_facts(batch),
+                ),
+            },
+        ]
 
-        messages = [
+    def build_single_messages(fact: dict) -> list[dict]:
+        return [
             {"role": "system", "content": RELEVANCE_SYSTEM_PROMPT},
             {
                 "role": "user",
@@ -404,22 +920,37 @@ def run_relevance_mode(
             },
         ]
 
-        result: RelevanceJudgment = relevance_chain.invoke(messages)
-
-        relevance_details.append(
-            {
-                "category": fact["category"],
-                "fact": fact["fact"],
-                "relevant": result.relevant,
-                "notes": result.notes,
-            }
-        )
-
-        status = "✓" if result.relevant else "✗"
-        print(status)
+    results: list[RelevanceJudgment] = judge_with_semantic_cache(
+        judged_facts,
+        [fact["fact"] for fact in judged_facts],
+        f"relevance_{content_hash(team_name)}",
+        RelevanceJudgment,
+        semantic_cache,
+        lambda to_judge: judge_facts(
+            to_judge,
+            chains.batch_relevance,
+            chains.relevance,
+            build_batch_messages,
+            build_single_messages,
+            batch_size,
+            parallelism,
+        ),
+    )
+    # relevant_players count as relevant; judged facts are counted as they land
+    relevant_count = skipped
+    for i, fact, result in zip(judged_indices, judged_facts, results):
+        relevance_details[i] = {
+            "category": fact["category"],
+            "fact": fact["fact"],
+            "relevant": result.relevant,
+            "notes": result.notes,
+        }
+        relevant_count += result.relevant
+
+    if results:
+        tqdm.write("    " + "".join("✓" if r.relevant else "✗" for r in results))
 
     # Calculate relevance score
-    relevant_count = sum(1 for d in relevance_details if d["relevant"])
     relevance_score = (
         relevant_count / len(relevance_details) if relevance_details else 0.0
     )
@@ -427,13 +958,172 @@ def run_relevance_mode(
     score_data["relevance_score"] = round(relevance_score, 4)
     score_data["relevance_details"] = relevance_details
 
-    print(
+    tqdm.write(
         f"  Relevance: {relevant_count}/{len(relevance_details)} = {relevance_score:.1%}"
     )
 
     return score_data
 
 
+def process_article(
+    pair: tuple[int, Path, Path],
+    args: argparse.Namespace,
+    chains: JudgeChains,
+    settings: LLMJudgeSettings,
+    modes_to_run: list[str],
+    semantic_caches: dict[str, SemanticCache] | None = None,
+) -> tuple[int, str]:
+    """Evaluate a single article for the requested modes.
+
+    Returns:
+        Tuple of (article_id, status) where status is "evaluated" or "skipped"
+    """
+    article_id, article_path, team_info_path = pair
+
+    # Load team_info
+    team_info = orjson.loads(team_info_path.read_bytes())
+
+    # Load or create score file
+    score_path = args.output_dir / f"{article_id}_llm_judge_summary_score.json"
+    score_data = load_score_file(score_path)
+    score_data["id"] = article_id
+
+    # Extract facts
+    facts = extract_all_facts(team_info)
+
+    if not facts:
+        return article_id, "skipped: no facts extracted"
+
+    # Check which modes need to run
+    modes_needed = []
+    for mode in modes_to_run:
+        if args.overwrite or not mode_already_complete(score_data, mode):
+            modes_needed.append(mode)
+
+    if not modes_needed:
+        return article_id, "skipped: already evaluated"
+
+    # Load article only as far as the needed modes require
+    article = load_article_minimal(
+        article_path, need_content=bool(CONTENT_MODES.intersection(modes_needed))
+    )
+
+    semantic_caches = semantic_caches or {}
+
+    # Run each needed mode
+    for mode in modes_needed:
+        try:
+            if mode == "accuracy":
+                score_data = run_accuracy_mode(
+                    article,
+                    team_info,
+                    facts,
+                    score_data,
+                    chains,
+                    args.parallelism,
+                    args.batch_size,
+                    args.passages_k,
+                    semantic_caches.get("accuracy"),
+                )
+            elif mode == "completeness":
+                score_data = run_completeness_mode(
+                    article,
+                    team_info,
+                    facts,
+                    score_data,
+                    chains,
+                    args.completeness_max_chars,
+                )
+            elif mode == "relevance":
+                score_data = run_relevance_mode(
+                    article,
+                    team_info,
+                    facts,
+                    score_data,
+                    chains,
+                    args.parallelism,
+                    args.batch_size,
+                    semantic_caches.get("relevance"),
+                )
+
+            # Record which model produced this mode's score, and when
+            score_data.setdefault("models", {})[mode] = getattr(
+                settings, f"{mode}_model"
+            )
+            score_data["evaluated_at"] = datetime.now().isoformat()
+
+            # Save after each mode
+            save_score_file(score_path, score_data)
+
+        except RETRYABLE_ERRORS:
+            # Retries exhausted - completed modes are already saved, so stop
+            # rather than keep hammering an API that is still failing
+            save_score_file(score_path, score_data)
+            raise
+
+        except Exception as e:
+            tqdm.write(f"  Error in {mode} mode for article {article_id}: {e}")
+            continue
+
+    return article_id, f"evaluated, saved to {score_path.name}"
+
+
+async def process_all_articles(
+    pairs: Iterator[tuple[int, Path, Path]],
+    args: argparse.Namespace,
+    chains: JudgeChains,
+    settings: LLMJudgeSettings,
+    modes_to_run: list[str],
+    semantic_caches: dict[str, SemanticCache] | None = None,
+) -> tuple[int, int]:
+    """Stream pairs through a bounded queue to a pool of article workers.
+
+    Only up to ``args.workers * 2`` pairs are queued at a time, and article
+    JSON is loaded inside the workers, so memory stays bounded by the number
+    of workers rather than the corpus size.
+
+    Returns:
+        Tuple of (evaluated_count, skipped_count)
+    """
+    queue: asyncio.Queue = asyncio.Queue(maxsize=args.workers * 2)
+    loop = asyncio.get_running_loop()
+    counts = {"evaluated": 0, "skipped": 0}
+
+    async def produce():
+        for pair in pairs:
+            await queue.put(pair)
+        for _ in range(args.workers):
+            await queue.put(None)
+
+    async def consume(executor: ThreadPoolExecutor, progress: tqdm):
+        while (pair := await queue.get()) is not None:
+            article_id, status = await loop.run_in_executor(
+                executor,
+                process_article,
+                pair,
+                args,
+                chains,
+                settings,
+                modes_to_run,
+                semantic_caches,
+            )
+            counts["skipped" if status.startswith("skipped") else "evaluated"] += 1
+            progress.update()
+            progress.set_postfix(counts)
+            progress.write(f"Article {article_id}: {status}")
+
+    # run_*_mode block on LLM calls, so articles run in worker threads
+    with (
+        ThreadPoolExecutor(max_workers=args.workers) as executor,
+        tqdm(desc="Articles", unit="article") as progress,
+    ):
+        await asyncio.gather(
+            produce(), *(consume(executor, progress) for _ in range(args.workers))
+        )
+
+    return counts["evaluated"], counts["skipped"]
+
+
 # =============================================================================
 # Main
 # =============================================================================
@@ -485,6 +1175,63 @@ Examples:
         default=DEFAULT_OUTPUT_DIR,
         help="Directory for output score files",
     )
+    parser.add_argument(
+        "--parallelism",
+        type=int,
+        default=DEFAULT_PARALLELISM,
+        help=f"Maximum concurrent judge requests per article (default: {DEFAULT_PARALLELISM})",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=DEFAULT_BATCH_SIZE,
+        help=f"Facts judged per LLM call in accuracy/relevance modes (default: {DEFAULT_BATCH_SIZE})",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=DEFAULT_WORKERS,
+        help=f"Number of articles evaluated concurrently (default: {DEFAULT_WORKERS})",
+    )
+    parser.add_argument(
+        "--passages-k",
+        type=int,
+        default=DEFAULT_PASSAGES_K,
+        help="Article passages sent per fact in accuracy mode; 0 sends the full "
+        f"article (default: {DEFAULT_PASSAGES_K})",
+    )
+    parser.add_argument(
+        "--completeness-max-chars",
+        type=int,
+        default=None,
+        help="Truncate article content to this many characters in completeness mode",
+    )
+    for mode in ALL_MODES:
+        parser.add_argument(
+            f"--{mode}-model",
+            type=str,
+            default=None,
+            help=f"Model used for {mode} judging "
+            f"(default: {LLMJudgeSettings.model_fields[f'{mode}_model'].default})",
+        )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always call the LLM instead of reusing cached judge responses",
+    )
+    parser.add_argument(
+        "--semantic-cache",
+        action="store_true",
+        help="Reuse verdicts for near-duplicate facts about the same article "
+        "(adds an embedding call per fact)",
+    )
+    parser.add_argument(
+        "--semantic-cache-threshold",
+        type=float,
+        default=DEFAULT_SEMANTIC_CACHE_THRESHOLD,
+        help="Cosine similarity needed to reuse a cached verdict "
+        f"(default: {DEFAULT_SEMANTIC_CACHE_THRESHOLD})",
+    )
 
     args = parser.parse_args()
 
@@ -497,98 +1244,88 @@ Examples:
         print(f"Error: Team info directory not found: {args.team_info_dir}")
         sys.exit(1)
 
-    # Find article pairs
-    pairs = find_article_pairs(args.articles_dir, args.team_info_dir)
-
-    if not pairs:
-        print("Error: No matching article pairs found")
-        sys.exit(1)
-
     # Determine which modes to run
-    modes_to_run = (
-        ["accuracy", "completeness", "relevance"] if args.mode == "all" else [args.mode]
+    modes_to_run = ALL_MODES if args.mode == "all" else [args.mode]
+
+    settings = get_setting(LLMJudgeSettings).model_copy(
+        update={
+            f"{mode}_model": model
+            for mode in ALL_MODES
+            if (model := getattr(args, f"{mode}_model"))
+        }
     )
 
-    # Get LLM client
-    llm = get_llm_client()
-    settings = get_setting(LLMJudgeSettings)
-
-    print("LLM Judge Evaluation")
-    print("=" * 60)
-    print(f"Model: {settings.llm_model_name}")
-    print(f"Found {len(pairs)} articles with team info")
-    print(f"Modes: {', '.join(modes_to_run)}")
-    print(f"Output: {args.output_dir}")
-    print("=" * 60)
-    print()
-
-    evaluated_count = 0
-    skipped_count = 0
-
-    for i, (article_id, article_path, team_info_path) in enumerate(pairs):
-        print(f"[{i + 1}/{len(pairs)}] Article {article_id}")
-
-        # Load article and team_info
-        with open(article_path) as f:
-            article = json.load(f)
-
-        with open(team_info_path) as f:
-            team_info = json.load(f)
-
-        # Load or create score file
-        score_path = args.output_dir / f"{article_id}_llm_judge_summary_score.json"
-        score_data = load_score_file(score_path)
-        score_data["id"] = article_id
-        score_data["model"] = settings.llm_model_name
-
-        # Extract facts
-        facts = extract_all_facts(team_info)
+    # One client per distinct model, all sharing a connection pool sized for
+    # the up to workers * parallelism judge requests in flight at once
+    max_connections = args.workers * args.parallelism
+    with httpx.Client(
+        limits=httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_connections,
+        )
+    ) as http_client:
+        clients: dict[str, ChatOpenAI] = {}
+        llms = {}
+        for mode in ALL_MODES:
+            mode_settings = settings.for_mode(mode)
+            model = mode_settings.llm_model_name
+            if model not in clients:
+                clients[model] = get_llm_client(mode_settings, http_client)
+            llms[mode] = clients[model]
+
+        cache = (
+            None
+            if args.no_cache
+            else LLMCache(
+                args.output_dir / ".judge_cache",
+                settings.llm_model_name,
+                settings.temperature,
+            )
+        )
 
-        if not facts:
-            print("  Skipping: No facts extracted")
-            skipped_count += 1
-            continue
+        semantic_caches = {}
+        if args.semantic_cache:
+            embeddings = OpenAIEmbeddings(model=SEMANTIC_CACHE_EMBEDDING_MODEL)
+            semantic_caches = {
+                mode: SemanticCache(
+                    args.output_dir / ".semantic_cache",
+                    embeddings,
+                    settings.for_mode(mode).llm_model_name,
+                    threshold=args.semantic_cache_threshold,
+                )
+                for mode in ("accuracy", "relevance")
+            }
 
-        # Check which modes need to run
-        modes_needed = []
+        print("LLM Judge Evaluation")
+        print("=" * 60)
+        print(f"Modes: {', '.join(modes_to_run)}")
         for mode in modes_to_run:
-            if args.overwrite or not mode_already_complete(score_data, mode):
-                modes_needed.append(mode)
+            print(f"  {mode} model: {settings.for_mode(mode).llm_model_name}")
+        print(f"Output: {args.output_dir}")
+        print("=" * 60)
+        print()
 
-        if not modes_needed:
-            print("  Skipping: Already evaluated")
-            skipped_count += 1
-            continue
+        try:
+            evaluated_count, skipped_count = asyncio.run(
+                process_all_articles(
+                    iter_article_pairs(args.articles_dir, args.team_info_dir),
+                    args,
+                    build_judge_chains(llms, cache),
+                    settings,
+                    modes_to_run,
+                    semantic_caches,
+                )
+            )
+        finally:
+            # Keep verdicts gathered so far even if the run is aborted
+            for semantic_cache in semantic_caches.values():
+                semantic_cache.save()
 
-        # Run each needed mode
-        for mode in modes_needed:
-            try:
-                if mode == "accuracy":
-                    score_data = run_accuracy_mode(
-                        article, team_info, facts, score_data, llm
-                    )
-                elif mode == "completeness":
-                    score_data = run_completeness_mode(
-                        article, team_info, facts, score_data, llm
-                    )
-                elif mode == "relevance":
-                    score_data = run_relevance_mode(
-                        article, team_info, facts, score_data, llm
-                    )
-
-                # Add timestamp
-                score_data["evaluated_at"] = datetime.now().isoformat()
-
-                # Save after each mode
-                save_score_file(score_path, score_data)
-
-            except Exception as e:
-                print(f"  Error in {mode} mode: {e}")
-                continue
-
-        evaluated_count += 1
-        print(f"  Saved to {score_path.name}")
-        print()
+    if evaluated_count + skipped_count == 0:
+        print("Error: No matching article pairs found")
+        sys.exit(1)
+
+    print()
 
     # Summary
     print("=" * 60)
@@ -596,6 +1333,14 @@ Examples:
     print(f"  Evaluated: {evaluated_count} articles")
     if skipped_count > 0:
         print(f"  Skipped: {skipped_count} articles")
+    if cache:
+        print(
+            f"  Judge cache: {cache.stats['hits']} hits, {cache.stats['misses']} misses"
+        )
+    if semantic_caches:
+        hits = sum(c.stats["hits"] for c in semantic_caches.values())
+        misses = sum(c.stats["misses"] for c in semantic_caches.values())
+        print(f"  Semantic cache: {hits} hits, {misses} misses")
     print(f"  Results saved to: {args.output_dir}")
 
 
@@ -4,18 +4,88 @@ Script to fetch article contents from team_articles_labelled.json
 and save each article with its content as a separate JSON file.
 """
 
-import json
+import argparse
+import asyncio
 import sys
 from pathlib import Path
 
-from nfl_agent.src.tools.article_fetcher.utils import fetch_article_content
+import httpx
+import orjson
+
+from nfl_agent.src.tools.article_fetcher.utils import afetch_article_content
 
 # Add the project root to the path
 project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
 
+# Default number of articles fetched concurrently
+DEFAULT_CONCURRENCY = 8
+
+
+async def process_article(
+    client: httpx.AsyncClient,
+    semaphore: asyncio.Semaphore,
+    article: dict,
+    output_dir: Path,
+) -> str:
+    """Fetch and save a single article's content, returning a status message."""
+    article_id = article.get("id")
+    headline = article.get("headline", "Unknown")
+
+    # Get the web URL
+    web_url = article.get("links", {}).get("web", {}).get("href", "")
+
+    if not web_url:
+        return f"Skipping article {article_id}: No web URL found"
+
+    # Fetch the article content; on failure write nothing, so a transient error
+    # never replaces a previously fetched file
+    async with semaphore:
+        try:
+            content = await afetch_article_content(
+                client, web_url, max_length=50000
+            )  # Higher limit for storage
+        except Exception as e:
+            return f"Article {article_id} ({headline[:50]}): Error fetching content: {str(e)[:100]}"
+
+    # Create output object with article info and content
+    output_data = {**article, "fetched_content": content, "fetched_url": web_url}
+
+    # Save to individual file
+    output_file = output_dir / f"article_{article_id}.json"
+    output_file.write_bytes(
+        orjson.dumps(output_data, default=str, option=orjson.OPT_INDENT_2)
+    )
+
+    return f"Article {article_id} ({headline[:50]}): Saved to {output_file.name} ({len(content)} chars)"
+
+
+async def fetch_all(articles: list[dict], output_dir: Path, concurrency: int) -> None:
+    """Fetch all articles concurrently, bounded by concurrency."""
+    semaphore = asyncio.Semaphore(concurrency)
+    async with httpx.AsyncClient(
+        timeout=30.0, limits=httpx.Limits(max_connections=concurrency)
+    ) as client:
+        tasks = [
+            asyncio.create_task(process_article(client, semaphore, article, output_dir))
+            for article in articles
+        ]
+        for i, task in enumerate(asyncio.as_completed(tasks), 1):
+            print(f"[{i}/{len(articles)}] {await task}")
+
 
 def main():
+    parser = argparse.ArgumentParser(
+        description="Fetch article contents for labelled team articles"
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=DEFAULT_CONCURRENCY,
+        help=f"Maximum concurrent article fetches (default: {DEFAULT_CONCURRENCY})",
+    )
+    args = parser.parse_args()
+
     # Define paths
     test_data_dir = Path(__file__).parent.parent / "tests" / "test_data"
     input_file = test_data_dir / "team_articles_labelled.json"
@@ -26,46 +96,11 @@ def main():
 
     # Load articles
     print(f"Loading articles from {input_file}")
-    with open(input_file, "r") as f:
-        articles = json.load(f)
+    articles = orjson.loads(input_file.read_bytes())
 
     print(f"Found {len(articles)} articles")
 
-    # Process each article
-    for i, article in enumerate(articles):
-        article_id = article.get("id")
-        headline = article.get("headline", "Unknown")
-
-        # Get the web URL
-        web_url = article.get("links", {}).get("web", {}).get("href", "")
-
-        if not web_url:
-            print(
-                f"[{i + 1}/{len(articles)}] Skipping article {article_id}: No web URL found"
-            )
-            continue
-
-        print(
-            f"[{i + 1}/{len(articles)}] Fetching content for article {article_id}: {headline[:50]}..."
-        )
-
-        # Fetch the article content
-        content = fetch_article_content(
-            web_url, max_length=50000
-        )  # Higher limit for storage
-
-        # Create output object with article info and content
-        output_data = {**article, "fetched_content": content, "fetched_url": web_url}
-
-        # Save to individual file
-        output_file = output_dir / f"article_{article_id}.json"
-        with open(output_file, "w") as f:
-            json.dump(output_data, f, indent=2, default=str)
-
-        if content.startswith("Error"):
-            print(f"  -> Error fetching content: {content[:100]}")
-        else:
-            print(f"  -> Saved to {output_file.name} ({len(content)} chars)")
+    asyncio.run(fetch_all(articles, output_dir, args.concurrency))
 
     print(f"\nDone! Articles saved to {output_dir}")
 
@@ -1,16 +1,20 @@
 """Fetch pre-match spread data for NFL games from ESPN odds API."""
 
-import json
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
+import orjson
 from dotenv import load_dotenv
 
 from nfl_agent.src.utils.espn_client import ESPNClient
 
 load_dotenv()
 
+# Maximum number of concurrent odds requests (a week has at most 16 games)
+MAX_ODDS_WORKERS = 16
+
 
 def fetch_spreads_for_week(
     week: int,
@@ -41,11 +45,19 @@ def fetch_spreads_for_week(
         "games": [],
     }
 
-    for game in games:
-        print(f"  Fetching odds for {game.away_team_name} @ {game.home_team_name}...")
-
-        odds = client.get_game_odds(event_id=game.event_id, provider_id=provider_id)
+    # Odds requests are independent, so fetch them concurrently; map keeps order
+    print(f"Fetching odds for {len(games)} games...")
+    with ThreadPoolExecutor(max_workers=MAX_ODDS_WORKERS) as executor:
+        all_odds = list(
+            executor.map(
+                lambda game: client.get_game_odds(
+                    event_id=game.event_id, provider_id=provider_id
+                ),
+                games,
+            )
+        )
 
+    for game, odds in zip(games, all_odds):
         game_data = {
             "event_id": game.event_id,
             "home_team": game.home_team_name,
@@ -90,13 +102,31 @@ def fetch_spreads_for_week(
     if output_dir:
         output_dir.mkdir(parents=True, exist_ok=True)
         output_path = output_dir / f"week_{week}.json"
-        with open(output_path, "w") as f:
-            json.dump(spread_data, f, indent=2)
+        output_path.write_bytes(orjson.dumps(spread_data, option=orjson.OPT_INDENT_2))
         print(f"\nSaved spread data to {output_path}")
 
     return spread_data
 
 
+SUMMARY_COLUMNS = (
+    "home_team_abbr",
+    "home_team",
+    "away_team_abbr",
+    "away_team",
+    "home_spread",
+    "details",
+    "home_moneyline",
+    "away_moneyline",
+    "home_favorite",
+)
+
+
+def spread_columns(spread_data: dict) -> dict[str, list]:
+    """Transpose the per-game records into one list per field."""
+    games = spread_data["games"]
+    return {column: [game.get(column) for game in games] for column in SUMMARY_COLUMNS}
+
+
 def main():
     """Main entry point - fetch spreads for a specific week."""
     import argparse
@@ -149,23 +179,37 @@ def main():
     print(f"  {'MATCHUP':<15} | {'SPREAD':<12} | {'MONEYLINE':<18} | FAV")
     print("-" * 70)
 
-    for game in spread_data["games"]:
-        home = game["home_team_abbr"] or game["home_team"]
-        away = game["away_team_abbr"] or game["away_team"]
-        spread = game.get("home_spread")
-        details = game.get("details", "N/A")
-        home_ml = game.get("home_moneyline")
-        away_ml = game.get("away_moneyline")
+    format_row = "  {away:4} @ {home:4}  | {details:<12} | {ml:<18} | {fav}".format
+    format_no_odds = "  {away:4} @ {home:4}  | No odds available".format
+
+    columns = spread_columns(spread_data)
+    for (
+        home_abbr,
+        home_name,
+        away_abbr,
+        away_name,
+        spread,
+        details,
+        home_ml,
+        away_ml,
+        home_favorite,
+    ) in zip(*columns.values()):
+        home = home_abbr or home_name
+        away = away_abbr or away_name
 
         if spread is not None:
-            fav = home if game.get("home_favorite") else away
+            fav = home if home_favorite else away
             # Format moneyline with + for underdogs
             home_ml_str = f"{home_ml:+d}" if home_ml is not None else "N/A"
             away_ml_str = f"{away_ml:+d}" if away_ml is not None else "N/A"
             ml_str = f"{away}:{away_ml_str} {home}:{home_ml_str}"
-            print(f"  {away:4} @ {home:4}  | {details:<12} | {ml_str:<18} | {fav}")
+            print(
+                format_row(
+                    away=away, home=home, details=details or "N/A", ml=ml_str, fav=fav
+                )
+            )
         else:
-            print(f"  {away:4} @ {home:4}  | No odds available")
+            print(format_no_odds(away=away, home=home))
 
     print("=" * 70)
 
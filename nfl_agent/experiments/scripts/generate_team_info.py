@@ -5,26 +5,45 @@ Processes all JSON files in test_data/article_contents and generates
 TeamInfo summaries using the article summarizer model.
 """
 
+import argparse
+import hashlib
 import json
 from pathlib import Path
 from dotenv import load_dotenv
+import orjson
 
-from langchain_openai import ChatOpenAI
-from langchain.messages import SystemMessage, HumanMessage
+from langchain_core.runnables import Runnable
 
 from nfl_agent.src.models.espn_search import TeamInfo
-from nfl_agent.src.utils.settings import get_setting, LLMSettings, get_chat_model
-from nfl_agent.prompts.article_summarizer.v2 import (
-    SYSTEM_PROMPT as ARTICLE_SUMMARIZER_SYSTEM_PROMPT,
-    USER_PROMPT as ARTICLE_SUMMARIZER_USER_PROMPT,
+from nfl_agent.src.tools.article_fetcher.utils import (
+    clean_article_text,
+    build_summarizer_messages,
+    get_llm_cache,
 )
+from nfl_agent.src.utils.settings import get_setting, LLMSettings, get_chat_model
 
 
 TEAM_NAME = "Philadelphia Eagles"
 
+MAX_CONCURRENCY = 8
+
+# Upper bound on article characters sent to the summarizer
+MAX_CONTENT_CHARS = 12000
+
+# Records the input hash each output was generated from
+MANIFEST_FILENAME = "processed.json"
+
+
+def output_path_for(article_path: Path, output_dir: Path) -> Path:
+    return output_dir / (article_path.stem + "_team_info.json")
+
 
-def process_article(article_path: Path, model: ChatOpenAI) -> TeamInfo | None:
-    """Process a single article and return TeamInfo."""
+def file_digest(path: Path) -> str:
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def build_messages(article_path: Path) -> list[dict] | None:
+    """Build the summarizer messages for an article, or None if it has no content."""
     with open(article_path, "r") as f:
         article_data = json.load(f)
 
@@ -33,23 +52,33 @@ def process_article(article_path: Path, model: ChatOpenAI) -> TeamInfo | None:
         print(f"  No fetched_content found in {article_path.name}, skipping...")
         return None
 
-    team_name = TEAM_NAME
-
-    result: TeamInfo = model.invoke(
-        [
-            SystemMessage(content=ARTICLE_SUMMARIZER_SYSTEM_PROMPT),
-            HumanMessage(
-                content=ARTICLE_SUMMARIZER_USER_PROMPT.format(
-                    team_name=team_name, article_content=article_content
-                )
-            ),
-        ]
-    )
+    # Content fetched before cleaning was added may still carry boilerplate
+    article_content = clean_article_text(article_content)[:MAX_CONTENT_CHARS]
+    return build_summarizer_messages(TEAM_NAME, article_content)
 
-    return result
+
+def process_articles(
+    messages_list: list[list[dict]], model: Runnable
+) -> list[TeamInfo | Exception]:
+    """Summarize articles concurrently, returning a TeamInfo or error per article."""
+    return model.batch(
+        messages_list,
+        config={"max_concurrency": MAX_CONCURRENCY},
+        return_exceptions=True,
+    )
 
 
 def main():
+    parser = argparse.ArgumentParser(
+        description="Generate TeamInfo summaries from article content files"
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Regenerate outputs even if their input is unchanged",
+    )
+    args = parser.parse_args()
+
     # Load environment variables
     load_dotenv("/Users/madison.ebersole/Repos/sandbox/nfl-agent/.env")
 
@@ -68,31 +97,76 @@ def main():
     article_summarization_model = article_summarization_model.with_structured_output(
         TeamInfo
     )
+    # Shares its cache with the agent's summarizer, so unchanged articles are free
+    summary_cache = get_llm_cache(article_summarization_settings)
+    article_summarization_model = summary_cache.wrap(
+        article_summarization_model, TeamInfo
+    )
 
-    # Process all JSON files
-    article_files = sorted(article_contents_dir.glob("*.json"))
-    print(f"Found {len(article_files)} article files to process")
-
-    for i, article_path in enumerate(article_files, 1):
-        print(f"Processing {i}/{len(article_files)}: {article_path.name}")
+    # Process all JSON files, skipping ones already summarized from the same content
+    manifest_path = output_dir / MANIFEST_FILENAME
+    manifest = (
+        orjson.loads(manifest_path.read_bytes()) if manifest_path.exists() else {}
+    )
+    digests = {}
+    article_files = []
+    for article_path in sorted(article_contents_dir.glob("*.json")):
+        digests[article_path.name] = file_digest(article_path)
+        if (
+            args.force
+            or manifest.get(article_path.name) != digests[article_path.name]
+            or not output_path_for(article_path, output_dir).exists()
+        ):
+            article_files.append(article_path)
+
+    skipped = len(digests) - len(article_files)
+    print(
+        f"Found {len(digests)} article files, {len(article_files)} to process "
+        f"({skipped} unchanged)"
+    )
 
+    # Skip articles without content before sending anything to the model
+    to_process = []
+    messages_list = []
+    for article_path in article_files:
         try:
-            result = process_article(article_path, article_summarization_model)
+            messages = build_messages(article_path)
+        except Exception as e:
+            print(f"  Error reading {article_path.name}: {e}")
+            continue
+        if messages is not None:
+            to_process.append(article_path)
+            messages_list.append(messages)
+
+    print(
+        f"Summarizing {len(to_process)} articles "
+        f"({MAX_CONCURRENCY} requests at a time)..."
+    )
+    results = process_articles(messages_list, article_summarization_model)
 
-            if result:
-                # Save output with same filename pattern
-                output_filename = article_path.stem + "_team_info.json"
-                output_path = output_dir / output_filename
+    for i, (article_path, result) in enumerate(zip(to_process, results), 1):
+        print(f"Processed {i}/{len(to_process)}: {article_path.name}")
 
-                with open(output_path, "w") as f:
-                    f.write(result.model_dump_json(indent=2))
+        if isinstance(result, Exception):
+            print(f"  Error processing {article_path.name}: {result}")
+            continue
 
-                print(f"  Saved to {output_filename}")
-            else:
-                print("  Skipped (no content)")
+        # Save output with same filename pattern
+        output_path = output_path_for(article_path, output_dir)
 
-        except Exception as e:
-            print(f"  Error processing {article_path.name}: {e}")
+        output_path.write_bytes(
+            orjson.dumps(result.model_dump(mode="json"), option=orjson.OPT_INDENT_2)
+        )
+        manifest[article_path.name] = digests[article_path.name]
+
+        print(f"  Saved to {output_path.name}")
+
+    manifest_path.write_bytes(orjson.dumps(manifest, option=orjson.OPT_INDENT_2))
+
+    print(
+        f"Summary cache: {summary_cache.stats['hits']} hits, "
+        f"{summary_cache.stats['misses']} misses"
+    )
 
 
 if __name__ == "__main__":
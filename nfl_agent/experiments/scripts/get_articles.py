@@ -5,7 +5,7 @@ Usage:
     python -m nfl_agent.scripts.get_articles
 """
 
-import json
+import orjson
 from pathlib import Path
 from nfl_agent.src.utils.espn_client import ESPNClient
 from nfl_agent.src.tools.article_fetcher.utils import fetch_articles_for_team
@@ -31,7 +31,7 @@ def main():
     client = ESPNClient()
 
     # Get team mapping
-    team_mapping = client._load_team_mapping()
+    team_mapping = client.team_mapping
     team_id = team_mapping[TEAM_NAME]
 
     print(f"Fetching articles for {TEAM_NAME} (ID: {team_id})...")
@@ -51,8 +51,9 @@ def main():
 
     # Save all articles to JSON file
     print(f"\nSaving {len(all_articles)} total articles to {output_file}...")
-    with open(output_file, "w") as f:
-        json.dump(all_articles, f, indent=2, default=str)
+    output_file.write_bytes(
+        orjson.dumps(all_articles, default=str, option=orjson.OPT_INDENT_2)
+    )
 
     print(f"✓ Successfully saved articles to {output_file}")
     print("\nSummary:")
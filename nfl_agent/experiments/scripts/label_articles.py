@@ -13,6 +13,8 @@ import sys
 from datetime import datetime
 from pathlib import Path
 
+import orjson
+
 
 DEFAULT_INPUT_FILE = (
     Path(__file__).parent.parent
@@ -35,9 +37,30 @@ class Colors:
     DIM = "\033[2m"
 
 
+# Fixed display strings, built once rather than per article
+CLEAR_SCREEN = "\033[2J\033[H"
+HEADER_RULE = f"{Colors.BOLD}{Colors.HEADER}{'=' * 60}{Colors.ENDC}"
+RULE = f"{Colors.HEADER}{'=' * 60}{Colors.ENDC}"
+HEADLINE_LABEL = f"{Colors.BOLD}{Colors.CYAN}📰 HEADLINE{Colors.ENDC}"
+DESCRIPTION_LABEL = f"{Colors.BOLD}{Colors.GREEN}📝 DESCRIPTION{Colors.ENDC}"
+PUBLISHED_LABEL = f"{Colors.BOLD}{Colors.YELLOW}📅 PUBLISHED{Colors.ENDC}"
+API_LINK_LABEL = f"{Colors.BOLD}{Colors.BLUE}🔗 API LINK{Colors.ENDC}"
+SCORE_GUIDE = "\n".join(
+    [
+        f"\n{Colors.BOLD}Relevance Score Guide:{Colors.ENDC}",
+        f"  {Colors.RED}0{Colors.ENDC} = Not relevant at all",
+        f"  {Colors.YELLOW}1{Colors.ENDC} = Slightly relevant",
+        f"  {Colors.CYAN}2{Colors.ENDC} = Moderately relevant",
+        f"  {Colors.GREEN}3{Colors.ENDC} = Highly relevant",
+        f"  {Colors.DIM}q = Quit and save{Colors.ENDC}\n",
+    ]
+)
+SCORE_PROMPT = f"{Colors.BOLD}Enter score (0-3) or 'q' to quit: {Colors.ENDC}"
+
+
 def clear_screen():
     """Clear terminal screen."""
-    print("\033[2J\033[H", end="")
+    print(CLEAR_SCREEN, end="")
 
 
 def format_timestamp(ts: str) -> str:
@@ -61,57 +84,36 @@ def get_api_link(article: dict) -> str:
 
 def display_article(article: dict, index: int, total: int) -> None:
     """Display article information in a pretty format."""
-    clear_screen()
-
-    # Header
-    print(f"{Colors.BOLD}{Colors.HEADER}{'=' * 60}{Colors.ENDC}")
-    print(f"{Colors.BOLD}  Article {index + 1} of {total}{Colors.ENDC}")
-    print(f"{Colors.HEADER}{'=' * 60}{Colors.ENDC}\n")
-
-    # Headline
-    headline = article.get("headline", "No headline")
-    print(f"{Colors.BOLD}{Colors.CYAN}📰 HEADLINE{Colors.ENDC}")
-    print(f"   {headline}\n")
-
-    # Description
-    description = article.get("description", "No description available")
-    print(f"{Colors.BOLD}{Colors.GREEN}📝 DESCRIPTION{Colors.ENDC}")
-    print(f"   {description}\n")
-
-    # Published date
-    published = format_timestamp(article.get("published"))
-    print(f"{Colors.BOLD}{Colors.YELLOW}📅 PUBLISHED{Colors.ENDC}")
-    print(f"   {published}\n")
-
-    # API Link
-    api_link = get_api_link(article)
-    print(f"{Colors.BOLD}{Colors.BLUE}🔗 API LINK{Colors.ENDC}")
-    print(f"   {api_link}\n")
+    lines = [
+        CLEAR_SCREEN + HEADER_RULE,
+        f"{Colors.BOLD}  Article {index + 1} of {total}{Colors.ENDC}",
+        RULE + "\n",
+        HEADLINE_LABEL,
+        f"   {article.get('headline', 'No headline')}\n",
+        DESCRIPTION_LABEL,
+        f"   {article.get('description', 'No description available')}\n",
+        PUBLISHED_LABEL,
+        f"   {format_timestamp(article.get('published'))}\n",
+        API_LINK_LABEL,
+        f"   {get_api_link(article)}\n",
+    ]
 
     # Existing score (if any)
     existing_score = article.get("human_labelled_relevance_score")
     if existing_score is not None:
-        print(f"{Colors.DIM}Previous score: {existing_score}{Colors.ENDC}\n")
+        lines.append(f"{Colors.DIM}Previous score: {existing_score}{Colors.ENDC}\n")
 
-    print(f"{Colors.HEADER}{'=' * 60}{Colors.ENDC}")
+    lines.append(RULE)
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def get_score_input() -> int | None:
     """Prompt user for relevance score. Returns None to quit."""
-    print(f"\n{Colors.BOLD}Relevance Score Guide:{Colors.ENDC}")
-    print(f"  {Colors.RED}0{Colors.ENDC} = Not relevant at all")
-    print(f"  {Colors.YELLOW}1{Colors.ENDC} = Slightly relevant")
-    print(f"  {Colors.CYAN}2{Colors.ENDC} = Moderately relevant")
-    print(f"  {Colors.GREEN}3{Colors.ENDC} = Highly relevant")
-    print(f"  {Colors.DIM}q = Quit and save{Colors.ENDC}\n")
+    print(SCORE_GUIDE)
 
     while True:
         try:
-            response = (
-                input(f"{Colors.BOLD}Enter score (0-3) or 'q' to quit: {Colors.ENDC}")
-                .strip()
-                .lower()
-            )
+            response = input(SCORE_PROMPT).strip().lower()
 
             if response == "q":
                 return None
@@ -131,8 +133,57 @@ def get_score_input() -> int | None:
 
 def save_articles(articles: list, filepath: Path) -> None:
     """Save articles back to JSON file."""
-    with open(filepath, "w") as f:
-        json.dump(articles, f, indent=4)
+    # Write then rename so a crash mid-write never leaves a truncated file
+    tmp_path = filepath.with_suffix(filepath.suffix + ".tmp")
+    # Same layout as json.dump(indent=4), so saves don't reformat the whole file
+    tmp_path.write_text(json.dumps(articles, indent=4))
+    tmp_path.replace(filepath)
+
+
+def label_log_path(filepath: Path) -> Path:
+    """Path of the append-only label log kept next to the articles file."""
+    return filepath.with_suffix(".labels.jsonl")
+
+
+def load_label_log(log_path: Path) -> dict[int, int]:
+    """Load scores from the label log, keyed by article id.
+
+    Later entries win, so re-labelling an article just appends a new line.
+    A truncated last line (e.g. from a crash mid-write) is ignored.
+    """
+    if not log_path.exists():
+        return {}
+
+    labels = {}
+    for line in log_path.read_bytes().splitlines():
+        try:
+            entry = orjson.loads(line)
+        except orjson.JSONDecodeError:
+            continue
+        labels[entry["id"]] = entry["score"]
+    return labels
+
+
+def apply_labels(articles: list, labels: dict[int, int]) -> int:
+    """Set scores on the articles whose id has a label; returns how many matched.
+
+    Matching on id (not position) keeps labels on the right articles even if the
+    articles file was regenerated since they were logged.
+    """
+    applied = 0
+    for article in articles:
+        score = labels.get(article.get("id"))
+        if score is not None:
+            article["human_labelled_relevance_score"] = score
+            applied += 1
+    return applied
+
+
+def merge_labels(articles: list, log_path: Path, filepath: Path) -> None:
+    """Fold the label log into articles, write them once and drop the log."""
+    apply_labels(articles, load_label_log(log_path))
+    save_articles(articles, filepath)
+    log_path.unlink(missing_ok=True)
 
 
 def main():
@@ -166,9 +217,8 @@ Examples:
 
     # Load articles
     try:
-        with open(args.input_file) as f:
-            articles = json.load(f)
-    except json.JSONDecodeError as e:
+        articles = orjson.loads(args.input_file.read_bytes())
+    except orjson.JSONDecodeError as e:
         print(f"{Colors.RED}Error: Invalid JSON file: {e}{Colors.ENDC}")
         sys.exit(1)
 
@@ -182,6 +232,17 @@ Examples:
 
     print(f"{Colors.BOLD}Loading {total} articles from {args.input_file}{Colors.ENDC}")
 
+    # Resume labels from a previous session that exited without merging
+    log_path = label_log_path(args.input_file)
+    recovered = apply_labels(articles, load_label_log(log_path))
+    if recovered:
+        print(
+            f"{Colors.YELLOW}Recovered {recovered} unsaved labels from {log_path}{Colors.ENDC}"
+        )
+
+    # Line-buffered so each label reaches disk as soon as it's entered
+    log_file = open(log_path, "a", buffering=1)
+
     for i, article in enumerate(articles):
         # Skip already labeled articles unless --overwrite
         if not args.overwrite and "human_labelled_relevance_score" in article:
@@ -194,7 +255,8 @@ Examples:
         if score is None:
             # User wants to quit
             print(f"\n{Colors.YELLOW}Saving progress...{Colors.ENDC}")
-            save_articles(articles, args.input_file)
+            log_file.close()
+            merge_labels(articles, log_path, args.input_file)
             print(
                 f"{Colors.GREEN}✓ Saved! Labeled {labeled_count} articles this session.{Colors.ENDC}"
             )
@@ -208,10 +270,14 @@ Examples:
         article["human_labelled_relevance_score"] = score
         labeled_count += 1
 
-        # Save after each score (in case of crash/interrupt)
-        save_articles(articles, args.input_file)
+        # Log each score (in case of crash/interrupt); merged into the JSON on exit
+        log_file.write(
+            orjson.dumps({"id": article["id"], "score": score}).decode() + "\n"
+        )
 
     # Completed all articles
+    log_file.close()
+    merge_labels(articles, log_path, args.input_file)
     clear_screen()
     print(f"{Colors.GREEN}{Colors.BOLD}✓ Labeling complete!{Colors.ENDC}")
     print(f"  Labeled: {labeled_count} articles")
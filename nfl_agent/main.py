@@ -59,6 +59,14 @@ def extract_prediction_from_agent_response(agent_response):
     Returns:
         Dict with prediction data or None if not found
     """
+    # The agent's ProviderStrategy already parsed the final answer for us
+    structured_response = agent_response.get("structured_response")
+    if structured_response is not None:
+        if hasattr(structured_response, "model_dump"):
+            return structured_response.model_dump()
+        return structured_response
+
+    # Fall back to scanning messages for a JSON prediction
     messages = agent_response.get("messages", [])
 
     # Find the final AI message with the prediction
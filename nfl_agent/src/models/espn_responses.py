@@ -1,125 +1,275 @@
 """Pydantic models for ESPN API responses."""
 
-from typing import Any, List, Optional, Dict
-from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
+import logging
+import re
+from dataclasses import dataclass
+from collections.abc import Callable
+from functools import cache, lru_cache
+from operator import attrgetter
+from typing import Any
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    PrivateAttr,
+    field_validator,
+    model_validator,
+)
+
+from nfl_agent.src.models.stat import Stat
+
+logger = logging.getLogger(__name__)
+
+# IDs embedded in $ref URLs, e.g. ".../teams/21?lang=en" or ".../athletes/3139477/..."
+_TEAM_ID_RE = re.compile(r"/teams/([^/?]+)")
+_ATHLETE_ID_RE = re.compile(r"/athletes/([^/?]+)")
+
+
+_by_rank = attrgetter("rank")
+
+
+class _MalformedPayload(Exception):
+    """A trusted ESPN payload is missing a field its model requires."""
+
+
+@cache
+def _required_fields(model_cls: type[BaseModel]) -> frozenset[str]:
+    return frozenset(
+        name for name, field in model_cls.model_fields.items() if field.is_required()
+    )
+
+
+def _construct(model_cls: type[BaseModel], data: Any, **nested: Any) -> Any:
+    """
+    model_construct from a payload dict, with nested fields already built.
+
+    Raises _MalformedPayload if data is not a dict or lacks a required field,
+    since model_construct would otherwise leave the attribute silently unset.
+    """
+    if not isinstance(data, dict) or not _required_fields(model_cls) <= data.keys():
+        raise _MalformedPayload(model_cls.__name__)
+    return model_cls.model_construct(**{**data, **nested})
+
+
+def _construct_or_validate(
+    model_cls: type[BaseModel],
+    build: Callable[[Any], Any],
+    data: Any,
+    strict: bool,
+) -> Any:
+    """
+    Build a trusted payload without validation, falling back to model_validate.
+
+    The fallback also runs when the payload is malformed, so callers still get
+    a pydantic ValidationError describing what is wrong.
+    """
+    if not strict:
+        try:
+            return build(data)
+        except (_MalformedPayload, AttributeError, KeyError, TypeError):
+            pass
+    return model_cls.model_validate(data)
 
 
 class ESPNPosition(BaseModel):
     """ESPN position nested object."""
 
-    model_config = ConfigDict(extra="ignore")
+    model_config = ConfigDict(extra="ignore", frozen=True)
 
     abbreviation: str
-    name: Optional[str] = None
-    displayName: Optional[str] = None
+    name: str | None = None
+    displayName: str | None = None
 
 
 class ESPNInjuryDetails(BaseModel):
     """ESPN injury details."""
 
-    model_config = ConfigDict(extra="ignore")
+    model_config = ConfigDict(extra="ignore", frozen=True)
 
     type: str  # e.g., "Ankle", "Knee"
-    location: Optional[str] = None  # e.g., "Leg"
+    location: str | None = None  # e.g., "Leg"
 
 
 class ESPNInjuryType(BaseModel):
     """ESPN injury type information."""
 
-    model_config = ConfigDict(extra="ignore")
+    model_config = ConfigDict(extra="ignore", frozen=True)
 
     id: str
     name: str  # e.g., "INJURY_STATUS_QUESTIONABLE"
-    description: Optional[str] = None
-    abbreviation: Optional[str] = None
+    description: str | None = None
+    abbreviation: str | None = None
 
 
 class ESPNInjury(BaseModel):
     """ESPN injury object."""
 
-    model_config = ConfigDict(extra="ignore")
+    model_config = ConfigDict(extra="ignore", frozen=True)
 
     status: str  # e.g., "Questionable", "Out"
     type: ESPNInjuryType
-    details: Optional[ESPNInjuryDetails] = None
-    shortComment: Optional[str] = None
+    details: ESPNInjuryDetails | None = None
+    shortComment: str | None = None
+
+    @classmethod
+    def from_espn(cls, data: dict[str, Any], strict: bool = False) -> "ESPNInjury":
+        """Build from a trusted ESPN payload; see ESPNAthleteResponse.from_espn."""
+        return _construct_or_validate(cls, cls._construct_espn, data, strict)
+
+    @classmethod
+    def _construct_espn(cls, data: dict[str, Any]) -> "ESPNInjury":
+        details = data.get("details")
+        return _construct(
+            cls,
+            data,
+            type=_construct(ESPNInjuryType, data.get("type")),
+            details=_construct(ESPNInjuryDetails, details) if details else None,
+        )
 
 
 class ESPNAthleteResponse(BaseModel):
     """Response model for ESPN athlete endpoint."""
 
-    model_config = ConfigDict(extra="ignore")
+    model_config = ConfigDict(extra="ignore", frozen=True)
 
     id: str
     fullName: str
-    firstName: Optional[str] = None
-    lastName: Optional[str] = None
+    firstName: str | None = None
+    lastName: str | None = None
     height: float  # in inches
     weight: float  # in lbs
     age: int
     position: ESPNPosition
-    team: Dict[str, str] = Field(default_factory=dict)  # Contains $ref
-    injuries: List[ESPNInjury] = Field(default_factory=list)
+    team: dict[str, str] = Field(default_factory=dict)  # Contains $ref
+    injuries: list[ESPNInjury] = Field(default_factory=list)
 
-    @field_validator("position", mode="before")
     @classmethod
-    def parse_position(cls, v: Any) -> ESPNPosition:
-        """Parse position from dict or return as-is."""
-        if isinstance(v, dict):
-            return ESPNPosition(**v)
-        return v
+    def from_espn(
+        cls, data: dict[str, Any], strict: bool = False
+    ) -> "ESPNAthleteResponse":
+        """
+        Build from a trusted ESPN payload.
 
-    def get_team_id(self) -> Optional[str]:
+        Skips validation (model_construct) unless strict is set, in which case
+        the payload is fully validated. A payload missing a required field is
+        validated too, so it raises ValidationError rather than yielding a
+        model with unset attributes.
+        """
+        return _construct_or_validate(cls, cls._construct_espn, data, strict)
+
+    @classmethod
+    def _construct_espn(cls, data: dict[str, Any]) -> "ESPNAthleteResponse":
+        return _construct(
+            cls,
+            data,
+            position=_construct(ESPNPosition, data.get("position")),
+            injuries=[
+                ESPNInjury._construct_espn(injury)
+                for injury in data.get("injuries", [])
+            ],
+        )
+
+    def get_team_id(self) -> str | None:
         """Extract team ID from team.$ref URL."""
-        ref = self.team.get("$ref", "")
-        if "/teams/" in ref:
-            return ref.split("/teams/")[1].split("?")[0]
-        return None
+        match = _TEAM_ID_RE.search(self.team.get("$ref", ""))
+        return match.group(1) if match else None
 
 
 class ESPNStat(BaseModel):
     """Individual stat within a category."""
 
-    model_config = ConfigDict(extra="ignore")
+    model_config = ConfigDict(extra="ignore", frozen=True)
 
     displayName: str
     description: str
     value: float
-    perGameValue: Optional[float] = None
-    rank: Optional[int] = None
+    perGameValue: float | None = None
+    rank: int | None = None
 
 
 class ESPNStatCategory(BaseModel):
     """Category of stats (e.g., passing, rushing, defensive)."""
 
-    model_config = ConfigDict(extra="ignore")
+    model_config = ConfigDict(extra="ignore", frozen=True)
 
     name: str
     displayName: str
-    stats: List[ESPNStat]
+    stats: list[ESPNStat]
 
 
 class ESPNSplits(BaseModel):
     """Splits object containing categories."""
 
-    model_config = ConfigDict(extra="ignore")
+    model_config = ConfigDict(extra="ignore", frozen=True)
 
-    categories: List[ESPNStatCategory]
+    categories: list[ESPNStatCategory]
 
 
 class ESPNStatisticsResponse(BaseModel):
     """Response model for ESPN athlete statistics endpoint."""
 
-    model_config = ConfigDict(extra="ignore")
+    model_config = ConfigDict(extra="ignore", frozen=True)
 
     splits: ESPNSplits
 
-    def get_category_stats(self, category_name: str) -> Optional[List[ESPNStat]]:
-        """Get a specific category by name."""
+    @classmethod
+    def from_espn(
+        cls, data: dict[str, Any], strict: bool = False
+    ) -> "ESPNStatisticsResponse":
+        """Build from a trusted ESPN payload; see ESPNAthleteResponse.from_espn."""
+        return _construct_or_validate(cls, cls._construct_espn, data, strict)
+
+    @classmethod
+    def _construct_espn(cls, data: dict[str, Any]) -> "ESPNStatisticsResponse":
+        splits = data.get("splits")
+        categories = (
+            [
+                _construct(
+                    ESPNStatCategory,
+                    category,
+                    stats=[_construct(ESPNStat, stat) for stat in category["stats"]],
+                )
+                for category in splits["categories"]
+            ]
+            if isinstance(splits, dict) and "categories" in splits
+            else None
+        )
+        return _construct(
+            cls, data, splits=_construct(ESPNSplits, splits, categories=categories)
+        )
+
+    # Category name -> category, and category name -> stat displayName -> stat,
+    # both built on first lookup
+    _categories_by_name: dict[str, ESPNStatCategory] | None = PrivateAttr(default=None)
+    _stats_by_category: dict[str, dict[str, ESPNStat]] | None = PrivateAttr(
+        default=None
+    )
+
+    def _build_indexes(self) -> None:
+        """Index categories by name and their stats by displayName; first wins."""
+        categories: dict[str, ESPNStatCategory] = {}
+        index: dict[str, dict[str, ESPNStat]] = {}
         for category in self.splits.categories:
-            if category.name == category_name:
-                return category.stats
-        return None
+            if category.name in categories:
+                continue
+            categories[category.name] = category
+            stats = index[category.name] = {}
+            for stat in category.stats:
+                stats.setdefault(stat.displayName, stat)
+        self._categories_by_name = categories
+        self._stats_by_category = index
+
+    def _get_stats_by_category(self) -> dict[str, dict[str, ESPNStat]]:
+        if self._stats_by_category is None:
+            self._build_indexes()
+        return self._stats_by_category
+
+    def get_category_stats(self, category_name: str) -> list[ESPNStat] | None:
+        """Get a specific category by name."""
+        if self._categories_by_name is None:
+            self._build_indexes()
+        category = self._categories_by_name.get(category_name)
+        return category.stats if category else None
 
     def extract_stat(self, category_name: str, display_name: str):
         """
@@ -132,24 +282,21 @@ class ESPNStatisticsResponse(BaseModel):
         Returns:
             Stat object with all metadata, or None if not found
         """
-        from nfl_agent.src.models.stats import Stat
-
-        category_stats = self.get_category_stats(category_name)
-        if not category_stats:
+        espn_stat = (
+            self._get_stats_by_category().get(category_name, {}).get(display_name)
+        )
+        if espn_stat is None:
             return None
 
-        for espn_stat in category_stats:
-            if espn_stat.displayName == display_name:
-                return Stat(
-                    display_name=espn_stat.displayName,
-                    description=espn_stat.description,
-                    value=espn_stat.value,
-                    per_game_value=espn_stat.perGameValue,
-                    rank=espn_stat.rank,
-                )
-        return None
+        return Stat(
+            display_name=espn_stat.displayName,
+            description=espn_stat.description,
+            value=espn_stat.value,
+            per_game_value=espn_stat.perGameValue,
+            rank=espn_stat.rank,
+        )
 
-    def extract_stat_with_fallback(self, category_name: str, display_names: List[str]):
+    def extract_stat_with_fallback(self, category_name: str, display_names: list[str]):
         """
         Extract a stat with fallback options.
 
@@ -160,8 +307,6 @@ class ESPNStatisticsResponse(BaseModel):
         Returns:
             Stat object, or a default Stat with value 0.0 if not found
         """
-        from nfl_agent.src.models.stats import Stat
-
         for display_name in display_names:
             stat = self.extract_stat(category_name, display_name)
             if stat:
@@ -180,60 +325,84 @@ class ESPNStatisticsResponse(BaseModel):
 class ESPNRecordItem(BaseModel):
     """Team record item."""
 
-    model_config = ConfigDict(extra="ignore")
+    model_config = ConfigDict(extra="ignore", frozen=True)
 
-    type: str  # e.g., "total", "home", "away"
-    summary: str  # e.g., "4-10"
-    stats: List[Dict[str, Any]] = Field(default_factory=list)
+    type: str | None = None  # e.g., "total", "home", "away"
+    summary: str = "0-0"  # e.g., "4-10"
+    stats: list[dict[str, Any]] = Field(default_factory=list)
 
-    def get_stat_value(self, stat_name: str) -> Optional[Any]:
+    # Stat name -> stat dict, built on first lookup
+    _stats_by_name: dict[str, dict[str, Any]] | None = PrivateAttr(default=None)
+
+    def get_stat(self, stat_name: str) -> dict[str, Any] | None:
+        """Get a stat dict by name; first occurrence wins."""
+        if self._stats_by_name is None:
+            index: dict[str, dict[str, Any]] = {}
+            for stat in self.stats:
+                index.setdefault(stat.get("name"), stat)
+            self._stats_by_name = index
+        return self._stats_by_name.get(stat_name)
+
+    def get_stat_value(self, stat_name: str) -> Any | None:
         """Get a specific stat value from stats list."""
-        for stat in self.stats:
-            if stat.get("name") == stat_name:
-                return stat.get("value") or stat.get("displayValue")
-        return None
+        stat = self.get_stat(stat_name)
+        if stat is None:
+            return None
+        return stat.get("value") or stat.get("displayValue")
+
+
+class ESPNRecord(BaseModel):
+    """Team record nested object."""
+
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
+    items: list[ESPNRecordItem] = Field(default_factory=list)
+
+    # Record type -> item, built on first lookup
+    _items_by_type: dict[str, ESPNRecordItem] | None = PrivateAttr(default=None)
+
+    def get_item(self, record_type: str) -> ESPNRecordItem | None:
+        """Get a record item by type (e.g. "total"); first occurrence wins."""
+        if self._items_by_type is None:
+            index: dict[str, ESPNRecordItem] = {}
+            for item in self.items:
+                index.setdefault(item.type, item)
+            self._items_by_type = index
+        return self._items_by_type.get(record_type)
 
 
 class ESPNTeamInfo(BaseModel):
     """Team information nested object."""
 
-    model_config = ConfigDict(extra="ignore")
+    model_config = ConfigDict(extra="ignore", frozen=True)
 
     id: str
     displayName: str
     name: str
     abbreviation: str
-    record: Optional[Dict[str, Any]] = None
+    record: ESPNRecord | None = None
 
 
 class ESPNTeamResponse(BaseModel):
     """Response model for ESPN team endpoint."""
 
-    model_config = ConfigDict(extra="ignore")
+    model_config = ConfigDict(extra="ignore", frozen=True)
 
     team: ESPNTeamInfo
 
-    @model_validator(mode="before")
-    @classmethod
-    def flatten_if_needed(cls, data: Dict[str, Any]) -> Dict[str, Any]:
-        """Handle case where team data is at root or nested."""
-        if "team" not in data and "displayName" in data:
-            return {"team": data}
-        return data
-
     def get_record_summary(self) -> str:
         """Extract record summary (W-L-T format)."""
         if not self.team.record:
             return "0-0"
 
-        items = self.team.record.get("items", [])
-        for item in items:
-            if item.get("type") == "total":
-                return item.get("summary", "0-0")
+        total = self.team.record.get_item("total")
+        if total:
+            return total.summary
 
         # Fallback to first item
+        items = self.team.record.items
         if items:
-            return items[0].get("summary", "0-0")
+            return items[0].summary
 
         return "0-0"
 
@@ -242,90 +411,164 @@ class ESPNTeamResponse(BaseModel):
         if not self.team.record:
             return 0
 
-        items = self.team.record.get("items", [])
-        for item in items:
-            if item.get("type") == "total":
-                stats = item.get("stats", [])
-                for stat in stats:
-                    if stat.get("name") == "playoffSeed":
-                        value = stat.get("value")
-                        if value is not None:
-                            try:
-                                return int(value)
-                            except (ValueError, TypeError):
-                                pass
+        total = self.team.record.get_item("total")
+        stat = total.get_stat("playoffSeed") if total else None
+        value = stat.get("value") if stat else None
+        if value is not None:
+            try:
+                return int(value)
+            except (ValueError, TypeError):
+                pass
         return 0
 
 
 class ESPNDepthChartAthlete(BaseModel):
     """Athlete entry in depth chart."""
 
-    model_config = ConfigDict(extra="ignore")
+    model_config = ConfigDict(extra="ignore", frozen=True)
 
     rank: int
-    slot: Optional[int] = None
-    athlete: Dict[str, str] = Field(default_factory=dict)  # Contains $ref
+    slot: int | None = None
+    athlete: dict[str, str] = Field(default_factory=dict)  # Contains $ref
 
-    def get_athlete_id(self) -> Optional[str]:
+    def get_athlete_id(self) -> str | None:
         """Extract athlete ID from athlete.$ref URL."""
-        ref = self.athlete.get("$ref", "")
-        if "/athletes/" in ref:
-            parts = ref.split("/athletes/")[1].split("?")[0].split("/")
-            return parts[0]
-        return None
+        match = _ATHLETE_ID_RE.search(self.athlete.get("$ref", ""))
+        return match.group(1) if match else None
 
 
 class ESPNDepthChartPosition(BaseModel):
     """Position entry in depth chart."""
 
-    model_config = ConfigDict(extra="ignore")
+    model_config = ConfigDict(extra="ignore", frozen=True)
 
-    position: Optional[ESPNPosition] = None
-    athletes: List[ESPNDepthChartAthlete] = Field(default_factory=list)
+    position: ESPNPosition | None = None
+    athletes: list[ESPNDepthChartAthlete] = Field(default_factory=list)
 
 
 class ESPNDepthChartFormation(BaseModel):
     """Formation with positions (e.g., Base 3-4 D, 3WR 1TE)."""
 
-    model_config = ConfigDict(extra="ignore")
+    model_config = ConfigDict(extra="ignore", frozen=True)
 
     id: str
     name: str
-    positions: Dict[str, ESPNDepthChartPosition] = Field(default_factory=dict)
+    positions: dict[str, ESPNDepthChartPosition] = Field(default_factory=dict)
 
 
 class ESPNDepthChartResponse(BaseModel):
     """Response model for ESPN depth chart endpoint."""
 
-    model_config = ConfigDict(extra="ignore")
+    model_config = ConfigDict(extra="ignore", frozen=True)
 
-    items: List[ESPNDepthChartFormation] = Field(default_factory=list)
+    items: list[ESPNDepthChartFormation] = Field(default_factory=list)
+
+    # Athletes bucketed by upper-cased position key, built on first lookup
+    _athletes_by_position: dict[str, list[ESPNDepthChartAthlete]] | None = PrivateAttr(
+        default=None
+    )
+
+    @classmethod
+    def from_espn(
+        cls, data: dict[str, Any], strict: bool = False
+    ) -> "ESPNDepthChartResponse":
+        """Build from a trusted ESPN payload; see ESPNAthleteResponse.from_espn."""
+        return _construct_or_validate(cls, cls._construct_espn, data, strict)
+
+    @classmethod
+    def _construct_espn(cls, data: dict[str, Any]) -> "ESPNDepthChartResponse":
+        items = [
+            _construct(
+                ESPNDepthChartFormation,
+                formation,
+                positions={
+                    key: _construct(
+                        ESPNDepthChartPosition,
+                        pos,
+                        position=(
+                            _construct(ESPNPosition, pos["position"])
+                            if pos.get("position")
+                            else None
+                        ),
+                        athletes=[
+                            _construct(ESPNDepthChartAthlete, athlete)
+                            for athlete in pos.get("athletes", [])
+                        ],
+                    )
+                    for key, pos in formation.get("positions", {}).items()
+                },
+            )
+            for formation in data.get("items", [])
+        ]
+        return _construct(cls, data, items=items)
+
+    def _get_athletes_by_position(self) -> dict[str, list[ESPNDepthChartAthlete]]:
+        """
+        Index athletes by position, in formation order and by rank within each.
+
+        Each position is filed under its abbreviation and its formation key
+        (e.g. "LDE" and "lde"), both upper-cased.
+        """
+        if self._athletes_by_position is None:
+            index: dict[str, list[ESPNDepthChartAthlete]] = {}
+            for formation in self.items:
+                for pos_key, pos_data in formation.positions.items():
+                    athletes = sorted(pos_data.athletes, key=_by_rank)
+                    keys = {pos_key.upper()}
+                    if pos_data.position:
+                        keys.add(pos_data.position.abbreviation.upper())
+                    for key in keys:
+                        index.setdefault(key, []).extend(athletes)
+            self._athletes_by_position = index
+        return self._athletes_by_position
 
     def get_starter_by_position(
         self, position_abbr: str, max_starters: int = 1
-    ) -> Optional[List[str]]:
+    ) -> list[str]:
         """
-        Get the starting player ID for a position abbreviation.
+        Get the starting player IDs for a position abbreviation.
+
+        The lookup is case-insensitive and also matches formation keys (e.g.
+        "lde"), so positions without an abbreviation in the payload are still
+        found. Starters are taken in depth order across formations, and an
+        athlete listed in several formations is returned once.
 
         Args:
             position_abbr: Position like "QB", "RB", "WR", "TE", "DE", "LB", etc.
+            max_starters: Number of distinct starters to return at most
 
         Returns:
-            List of athlete IDs of the starters, or None if not found
+            List of athlete IDs of the starters, empty if not found
+        """
+        # take the first max_starters distinct starters; later formations mostly
+        # repeat them, so dedupe in order with a dict
+        starters: dict[str, None] = {}
+        athletes = self._get_athletes_by_position().get(position_abbr.upper(), [])
+        for athlete in athletes:
+            if athlete.rank <= max_starters:
+                starters[athlete.get_athlete_id()] = None
+                if len(starters) >= max_starters:
+                    break
+        if not starters:
+            logger.debug("No starters found for position %s", position_abbr)
+        return list(starters)
+
+    def get_starters_by_positions(self, max_starters: dict[str, int]) -> list[str]:
         """
-        # iterrate through the items and get the starters up to the max_starters
-        starters = []
-        for formation in self.items:
-            for pos_key, pos_data in formation.positions.items():
-                if (
-                    pos_data.position
-                    and pos_data.position.abbreviation == position_abbr
-                ):
-                    for athlete in pos_data.athletes:
-                        if athlete.rank <= max_starters:
-                            starters.append(athlete.get_athlete_id())
+        Get the starters for several positions, without duplicates.
+
+        Args:
+            max_starters: Position abbreviation -> number of starters to take
 
-        return starters
+        Returns:
+            Athlete IDs in position order, each listed once
+        """
+        starters: dict[str, None] = {}
+        for position_abbr, count in max_starters.items():
+            starters.update(
+                dict.fromkeys(self.get_starter_by_position(position_abbr, count))
+            )
+        return list(starters)
 
 
 # ========================================================================
@@ -333,46 +576,110 @@ class ESPNDepthChartResponse(BaseModel):
 # ========================================================================
 
 
+class ESPNTeamRef(BaseModel):
+    """Team summary nested in a game competitor."""
+
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
+    displayName: str | None = None
+    name: str | None = None
+    abbreviation: str | None = None
+
+
+@lru_cache(maxsize=256)
+def _team_ref(
+    display_name: str | None, name: str | None, abbr: str | None
+) -> ESPNTeamRef:
+    """Shared ESPNTeamRef per team; the same teams recur across every week."""
+    return ESPNTeamRef(displayName=display_name, name=name, abbreviation=abbr)
+
+
 class ESPNGameCompetitor(BaseModel):
     """Competitor/team in a game."""
 
-    model_config = ConfigDict(extra="ignore")
+    model_config = ConfigDict(extra="ignore", frozen=True)
 
     id: str
-    uid: Optional[str] = None
-    type: Optional[str] = None  # "team"
-    order: Optional[int] = None  # 1=away, 2=home
-    homeAway: Optional[str] = None  # "home" or "away"
-    team: Optional[Dict[str, Any]] = None
-    score: Optional[str] = None
+    uid: str | None = None
+    type: str | None = None  # "team"
+    order: int | None = None  # 1=away, 2=home
+    homeAway: str | None = None  # "home" or "away"
+    team: ESPNTeamRef | None = None
+    score: str | None = None
+
+    @field_validator("team", mode="before")
+    @classmethod
+    def intern_team(cls, v: Any) -> Any:
+        """Reuse one frozen ESPNTeamRef per distinct team dict."""
+        if isinstance(v, dict):
+            return _team_ref(v.get("displayName"), v.get("name"), v.get("abbreviation"))
+        return v
 
     def get_team_id(self) -> str:
         """Extract team ID."""
         return self.id
 
-    def get_team_name(self) -> Optional[str]:
+    def get_team_name(self) -> str | None:
         """Extract team display name."""
         if self.team:
-            return self.team.get("displayName") or self.team.get("name")
+            return self.team.displayName or self.team.name
         return None
 
-    def get_team_abbr(self) -> Optional[str]:
+    def get_team_abbr(self) -> str | None:
         """Extract team abbreviation."""
         if self.team:
-            return self.team.get("abbreviation")
+            return self.team.abbreviation
         return None
 
 
+class ESPNStatusType(BaseModel):
+    """Game status type nested object."""
+
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
+    state: str | None = "scheduled"  # "pre"/"scheduled", "in", "post"
+
+
+@lru_cache(maxsize=8)
+def _status_type(state: str | None) -> ESPNStatusType:
+    """Shared ESPNStatusType per state; there are only a handful of states."""
+    return ESPNStatusType(state=state)
+
+
+HomeAway = tuple[ESPNGameCompetitor | None, ESPNGameCompetitor | None]
+
+
+def _find_home_away(competitors: list[ESPNGameCompetitor]) -> HomeAway:
+    """Find the (home, away) competitors in a single pass."""
+    home = away = None
+    for comp in competitors:
+        if home is None and (comp.homeAway == "home" or comp.order == 2):
+            home = comp
+        if away is None and (comp.homeAway == "away" or comp.order == 1):
+            away = comp
+        if home is not None and away is not None:
+            break
+    return home, away
+
+
 class ESPNGameStatus(BaseModel):
     """Game status information."""
 
-    model_config = ConfigDict(extra="ignore")
+    model_config = ConfigDict(extra="ignore", frozen=True)
 
-    type: Dict[str, Any]
+    type: ESPNStatusType
+
+    @field_validator("type", mode="before")
+    @classmethod
+    def intern_type(cls, v: Any) -> Any:
+        """Reuse one frozen ESPNStatusType per state."""
+        if isinstance(v, dict) and isinstance(v.get("state", "scheduled"), str | None):
+            return _status_type(v.get("state", "scheduled"))
+        return v
 
-    def get_state(self) -> str:
+    def get_state(self) -> str | None:
         """Get status state: scheduled, in, post."""
-        return self.type.get("state", "scheduled")
+        return self.type.state
 
     def is_final(self) -> bool:
         """Check if game is final."""
@@ -383,24 +690,34 @@ class ESPNGameStatus(BaseModel):
         return self.get_state() == "in"
 
 
+class ESPNVenue(BaseModel):
+    """Venue nested object."""
+
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
+    fullName: str | None = None
+
+
 class ESPNGameEvent(BaseModel):
     """Individual game event from scoreboard."""
 
-    model_config = ConfigDict(extra="ignore")
+    model_config = ConfigDict(extra="ignore", frozen=True)
 
     id: str
-    uid: Optional[str] = None
+    uid: str | None = None
     date: str  # ISO datetime
-    name: Optional[str] = None  # e.g., "Team A at Team B"
-    shortName: Optional[str] = None
-    competitors: List[ESPNGameCompetitor] = Field(default_factory=list)
-    status: Optional[ESPNGameStatus] = None
-    competitions: Optional[List[Dict[str, Any]]] = None  # Alternative structure
-    venue: Optional[Dict[str, Any]] = None
+    name: str | None = None  # e.g., "Team A at Team B"
+    shortName: str | None = None
+    competitors: list[ESPNGameCompetitor] = Field(default_factory=list)
+    status: ESPNGameStatus | None = None
+    competitions: list[dict[str, Any]] | None = None  # Alternative structure
+    venue: ESPNVenue | None = None
+
+    _home_away: HomeAway = PrivateAttr(default=(None, None))
 
     @model_validator(mode="before")
     @classmethod
-    def extract_competitors(cls, data: Dict[str, Any]) -> Dict[str, Any]:
+    def extract_competitors(cls, data: dict[str, Any]) -> dict[str, Any]:
         """Extract competitors from competitions if not at root."""
         if "competitors" not in data or not data["competitors"]:
             competitions = data.get("competitions", [])
@@ -414,6 +731,10 @@ class ESPNGameEvent(BaseModel):
                     data["venue"] = comp.get("venue")
         return data
 
+    def model_post_init(self, __context: Any) -> None:
+        """Resolve home/away once, so the getters don't rescan competitors."""
+        self._home_away = _find_home_away(self.competitors)
+
     def get_event_id(self) -> str:
         """Get event ID."""
         return self.id
@@ -422,47 +743,45 @@ class ESPNGameEvent(BaseModel):
         """Get kickoff datetime in ISO format."""
         return self.date
 
-    def get_home_team(self) -> Optional[ESPNGameCompetitor]:
+    def get_home_team(self) -> ESPNGameCompetitor | None:
         """Get home team competitor."""
-        for comp in self.competitors:
-            if comp.homeAway == "home" or comp.order == 2:
-                return comp
-        return None
+        return self._home_away[0]
 
-    def get_away_team(self) -> Optional[ESPNGameCompetitor]:
+    def get_away_team(self) -> ESPNGameCompetitor | None:
         """Get away team competitor."""
-        for comp in self.competitors:
-            if comp.homeAway == "away" or comp.order == 1:
-                return comp
-        return None
+        return self._home_away[1]
 
-    def get_venue_name(self) -> Optional[str]:
+    def get_venue_name(self) -> str | None:
         """Get venue name."""
         if self.venue:
-            return self.venue.get("fullName")
+            return self.venue.fullName
         return None
 
 
 class ESPNScoreboardResponse(BaseModel):
     """Response from scoreboard endpoint."""
 
-    model_config = ConfigDict(extra="ignore")
+    model_config = ConfigDict(extra="ignore", frozen=True)
 
-    events: List[ESPNGameEvent] = Field(default_factory=list)
-    week: Optional[Dict[str, Any]] = None
-    season: Optional[Dict[str, Any]] = None
+    events: list[ESPNGameEvent] = Field(default_factory=list)
+    week: dict[str, Any] | None = None
+    season: dict[str, Any] | None = None
 
 
 class ESPNScheduleGame(BaseModel):
     """Individual game from schedule endpoint."""
 
-    model_config = ConfigDict(extra="ignore")
+    model_config = ConfigDict(extra="ignore", frozen=True)
 
     id: str
     date: str  # ISO datetime
-    name: Optional[str] = None
-    shortName: Optional[str] = None
-    competitions: List[Dict[str, Any]] = Field(default_factory=list)
+    name: str | None = None
+    shortName: str | None = None
+    competitions: list[dict[str, Any]] = Field(default_factory=list)
+
+    # Parsed competitors, shared by get_home_team/get_away_team
+    _competitors: list[ESPNGameCompetitor] | None = PrivateAttr(default=None)
+    _home_away: HomeAway | None = PrivateAttr(default=None)
 
     def get_event_id(self) -> str:
         """Get event ID."""
@@ -472,37 +791,50 @@ class ESPNScheduleGame(BaseModel):
         """Get kickoff datetime."""
         return self.date
 
-    def get_competitors(self) -> List[ESPNGameCompetitor]:
-        """Extract competitors from competitions."""
-        if self.competitions:
-            competitors_data = self.competitions[0].get("competitors", [])
-            return [ESPNGameCompetitor(**c) for c in competitors_data]
-        return []
+    def get_competitors(self) -> list[ESPNGameCompetitor]:
+        """
+        Extract competitors from competitions.
 
-    def get_home_team(self) -> Optional[ESPNGameCompetitor]:
+        Competitors are validated (so the nested team becomes an ESPNTeamRef)
+        once per game and reused.
+        """
+        if self._competitors is None:
+            competitors_data = (
+                self.competitions[0].get("competitors", []) if self.competitions else []
+            )
+            self._competitors = [
+                ESPNGameCompetitor.model_validate(c) for c in competitors_data
+            ]
+        return self._competitors
+
+    def _get_home_away(self) -> HomeAway:
+        if self._home_away is None:
+            self._home_away = _find_home_away(self.get_competitors())
+        return self._home_away
+
+    def get_home_team(self) -> ESPNGameCompetitor | None:
         """Get home team."""
-        for comp in self.get_competitors():
-            if comp.homeAway == "home" or comp.order == 2:
-                return comp
-        return None
+        return self._get_home_away()[0]
 
-    def get_away_team(self) -> Optional[ESPNGameCompetitor]:
+    def get_away_team(self) -> ESPNGameCompetitor | None:
         """Get away team."""
-        for comp in self.get_competitors():
-            if comp.homeAway == "away" or comp.order == 1:
-                return comp
-        return None
+        return self._get_home_away()[1]
 
 
 class ESPNScheduleResponse(BaseModel):
     """Response from schedule endpoint (cdn)."""
 
-    model_config = ConfigDict(extra="ignore")
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
+    content: dict[str, Any] = Field(default_factory=dict)
 
-    content: Dict[str, Any] = Field(default_factory=dict)
+    def get_games(self) -> list[ESPNScheduleGame]:
+        """
+        Extract games from schedule response.
 
-    def get_games(self) -> List[ESPNScheduleGame]:
-        """Extract games from schedule response."""
+        Games are built with model_construct (no validation): their fields are
+        plain values, and competitors are parsed lazily by get_competitors.
+        """
         games = []
         schedule = self.content.get("schedule", {})
 
@@ -511,26 +843,63 @@ class ESPNScheduleResponse(BaseModel):
             if isinstance(date_data, dict):
                 games_data = date_data.get("games", [])
                 for game_data in games_data:
-                    games.append(ESPNScheduleGame(**game_data))
+                    games.append(ESPNScheduleGame.model_construct(**game_data))
 
         return games
 
 
-class NormalizedGame(BaseModel):
-    """Normalized game data from either scoreboard or schedule endpoint."""
+@dataclass(slots=True, frozen=True, kw_only=True)
+class NormalizedGame:
+    """
+    Normalized game data from either scoreboard or schedule endpoint.
+
+    A plain dataclass rather than a pydantic model: it is only ever built by
+    ESPNClient from already-validated responses, so there is nothing to validate.
+    """
 
     event_id: str
     kickoff_utc: str  # ISO datetime
     home_team_id: str
-    home_team_name: Optional[str] = None
-    home_team_abbr: Optional[str] = None
-    home_score: Optional[str] = None
+    home_team_name: str | None = None
+    home_team_abbr: str | None = None
+    home_score: str | None = None
     away_team_id: str
-    away_team_name: Optional[str] = None
-    away_team_abbr: Optional[str] = None
-    away_score: Optional[str] = None
-    venue: Optional[str] = None
-    status: Optional[str] = None  # "scheduled", "in", "post"
+    away_team_name: str | None = None
+    away_team_abbr: str | None = None
+    away_score: str | None = None
+    venue: str | None = None
+    status: str | None = None  # "scheduled", "in", "post"
+
+    @classmethod
+    def from_competitors(
+        cls,
+        event_id: str,
+        kickoff_utc: str,
+        home: ESPNGameCompetitor,
+        away: ESPNGameCompetitor,
+        venue: str | None = None,
+        status: str | None = "scheduled",
+    ) -> "NormalizedGame":
+        """Build a game from its resolved home and away competitors."""
+        home_team, away_team = home.team, away.team
+        return cls(
+            event_id=event_id,
+            kickoff_utc=kickoff_utc,
+            home_team_id=home.id,
+            home_team_name=(
+                (home_team.displayName or home_team.name) if home_team else None
+            ),
+            home_team_abbr=home_team.abbreviation if home_team else None,
+            home_score=home.score,
+            away_team_id=away.id,
+            away_team_name=(
+                (away_team.displayName or away_team.name) if away_team else None
+            ),
+            away_team_abbr=away_team.abbreviation if away_team else None,
+            away_score=away.score,
+            venue=venue,
+            status=status,
+        )
 
     def get_summary(self) -> str:
         """Get a human-readable game summary."""
@@ -543,3 +912,24 @@ class NormalizedGame(BaseModel):
             return f"{away} {self.away_score} @ {home} {self.home_score} (In Progress)"
         else:
             return f"{away} @ {home}"
+
+
+def normalize_event(event: ESPNGameEvent) -> NormalizedGame | None:
+    """
+    Normalize a scoreboard event in one pass, or None if a side is missing.
+
+    Reads the home/away pair resolved at validation time and the venue/status
+    inline, instead of going through the per-field getters.
+    """
+    home, away = event._home_away
+    if home is None or away is None:
+        return None
+
+    return NormalizedGame.from_competitors(
+        event.id,
+        event.date,
+        home,
+        away,
+        venue=event.venue.fullName if event.venue else None,
+        status=event.status.type.state if event.status else "scheduled",
+    )
@@ -38,8 +38,12 @@ class ESPNSearchArticle(BaseModel):
                     players.append(player_desc)
         return players
 
-    def get_descriptions(self) -> str:
-        return f"Article ID: {self.id}, Headline: {self.headline}, Description: {self.description}, Published: {self.published}"
+    def get_descriptions(self, max_description_chars: int = 280) -> str:
+        # Keep each candidate short so the whole list fits in one relevance prompt
+        description = self.description
+        if description and len(description) > max_description_chars:
+            description = description[:max_description_chars].rstrip() + "..."
+        return f"Article ID: {self.id}, Headline: {self.headline}, Description: {description}, Published: {self.published}"
 
 
 class ESPNSearchResponse(BaseModel):
@@ -0,0 +1,17 @@
+from pydantic import BaseModel
+from pydantic import Field
+from typing import Optional
+
+
+# Kept in its own module so espn_responses can import it without a cycle
+# (stats.py imports ESPNStat from espn_responses)
+class Stat(BaseModel):
+    """Individual stat with all ESPN metadata."""
+
+    display_name: str = Field(description="Human-readable stat name")
+    description: str = Field(description="Stat description")
+    value: float = Field(description="Stat value")
+    per_game_value: Optional[float] = Field(
+        default=None, description="Per-game stat value"
+    )
+    rank: Optional[int] = Field(default=None, description="League rank for this stat")
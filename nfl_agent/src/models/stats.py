@@ -4,24 +4,13 @@ from typing import Literal
 from typing import List
 from typing import Optional
 from nfl_agent.src.models.espn_responses import ESPNStat
+from nfl_agent.src.models.stat import Stat
 
 
 # break out players into separate classes for each position class
 # track minimal stats needed to get player value
 # ref: https://www.espn.com/nfl/statistics/glossary.html
 #
-class Stat(BaseModel):
-    """Individual stat with all ESPN metadata."""
-
-    display_name: str = Field(description="Human-readable stat name")
-    description: str = Field(description="Stat description")
-    value: float = Field(description="Stat value")
-    per_game_value: Optional[float] = Field(
-        default=None, description="Per-game stat value"
-    )
-    rank: Optional[int] = Field(default=None, description="League rank for this stat")
-
-
 class Player(BaseModel):
     name: str
     team: str
@@ -1,18 +1,17 @@
 from nfl_agent.src.tools.article_fetcher.state import TeamArticleQueryState
-from nfl_agent.src.tools.article_fetcher.nodes import node_combine_team_info
 from nfl_agent.src.tools.article_fetcher.tool import (
     search_nfl,
     create_team_article_query_graph,
 )
-from nfl_agent.src.tools.article_fetcher.utils import fetch_article_content
-
-combine_team_info = node_combine_team_info
+from nfl_agent.src.tools.article_fetcher.utils import (
+    afetch_article_content,
+    fetch_article_content,
+)
 
 __all__ = [
     "TeamArticleQueryState",
-    "combine_team_info",
-    "node_combine_team_info",
     "search_nfl",
     "create_team_article_query_graph",
     "fetch_article_content",
+    "afetch_article_content",
 ]
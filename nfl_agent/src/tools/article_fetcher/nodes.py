@@ -1,15 +1,39 @@
+import asyncio
+
+from nfl_agent.src.models.espn_search import TeamInfo
 from nfl_agent.src.tools.article_fetcher.state import TeamArticleQueryState
 from nfl_agent.src.tools.article_fetcher.utils import (
     fetch_articles_for_team,
-    select_relevant_article,
-    fetch_article_content,
-    summarize_article_content,
+    select_relevant_articles,
+    fetch_and_summarize_articles,
     combine_team_info_logic,
 )
 
 MIN_ARTICLES_TO_READ = 5
 MAX_ARTICLES_TO_READ = 10
 
+# TeamInfo fields that must be populated before we stop reading; bit i of the
+# state's completeness_mask is set once field i is non-empty
+REQUIRED_TEAM_INFO_FIELDS = (
+    "coaching_summary",
+    "injuries",
+    "strengths",
+    "problem_areas",
+    "relevant_players",
+)
+COMPLETE_MASK = (1 << len(REQUIRED_TEAM_INFO_FIELDS)) - 1
+
+
+def completeness_mask(team_info: TeamInfo | None) -> int:
+    """Bitmask of the required TeamInfo fields that are populated."""
+    if team_info is None:
+        return 0
+    mask = 0
+    for bit, field in enumerate(REQUIRED_TEAM_INFO_FIELDS):
+        if getattr(team_info, field):
+            mask |= 1 << bit
+    return mask
+
 
 def node_get_list_of_articles(state: TeamArticleQueryState) -> dict:
     if state.get("articles") is not None:
@@ -24,46 +48,55 @@ def node_get_list_of_articles(state: TeamArticleQueryState) -> dict:
     }
 
 
-def node_get_article_relevance(state: TeamArticleQueryState) -> dict:
-    selected_article = select_relevant_article(state["team_name"], state["articles"])
-    remaining_articles = (
-        [a for a in state["articles"] if a.id != selected_article.id]
-        if selected_article
-        else state["articles"]
-    )
-    return {"selected_article": selected_article, "articles": remaining_articles}
-
+def node_select_articles(state: TeamArticleQueryState) -> dict:
+    """
+    Pick the next batch of articles to read with one relevance call.
 
-def should_fetch_article(state: TeamArticleQueryState) -> str:
-    if state["selected_article"] is None:
-        return "skip"
-    return "fetch"
+    The first batch covers MIN_ARTICLES_TO_READ so they can be read
+    concurrently; after that, articles are read one at a time until the team
+    info is complete.
+    """
+    articles = state["articles"]
+    if not articles:
+        return {"selected_articles": [], "articles": articles}
 
+    batch_size = max(MIN_ARTICLES_TO_READ - state["articles_read_count"], 1)
+    selected_articles = select_relevant_articles(
+        state["team_name"], articles, batch_size
+    )
+    selected_ids = {a.id for a in selected_articles}
+    remaining_articles = [a for a in articles if a.id not in selected_ids]
+    return {"selected_articles": selected_articles, "articles": remaining_articles}
 
-def node_fetch_article_content(
-    state: TeamArticleQueryState, max_length: int = 5000
-) -> dict:
-    article = state["selected_article"]
-    article_url = article.get_web_url()
-    content = fetch_article_content(article_url, max_length)
-    return {"article_content": content}
 
+def should_read_articles(state: TeamArticleQueryState) -> str:
+    if not state["selected_articles"]:
+        return "skip"
+    return "read"
 
-def node_summarize_article_content(state: TeamArticleQueryState) -> dict:
-    result = summarize_article_content(state["team_name"], state["article_content"])
-    return {"new_team_info": result}
 
+def node_read_articles(state: TeamArticleQueryState, max_length: int = 5000) -> dict:
+    """Fetch and summarize the selected articles concurrently, then merge them."""
+    summaries = asyncio.run(
+        fetch_and_summarize_articles(
+            state["team_name"], state["selected_articles"], max_length
+        )
+    )
 
-def node_combine_team_info(state: TeamArticleQueryState) -> dict:
-    old_team_info = state["team_info"]
-    new_team_info = state["new_team_info"]
-    articles_read_count = state["articles_read_count"] + 1
+    team_info = state["team_info"]
+    for summary in summaries:
+        team_info = combine_team_info_logic(team_info, summary)
 
-    updated_team_info = combine_team_info_logic(old_team_info, new_team_info)
+    articles_read_count = state["articles_read_count"] + len(summaries)
     print(
         f"updated team info for {state['team_name']}. Articles read: {articles_read_count}"
     )
-    return {"team_info": updated_team_info, "articles_read_count": articles_read_count}
+    return {
+        "team_info": team_info,
+        "articles_read_count": articles_read_count,
+        "completeness_mask": state.get("completeness_mask", 0)
+        | completeness_mask(team_info),
+    }
 
 
 def should_continue(state: TeamArticleQueryState) -> str:
@@ -75,19 +108,7 @@ def should_continue(state: TeamArticleQueryState) -> str:
     if articles_read_count > MAX_ARTICLES_TO_READ:
         return "end"
 
-    team_info = state["team_info"]
-    if team_info is None:
-        return "continue"
-
-    if team_info.coaching_summary is None:
-        return "continue"
-    if team_info.injuries is None or len(team_info.injuries) == 0:
-        return "continue"
-    if team_info.strengths is None or len(team_info.strengths) == 0:
-        return "continue"
-    if team_info.problem_areas is None or len(team_info.problem_areas) == 0:
-        return "continue"
-    if team_info.relevant_players is None or len(team_info.relevant_players) == 0:
+    if state.get("completeness_mask", 0) != COMPLETE_MASK:
         return "continue"
 
     return "end"
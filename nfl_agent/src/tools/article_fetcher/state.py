@@ -7,7 +7,7 @@ class TeamArticleQueryState(TypedDict):
     team_id: int
     team_info: TeamInfo
     articles: Optional[List[ESPNSearchArticle]]
-    selected_article: Optional[ESPNSearchArticle]
-    article_content: Optional[str]
-    new_team_info: Optional[TeamInfo]
+    selected_articles: Optional[List[ESPNSearchArticle]]
     articles_read_count: int
+    # Bitmask of populated required TeamInfo fields, see nodes.completeness_mask
+    completeness_mask: int
@@ -1,13 +1,15 @@
+import threading
+from functools import lru_cache
+from typing import Optional
+
 from langchain_core.tools import tool
 from langgraph.graph import StateGraph, END
 from nfl_agent.src.tools.article_fetcher.state import TeamArticleQueryState
 from nfl_agent.src.tools.article_fetcher.nodes import (
     node_get_list_of_articles,
-    node_get_article_relevance,
-    node_fetch_article_content,
-    node_summarize_article_content,
-    node_combine_team_info,
-    should_fetch_article,
+    node_select_articles,
+    node_read_articles,
+    should_read_articles,
     should_continue,
 )
 from nfl_agent.src.models.espn_search import TeamInfo
@@ -18,28 +20,23 @@ def create_team_article_query_graph():
     workflow = StateGraph(TeamArticleQueryState)
 
     workflow.add_node("get_articles", node_get_list_of_articles)
-    workflow.add_node("select_article", node_get_article_relevance)
-    workflow.add_node("fetch_content", node_fetch_article_content)
-    workflow.add_node("summarize_content", node_summarize_article_content)
-    workflow.add_node("combine_team_info", node_combine_team_info)
+    workflow.add_node("select_articles", node_select_articles)
+    workflow.add_node("read_articles", node_read_articles)
 
     workflow.set_entry_point("get_articles")
-    workflow.add_edge("get_articles", "select_article")
+    workflow.add_edge("get_articles", "select_articles")
 
     workflow.add_conditional_edges(
-        "select_article",
-        should_fetch_article,
+        "select_articles",
+        should_read_articles,
         {
-            "fetch": "fetch_content",
+            "read": "read_articles",
             "skip": END,
         },
     )
 
-    workflow.add_edge("fetch_content", "summarize_content")
-    workflow.add_edge("summarize_content", "combine_team_info")
-
     workflow.add_conditional_edges(
-        "combine_team_info",
+        "read_articles",
         should_continue,
         {
             "continue": "get_articles",
@@ -50,7 +47,31 @@ def create_team_article_query_graph():
     return workflow.compile()
 
 
-_team_article_query_graph = create_team_article_query_graph()
+_thread_local = threading.local()
+
+
+def _get_graph():
+    """Compiled article query graph for the current thread, built on first use."""
+    graph = getattr(_thread_local, "graph", None)
+    if graph is None:
+        graph = _thread_local.graph = create_team_article_query_graph()
+    return graph
+
+
+# Compile for the importing thread up front, so the first call doesn't pay for it
+_get_graph()
+
+
+@lru_cache(maxsize=1)
+def _get_client() -> ESPNClient:
+    """Shared client, so its team mapping is fetched once per process."""
+    return ESPNClient()
+
+
+@lru_cache(maxsize=64)
+def _get_team_id(team_name: str) -> Optional[str]:
+    """Team name -> ESPN ID; teams are a closed set, so cache for the process."""
+    return _get_client().get_team_id(team_name)
 
 
 @tool
@@ -63,20 +84,18 @@ def search_nfl(team_name: str) -> TeamInfo:
     Returns:
         TeamInfo: The team information including the articles and the most relevant facts.
     """
-    client = ESPNClient()
-    team_id = client.get_team_id(team_name)
+    team_id = _get_team_id(team_name)
     initial_state: TeamArticleQueryState = {
         "team_name": team_name,
         "team_id": team_id,
         "team_info": None,
         "articles": None,
-        "selected_article": None,
-        "article_content": None,
-        "new_team_info": None,
+        "selected_articles": None,
         "articles_read_count": 0,
+        "completeness_mask": 0,
     }
 
-    final_state = _team_article_query_graph.invoke(
+    final_state = _get_graph().invoke(
         initial_state,
         # high recursion limit because we ar querying two teams at once
         {"recursion_limit": 100},
@@ -1,13 +1,17 @@
+import asyncio
+import atexit
 import logging
 import httpx
 import trafilatura
 import re
 from typing import List, Optional
+from cachetools.func import ttl_cache
 from nfl_agent.src.models.espn_search import TeamInfo, ESPNSearchArticle
 from nfl_agent.src.utils.espn_client import ESPNClient
+from nfl_agent.src.utils.http_cache import DEFAULT_CACHE_DIR
+from nfl_agent.src.utils.llm_cache import LLMCache
 from nfl_agent.src.utils.settings import get_setting, LLMSettings, get_chat_model
-from langchain.messages import SystemMessage, HumanMessage
-from nfl_agent.prompts.article_relevance.v2 import (
+from nfl_agent.prompts.article_relevance.v3 import (
     ArticleRelevanceResponse,
     SYSTEM_PROMPT as ARTICLE_RELEVANCE_SYSTEM_PROMPT,
     USER_PROMPT as ARTICLE_RELEVANCE_USER_PROMPT,
@@ -26,30 +30,101 @@ from openai import RateLimitError
 
 logger = logging.getLogger(__name__)
 
+# Summaries and relevance picks keyed by (model, prompt, content); the prompts
+# are part of the key, so editing a prompt invalidates its entries
+LLM_CACHE_DIR = DEFAULT_CACHE_DIR / "llm"
 
-def _clean_article_text(text: str) -> str:
-    text = re.sub(r"\n{3,}", "\n\n", text)
+# How long a team's article list is reused in-process, in seconds
+ARTICLES_TTL = 5 * 60
 
-    boilerplate_patterns = [
+
+def get_llm_cache(settings: LLMSettings) -> LLMCache:
+    return LLMCache(LLM_CACHE_DIR, settings.llm_model_name, settings.temperature)
+
+
+def build_summarizer_messages(team_name: str, article_content: str) -> list[dict]:
+    return [
+        {"role": "system", "content": ARTICLE_SUMMARIZER_SYSTEM_PROMPT},
+        {
+            "role": "user",
+            "content": ARTICLE_SUMMARIZER_USER_PROMPT.format(
+                team_name=team_name, article_content=article_content
+            ),
+        },
+    ]
+
+
+_EXTRA_NEWLINES_RE = re.compile(r"\n{3,}")
+_EXTRA_SPACES_RE = re.compile(r" {2,}")
+_BOILERPLATE_RES = tuple(
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
         r"Share this article.*?\n",
         r"Follow.*?on Twitter.*?\n",
         r"ESPN\+.*?subscribe.*?\n",
         r"Advertisement\n",
-    ]
-    for pattern in boilerplate_patterns:
-        text = re.sub(pattern, "", text, flags=re.IGNORECASE)
+    )
+)
+
+
+def _dedupe_lines(text: str) -> str:
+    """Drop repeated non-blank lines (captions, pull quotes, related links)."""
+    seen = set()
+    lines = []
+    for line in text.split("\n"):
+        stripped = line.strip()
+        if stripped:
+            if stripped in seen:
+                continue
+            seen.add(stripped)
+        lines.append(line)
+    return "\n".join(lines)
 
-    text = re.sub(r" {2,}", " ", text)
+
+def clean_article_text(text: str) -> str:
+    text = _dedupe_lines(text)
+    text = _EXTRA_NEWLINES_RE.sub("\n\n", text)
+
+    for pattern in _BOILERPLATE_RES:
+        text = pattern.sub("", text)
+
+    text = _EXTRA_SPACES_RE.sub(" ", text)
 
     return text.strip()
 
 
-def fetch_articles_for_team(team_id: int) -> List[ESPNSearchArticle]:
+@ttl_cache(maxsize=64, ttl=ARTICLES_TTL)
+def _fetch_articles_for_team(team_id: int) -> tuple[ESPNSearchArticle, ...]:
     client = ESPNClient()
     articles = client.search_nfl(team_id=team_id).articles
     if not articles:
         logger.warning(f"No articles found for team_id={team_id}")
-    return articles
+    return tuple(articles)
+
+
+def fetch_articles_for_team(team_id: int) -> List[ESPNSearchArticle]:
+    # Fresh list per call so callers can't mutate the cached result
+    return list(_fetch_articles_for_team(team_id))
+
+
+async def afetch_articles_for_teams(
+    team_ids: List[int], max_concurrency: int = 8
+) -> List[List[ESPNSearchArticle] | BaseException]:
+    """
+    Fetch article lists for several teams concurrently.
+
+    Results are in the order of team_ids; a team whose fetch failed gets its
+    exception instead of a list.
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def _fetch(team_id: int) -> List[ESPNSearchArticle]:
+        async with semaphore:
+            return await asyncio.to_thread(fetch_articles_for_team, team_id)
+
+    return await asyncio.gather(
+        *(_fetch(team_id) for team_id in team_ids), return_exceptions=True
+    )
 
 
 @retry(
@@ -60,42 +135,80 @@ def fetch_articles_for_team(team_id: int) -> List[ESPNSearchArticle]:
         f"Rate limited, waiting {retry_state.next_action.sleep:.1f}s before retry {retry_state.attempt_number}/5..."
     ),
 )
-def select_relevant_article(
-    team_name: str, articles: List[ESPNSearchArticle]
-) -> ESPNSearchArticle:
+def select_relevant_articles(
+    team_name: str, articles: List[ESPNSearchArticle], count: int = 1
+) -> List[ESPNSearchArticle]:
+    """
+    Pick up to count articles to read, most relevant first, in one LLM call.
+
+    IDs the model returns that are unknown or repeated are dropped.
+    """
     article_relevance_settings = get_setting(LLMSettings)
     article_relevance_model = get_chat_model(article_relevance_settings)
     article_relevance_model = article_relevance_model.with_structured_output(
         ArticleRelevanceResponse
     )
-    result = article_relevance_model.invoke(
-        [
-            SystemMessage(content=ARTICLE_RELEVANCE_SYSTEM_PROMPT),
-            HumanMessage(
-                content=ARTICLE_RELEVANCE_USER_PROMPT.format(
-                    team_name=team_name,
-                    articles="\n\n".join(
-                        [article.get_descriptions() for article in articles]
-                    ),
-                )
+    messages = [
+        {
+            "role": "system",
+            "content": ARTICLE_RELEVANCE_SYSTEM_PROMPT.format(count=count),
+        },
+        {
+            "role": "user",
+            "content": ARTICLE_RELEVANCE_USER_PROMPT.format(
+                team_name=team_name,
+                articles="\n\n".join(
+                    [article.get_descriptions() for article in articles]
+                ),
             ),
-        ]
+        },
+    ]
+    result = get_llm_cache(article_relevance_settings).cached_invoke(
+        article_relevance_model, messages, ArticleRelevanceResponse
+    )
+    articles_by_id = {article.id: article for article in articles}
+    selected_ids = dict.fromkeys(
+        article_id for article_id in result.article_ids if article_id in articles_by_id
     )
-    return next((article for article in articles if article.id == result.article_id))
+    return [articles_by_id[article_id] for article_id in list(selected_ids)[:count]]
+
+
+ARTICLE_REQUEST_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
+    "Accept": "text/html,application/xhtml+xml",
+    "Accept-Language": "en-US,en;q=0.9",
+}
+ARTICLE_REQUEST_LIMITS = httpx.Limits(max_keepalive_connections=20, max_connections=100)
+
+# Shared so repeated fetches from the same hosts reuse pooled connections
+_article_client = httpx.Client(
+    headers=ARTICLE_REQUEST_HEADERS,
+    timeout=10.0,
+    follow_redirects=True,
+    limits=ARTICLE_REQUEST_LIMITS,
+)
+atexit.register(_article_client.close)
 
 
 def fetch_article_content(article_url: str, max_length: int = 5000) -> str:
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
-        "Accept": "text/html,application/xhtml+xml",
-        "Accept-Language": "en-US,en;q=0.9",
-    }
-    response = httpx.get(
-        article_url, headers=headers, timeout=10.0, follow_redirects=True
+    response = _article_client.get(article_url)
+    response.raise_for_status()
+    return _extract_article_content(response.text, max_length)
+
+
+async def afetch_article_content(
+    client: httpx.AsyncClient, article_url: str, max_length: int = 5000
+) -> str:
+    """Async variant of fetch_article_content using a shared AsyncClient."""
+    response = await client.get(
+        article_url, headers=ARTICLE_REQUEST_HEADERS, follow_redirects=True
     )
     response.raise_for_status()
-    html = response.text
+    # Extraction is CPU-bound, keep it off the event loop
+    return await asyncio.to_thread(_extract_article_content, response.text, max_length)
 
+
+def _extract_article_content(html: str, max_length: int) -> str:
     content = trafilatura.extract(
         html, include_comments=False, include_tables=True, no_fallback=False
     )
@@ -103,7 +216,7 @@ def fetch_article_content(article_url: str, max_length: int = 5000) -> str:
     if not content:
         raise ValueError("Failed to extract content from article")
 
-    content = _clean_article_text(content)
+    content = clean_article_text(content)
 
     if len(content) > max_length:
         content = (
@@ -127,19 +240,69 @@ def summarize_article_content(team_name: str, article_content: str) -> TeamInfo:
     article_summarization_model = article_summarization_model.with_structured_output(
         TeamInfo
     )
-    result: TeamInfo = article_summarization_model.invoke(
-        [
-            SystemMessage(content=ARTICLE_SUMMARIZER_SYSTEM_PROMPT),
-            HumanMessage(
-                content=ARTICLE_SUMMARIZER_USER_PROMPT.format(
-                    team_name=team_name, article_content=article_content
-                )
-            ),
-        ]
+    result: TeamInfo = get_llm_cache(article_summarization_settings).cached_invoke(
+        article_summarization_model,
+        build_summarizer_messages(team_name, article_content),
+        TeamInfo,
     )
     return result
 
 
+@retry(
+    retry=retry_if_exception_type(RateLimitError),
+    wait=wait_exponential(multiplier=1, min=2, max=60),
+    stop=stop_after_attempt(5),
+    before_sleep=lambda retry_state: print(
+        f"Rate limited, waiting {retry_state.next_action.sleep:.1f}s before retry {retry_state.attempt_number}/5..."
+    ),
+)
+async def asummarize_article_content(team_name: str, article_content: str) -> TeamInfo:
+    """Async variant of summarize_article_content."""
+    article_summarization_settings = get_setting(LLMSettings)
+    article_summarization_model = get_chat_model(article_summarization_settings)
+    article_summarization_model = article_summarization_model.with_structured_output(
+        TeamInfo
+    )
+    return await get_llm_cache(article_summarization_settings).acached_invoke(
+        article_summarization_model,
+        build_summarizer_messages(team_name, article_content),
+        TeamInfo,
+    )
+
+
+async def fetch_and_summarize_articles(
+    team_name: str, articles: List[ESPNSearchArticle], max_length: int = 5000
+) -> List[TeamInfo]:
+    """
+    Fetch and summarize articles concurrently.
+
+    Articles that fail to fetch or summarize are logged and skipped; the
+    summaries that succeed are returned in the order of articles.
+    """
+
+    async def _fetch_and_summarize(
+        client: httpx.AsyncClient, article: ESPNSearchArticle
+    ) -> TeamInfo:
+        content = await afetch_article_content(
+            client, article.get_web_url(), max_length
+        )
+        return await asummarize_article_content(team_name, content)
+
+    async with httpx.AsyncClient(timeout=10.0, limits=ARTICLE_REQUEST_LIMITS) as client:
+        results = await asyncio.gather(
+            *(_fetch_and_summarize(client, article) for article in articles),
+            return_exceptions=True,
+        )
+
+    summaries = []
+    for article, result in zip(articles, results):
+        if isinstance(result, Exception):
+            logger.warning("Skipping article %s: %s", article.id, result)
+            continue
+        summaries.append(result)
+    return summaries
+
+
 def _is_empty(value) -> bool:
     if value is None:
         return True
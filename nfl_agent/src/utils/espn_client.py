@@ -1,9 +1,11 @@
 """ESPN API client for fetching NFL team and player data."""
 
 import asyncio
+from functools import cached_property
 from typing import Any, Dict, List, Optional
 from datetime import datetime
 import httpx
+import orjson
 from tenacity import retry, stop_after_attempt, wait_exponential
 
 
@@ -15,9 +17,11 @@ from nfl_agent.src.models.espn_responses import (
     ESPNScoreboardResponse,
     ESPNScheduleResponse,
     NormalizedGame,
+    normalize_event,
 )
-from nfl_agent.src.models.espn_search import ESPNSearchResponse, ESPNSearchArticle
+from nfl_agent.src.models.espn_search import ESPNSearchResponse
 from nfl_agent.src.utils.client_protocol import StatsClientProtocol
+from nfl_agent.src.utils.http_cache import cached
 
 
 class ESPNClient(StatsClientProtocol):
@@ -28,6 +32,14 @@ class ESPNClient(StatsClientProtocol):
     SEARCH_API_URL = "https://site.web.api.espn.com/apis/search/v2"
     CDN_API_URL = "https://cdn.espn.com/core/nfl"
 
+    # On-disk response cache lifetimes, in seconds
+    ODDS_CACHE_TTL = 60 * 60
+    GAMES_CACHE_TTL = 60 * 60
+    # The scoreboard carries live scores and game status, so keep it short
+    SCOREBOARD_CACHE_TTL = 60
+    NEWS_CACHE_TTL = 60 * 60
+    TEAM_MAPPING_CACHE_TTL = 7 * 24 * 60 * 60
+
     def __init__(
         self,
         timeout: float = 10.0,
@@ -41,7 +53,6 @@ class ESPNClient(StatsClientProtocol):
         self.backoff_multiplier = backoff_multiplier
         self.season = season
         self.season_type = season_type
-        self._team_name_to_id: Optional[Dict[str, str]] = None
 
     def _make_retry_decorator(self):
         """Create retry decorator with configured settings."""
@@ -51,21 +62,42 @@ class ESPNClient(StatsClientProtocol):
             reraise=True,
         )
 
-    def _get_core_api(self, endpoint: str) -> Dict[str, Any]:
-        """Make a request to the Core API."""
+    def _get_bytes(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        cache_ttl: Optional[float] = None,
+    ) -> bytes:
+        """GET an endpoint's raw body with retries, through the disk cache if cache_ttl is set."""
 
         @self._make_retry_decorator()
-        def _request():
+        def _request(url: str, params: Optional[Dict[str, Any]] = None) -> bytes:
             with httpx.Client(timeout=self.timeout) as client:
-                url = f"{self.CORE_API_URL}/{endpoint}"
-                response = client.get(url)
+                response = client.get(url, params=params or {})
                 response.raise_for_status()
-                return response.json()
+                return response.content
+
+        if cache_ttl:
+            _request = cached(ttl=cache_ttl)(_request)
+        return _request(url, params)
+
+    def _get_json(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        cache_ttl: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """GET a JSON endpoint and decode it into Python objects."""
+        return orjson.loads(self._get_bytes(url, params=params, cache_ttl=cache_ttl))
 
-        return _request()
+    def _get_core_api(
+        self, endpoint: str, cache_ttl: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """Make a request to the Core API."""
+        return self._get_json(f"{self.CORE_API_URL}/{endpoint}", cache_ttl=cache_ttl)
 
-    async def _get_core_api_async(self, endpoint: str) -> Dict[str, Any]:
-        """Make an async request to the Core API."""
+    async def _get_core_api_async(self, endpoint: str) -> bytes:
+        """Make an async request to the Core API, returning the raw body."""
 
         @self._make_retry_decorator()
         async def _request():
@@ -73,60 +105,57 @@ class ESPNClient(StatsClientProtocol):
                 url = f"{self.CORE_API_URL}/{endpoint}"
                 response = await client.get(url)
                 response.raise_for_status()
-                return response.json()
+                return response.content
 
         return await _request()
 
     def _get_site_api(
-        self, endpoint: str, params: Optional[Dict[str, Any]] = None
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        cache_ttl: Optional[float] = None,
     ) -> Dict[str, Any]:
         """Make a request to the Site API."""
-
-        @self._make_retry_decorator()
-        def _request():
-            with httpx.Client(timeout=self.timeout) as client:
-                url = f"{self.SITE_API_URL}/{endpoint}"
-                response = client.get(url, params=params or {})
-                response.raise_for_status()
-                return response.json()
-
-        return _request()
+        return self._get_json(
+            f"{self.SITE_API_URL}/{endpoint}", params=params, cache_ttl=cache_ttl
+        )
 
     def _get_cdn_api(
-        self, endpoint: str, params: Optional[Dict[str, Any]] = None
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        cache_ttl: Optional[float] = None,
     ) -> Dict[str, Any]:
         """Make a request to the CDN API."""
+        return self._get_json(
+            f"{self.CDN_API_URL}/{endpoint}", params=params, cache_ttl=cache_ttl
+        )
 
-        @self._make_retry_decorator()
-        def _request():
-            with httpx.Client(timeout=self.timeout) as client:
-                url = f"{self.CDN_API_URL}/{endpoint}"
-                response = client.get(url, params=params or {})
-                response.raise_for_status()
-                return response.json()
-
-        return _request()
+    # Typed responses are validated straight from the raw body where possible,
+    # which skips building an intermediate dict. The large athlete and depth
+    # chart payloads are trusted instead, and built without validation via
+    # from_espn.
 
     def get_team_info(self, team_id: str) -> ESPNTeamResponse:
         endpoint = f"seasons/{self.season}/teams/{team_id}"
         data = self._get_core_api(endpoint)
-        return ESPNTeamResponse(**data)
+        # The core API returns the team at the root; the model nests it
+        if "team" not in data and "displayName" in data:
+            data = {"team": data}
+        return ESPNTeamResponse.model_validate(data)
 
     def get_team_depth_chart(self, team_id: str) -> ESPNDepthChartResponse:
         endpoint = f"seasons/{self.season}/teams/{team_id}/depthcharts"
-        data = self._get_core_api(endpoint)
-        return ESPNDepthChartResponse(**data)
+        return ESPNDepthChartResponse.from_espn(self._get_core_api(endpoint))
 
-    def _load_team_mapping(self) -> Dict[str, str]:
+    @cached_property
+    def team_mapping(self) -> Dict[str, str]:
         """
-        Fetch and cache the mapping of team display names to IDs.
+        Mapping of team display names to IDs, fetched once per client.
 
         Uses endpoint: https://site.api.espn.com/apis/site/v2/sports/football/nfl/teams
         """
-        if self._team_name_to_id is not None:
-            return self._team_name_to_id
-
-        data = self._get_site_api("teams")
+        data = self._get_site_api("teams", cache_ttl=self.TEAM_MAPPING_CACHE_TTL)
 
         team_mapping: Dict[str, str] = {}
 
@@ -143,7 +172,6 @@ class ESPNClient(StatsClientProtocol):
                     if team_id and display_name:
                         team_mapping[display_name] = team_id
 
-        self._team_name_to_id = team_mapping
         return team_mapping
 
     def get_team_id(self, team_name: str) -> Optional[str]:
@@ -160,24 +188,23 @@ class ESPNClient(StatsClientProtocol):
             client.get_team_id("Arizona Cardinals")  # Returns "22"
             client.get_team_id("Philadelphia Eagles")  # Returns "21"
         """
-        team_mapping = self._load_team_mapping()
-        return team_mapping.get(team_name)
+        return self.team_mapping.get(team_name)
 
     async def get_athlete_info_async(self, athlete_id: str) -> ESPNAthleteResponse:
         endpoint = f"seasons/{self.season}/athletes/{athlete_id}"
-        data = await self._get_core_api_async(endpoint)
-        return ESPNAthleteResponse(**data)
+        raw = await self._get_core_api_async(endpoint)
+        return ESPNAthleteResponse.from_espn(orjson.loads(raw))
 
     async def get_athlete_stats_async(self, athlete_id: str) -> ESPNStatisticsResponse:
         try:
             endpoint = f"seasons/{self.season}/types/{self.season_type}/athletes/{athlete_id}/statistics/0"
-            data = await self._get_core_api_async(endpoint)
-            return ESPNStatisticsResponse(**data)
+            raw = await self._get_core_api_async(endpoint)
+            return ESPNStatisticsResponse.from_espn(orjson.loads(raw))
         except httpx.HTTPStatusError as e:
             if e.response.status_code == 404:
                 endpoint = f"athletes/{athlete_id}/statistics/0"
-                data = await self._get_core_api_async(endpoint)
-                return ESPNStatisticsResponse(**data)
+                raw = await self._get_core_api_async(endpoint)
+                return ESPNStatisticsResponse.from_espn(orjson.loads(raw))
             else:
                 raise e
 
@@ -278,53 +305,42 @@ class ESPNClient(StatsClientProtocol):
             client.search_nfl()
         """
 
-        @self._make_retry_decorator()
-        def _search():
-            params = {
-                "limit": max_articles,
-            }
-            if team_id is not None:
-                params["team"] = team_id
-
-            with httpx.Client(timeout=self.timeout) as client:
-                # ESPN NFL News API endpoint
-                url = f"{self.SITE_API_URL}/news"
-                response = client.get(url, params=params)
-                response.raise_for_status()
-                data = response.json()
-
-                # Parse articles from response
-                articles_data = data.get("articles", [])
-
-                # Exclude "Media" type articles by default
-                articles_data = [a for a in articles_data if a.get("type") != "Media"]
-                # if search_before is provided, filter articles before that date
-                if search_before:
-
-                    def _is_before_search_before(article):
-                        published = article.get("published")
-                        if not published:
-                            return False
-                        dt = datetime.fromisoformat(published)
-                        # Make both datetimes naive (UTC) or both aware (UTC)
-                        if dt.tzinfo is not None and search_before.tzinfo is None:
-                            dt = dt.astimezone(tz=None).replace(tzinfo=None)
-                        elif dt.tzinfo is None and search_before.tzinfo is not None:
-                            # Assume published is UTC if it's naive
-                            dt = dt.replace(tzinfo=search_before.tzinfo)
-                        return dt < search_before
-
-                    articles_data = [
-                        a for a in articles_data if _is_before_search_before(a)
-                    ]
-                # Parse into Pydantic models
-                articles = [ESPNSearchArticle(**a) for a in articles_data]
-
-                return ESPNSearchResponse(
-                    header=data.get("header", "NFL News"), articles=articles
-                )
-
-        return _search()
+        params = {
+            "limit": max_articles,
+        }
+        if team_id is not None:
+            params["team"] = team_id
+
+        # ESPN NFL News API endpoint
+        data = self._get_site_api("news", params=params, cache_ttl=self.NEWS_CACHE_TTL)
+
+        # Parse articles from response
+        articles_data = data.get("articles", [])
+
+        # Exclude "Media" type articles by default
+        articles_data = [a for a in articles_data if a.get("type") != "Media"]
+        # if search_before is provided, filter articles before that date
+        if search_before:
+
+            def _is_before_search_before(article):
+                published = article.get("published")
+                if not published:
+                    return False
+                dt = datetime.fromisoformat(published)
+                # Make both datetimes naive (UTC) or both aware (UTC)
+                if dt.tzinfo is not None and search_before.tzinfo is None:
+                    dt = dt.astimezone(tz=None).replace(tzinfo=None)
+                elif dt.tzinfo is None and search_before.tzinfo is not None:
+                    # Assume published is UTC if it's naive
+                    dt = dt.replace(tzinfo=search_before.tzinfo)
+                return dt < search_before
+
+            articles_data = [a for a in articles_data if _is_before_search_before(a)]
+        # Validate the whole response in one pydantic-core call rather than
+        # constructing each article from Python
+        return ESPNSearchResponse.model_validate(
+            {"header": data.get("header", "NFL News"), "articles": articles_data}
+        )
 
     def get_weekly_games(
         self,
@@ -393,8 +409,12 @@ class ESPNClient(StatsClientProtocol):
             "week": week,
         }
 
-        data = self._get_site_api("scoreboard", params=params)
-        scoreboard = ESPNScoreboardResponse(**data)
+        raw = self._get_bytes(
+            f"{self.SITE_API_URL}/scoreboard",
+            params=params,
+            cache_ttl=self.SCOREBOARD_CACHE_TTL,
+        )
+        scoreboard = ESPNScoreboardResponse.model_validate_json(raw)
 
         return self._normalize_games_from_scoreboard(scoreboard)
 
@@ -410,8 +430,12 @@ class ESPNClient(StatsClientProtocol):
             "week": week,
         }
 
-        data = self._get_cdn_api("schedule", params=params)
-        schedule = ESPNScheduleResponse(**data)
+        data = self._get_cdn_api(
+            "schedule", params=params, cache_ttl=self.GAMES_CACHE_TTL
+        )
+        # The schedule is one untyped dict, so validation would only re-walk it;
+        # games are built from it lazily by get_games
+        schedule = ESPNScheduleResponse.model_construct(content=data.get("content", {}))
 
         return self._normalize_games_from_schedule(schedule)
 
@@ -420,31 +444,10 @@ class ESPNClient(StatsClientProtocol):
     ) -> List[NormalizedGame]:
         """Normalize scoreboard response into standard game format."""
         games = []
-
         for event in scoreboard.events:
-            home_team = event.get_home_team()
-            away_team = event.get_away_team()
-
-            if not home_team or not away_team:
-                continue
-
-            normalized = NormalizedGame(
-                event_id=event.get_event_id(),
-                kickoff_utc=event.get_kickoff_datetime(),
-                home_team_id=home_team.get_team_id(),
-                home_team_name=home_team.get_team_name(),
-                home_team_abbr=home_team.get_team_abbr(),
-                home_score=home_team.score,
-                away_team_id=away_team.get_team_id(),
-                away_team_name=away_team.get_team_name(),
-                away_team_abbr=away_team.get_team_abbr(),
-                away_score=away_team.score,
-                venue=event.get_venue_name(),
-                status=event.status.get_state() if event.status else "scheduled",
-            )
-
-            games.append(normalized)
-
+            normalized = normalize_event(event)
+            if normalized is not None:
+                games.append(normalized)
         return games
 
     def _normalize_games_from_schedule(
@@ -460,23 +463,13 @@ class ESPNClient(StatsClientProtocol):
             if not home_team or not away_team:
                 continue
 
-            normalized = NormalizedGame(
-                event_id=game.get_event_id(),
-                kickoff_utc=game.get_kickoff_datetime(),
-                home_team_id=home_team.get_team_id(),
-                home_team_name=home_team.get_team_name(),
-                home_team_abbr=home_team.get_team_abbr(),
-                home_score=home_team.score,
-                away_team_id=away_team.get_team_id(),
-                away_team_name=away_team.get_team_name(),
-                away_team_abbr=away_team.get_team_abbr(),
-                away_score=away_team.score,
-                venue=None,  # Schedule endpoint doesn't include venue
-                status="scheduled",  # Schedule endpoint doesn't include status
+            # Schedule endpoint doesn't include venue or status
+            games.append(
+                NormalizedGame.from_competitors(
+                    game.id, game.date, home_team, away_team
+                )
             )
 
-            games.append(normalized)
-
         return games
 
     def get_game_summary(self, event_id: str) -> Dict[str, Any]:
@@ -523,16 +516,8 @@ class ESPNClient(StatsClientProtocol):
         """
         endpoint = f"events/{event_id}/competitions/{event_id}/odds"
 
-        @self._make_retry_decorator()
-        def _request():
-            with httpx.Client(timeout=self.timeout) as client:
-                url = f"{self.CORE_API_URL}/{endpoint}"
-                response = client.get(url)
-                response.raise_for_status()
-                return response.json()
-
         try:
-            data = _request()
+            data = self._get_core_api(endpoint, cache_ttl=self.ODDS_CACHE_TTL)
         except Exception as e:
             print(f"Failed to fetch odds for event {event_id}: {e}")
             return None
@@ -0,0 +1,67 @@
+"""On-disk TTL cache for JSON HTTP GET response bodies."""
+
+import functools
+import hashlib
+import os
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+from urllib.parse import urlsplit
+
+import orjson
+
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "nfl_agent"
+
+BodyFetcher = Callable[[str, Optional[Dict[str, Any]]], bytes]
+
+
+def cache_key(url: str, params: Optional[Dict[str, Any]] = None) -> str:
+    """Hash (domain, path, sorted params) into a stable cache key."""
+    parts = urlsplit(url)
+    payload = orjson.dumps(
+        [parts.netloc, parts.path, sorted((params or {}).items())],
+        default=str,
+    )
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
+def cached(
+    ttl: float, cache_dir: Path = DEFAULT_CACHE_DIR
+) -> Callable[[BodyFetcher], BodyFetcher]:
+    """
+    Cache a ``fetch(url, params)`` function's raw response body on disk.
+
+    Bodies are stored verbatim as ``cache_dir/<key>.json`` and considered fresh
+    for ``ttl`` seconds after they were written (based on file mtime). Keeping
+    the raw bytes lets callers hand them straight to ``model_validate_json``.
+
+    Args:
+        ttl: Seconds a cached response stays valid
+        cache_dir: Directory to store cached responses in
+
+    Returns:
+        Decorator for functions taking (url, params) and returning the body bytes
+    """
+
+    def decorator(fetch: BodyFetcher) -> BodyFetcher:
+        @functools.wraps(fetch)
+        def wrapper(url: str, params: Optional[Dict[str, Any]] = None) -> bytes:
+            path = cache_dir / f"{cache_key(url, params)}.json"
+            try:
+                if time.time() - path.stat().st_mtime < ttl:
+                    return path.read_bytes()
+            except FileNotFoundError:
+                pass
+
+            body = fetch(url, params)
+
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            # Write then rename so concurrent readers never see a partial file
+            tmp_path = path.with_suffix(f".{os.getpid()}.{time.monotonic_ns()}.tmp")
+            tmp_path.write_bytes(body)
+            tmp_path.replace(path)
+            return body
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,129 @@
+"""On-disk cache for deterministic structured LLM responses."""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Type, TypeVar
+
+from langchain_core.runnables import Runnable, RunnableLambda
+from pydantic import BaseModel
+
+
+TypeModel = TypeVar("TypeModel", bound=BaseModel)
+
+
+class LLMCache:
+    """Disk cache of structured LLM responses.
+
+    Responses are keyed by sha256 of (model, messages, output schema, temperature)
+    and stored as JSON under ``cache_dir/{key[:2]}/{key}.json``. Only useful for
+    deterministic calls (temperature 0), where a cached response is as good as a
+    fresh one.
+    """
+
+    def __init__(self, cache_dir: Path, model_name: str, temperature: float):
+        self.cache_dir = cache_dir
+        self.model_name = model_name
+        self.temperature = temperature
+        self.stats = {"hits": 0, "misses": 0}
+        self._lock = threading.Lock()
+
+    def make_key(
+        self,
+        messages: list[dict],
+        model_cls: Type[BaseModel],
+        model_name: str | None = None,
+    ) -> str:
+        """Build the cache key for a request.
+
+        model_name overrides the cache's default model, for callers that route
+        different requests to different models.
+        """
+        payload = json.dumps(
+            {
+                "model": model_name or self.model_name,
+                "messages": messages,
+                "schema": model_cls.model_json_schema(),
+                "temperature": self.temperature,
+            },
+            sort_keys=True,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def get(self, key: str, model_cls: Type[TypeModel]) -> TypeModel | None:
+        """Return the cached response for key, or None on a miss."""
+        path = self._path(key)
+        try:
+            result = model_cls.model_validate_json(path.read_bytes())
+        except (FileNotFoundError, ValueError):
+            result = None
+
+        with self._lock:
+            self.stats["hits" if result is not None else "misses"] += 1
+        return result
+
+    def put(self, key: str, result: BaseModel) -> None:
+        """Store a response under key."""
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Write then rename so concurrent readers never see a partial file; the
+        # cache dir is shared across processes, so the temp name includes the pid
+        tmp_path = path.with_suffix(f".{os.getpid()}.{time.monotonic_ns()}.tmp")
+        tmp_path.write_text(result.model_dump_json())
+        tmp_path.replace(path)
+
+    def cached_invoke(
+        self,
+        chain: Runnable,
+        messages: list[dict],
+        model_cls: Type[TypeModel],
+        model_name: str | None = None,
+    ) -> TypeModel:
+        """Invoke chain, serving the response from disk when available."""
+        key = self.make_key(messages, model_cls, model_name)
+        cached = self.get(key, model_cls)
+        if cached is not None:
+            return cached
+
+        result = chain.invoke(messages)
+        self.put(key, result)
+        return result
+
+    async def acached_invoke(
+        self,
+        chain: Runnable,
+        messages: list[dict],
+        model_cls: Type[TypeModel],
+        model_name: str | None = None,
+    ) -> TypeModel:
+        """Async variant of cached_invoke."""
+        key = self.make_key(messages, model_cls, model_name)
+        cached = self.get(key, model_cls)
+        if cached is not None:
+            return cached
+
+        result = await chain.ainvoke(messages)
+        self.put(key, result)
+        return result
+
+    def wrap(
+        self,
+        chain: Runnable,
+        model_cls: Type[BaseModel],
+        model_name: str | None = None,
+    ) -> Runnable:
+        """Wrap a structured output chain so invoke/ainvoke go through the cache."""
+
+        def _invoke(messages: list[dict]):
+            return self.cached_invoke(chain, messages, model_cls, model_name)
+
+        async def _ainvoke(messages: list[dict]):
+            return await self.acached_invoke(chain, messages, model_cls, model_name)
+
+        return RunnableLambda(_invoke, afunc=_ainvoke)
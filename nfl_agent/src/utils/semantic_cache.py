@@ -0,0 +1,116 @@
+"""Embedding-similarity cache for reusing LLM verdicts on near-duplicate queries."""
+
+import re
+import threading
+from pathlib import Path
+
+import numpy as np
+import orjson
+from langchain_core.embeddings import Embeddings
+
+
+class SemanticCache:
+    """Cache of structured LLM verdicts looked up by embedding similarity.
+
+    Entries are grouped by namespace (e.g. evaluation mode) and by the judging
+    model, so verdicts are never shared across modes or models. Vectors are
+    L2-normalized, so an inner product search is a cosine similarity search.
+    Each group is persisted as ``{namespace}_{model}.npy`` (vectors) and
+    ``{namespace}_{model}.jsonl`` (verdicts) under ``cache_dir``.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Path,
+        embeddings: Embeddings,
+        model_name: str,
+        threshold: float = 0.95,
+    ):
+        self.cache_dir = cache_dir
+        self.embeddings = embeddings
+        self.model_name = model_name
+        self.threshold = threshold
+        self.stats = {"hits": 0, "misses": 0}
+        self._vectors: dict[str, np.ndarray] = {}
+        self._values: dict[str, list[dict]] = {}
+        self._dirty: set[str] = set()
+        self._lock = threading.Lock()
+
+    def _stem(self, namespace: str) -> str:
+        return re.sub(r"[^\w.-]", "_", f"{namespace}_{self.model_name}")
+
+    def _load(self, namespace: str) -> None:
+        """Load a namespace from disk on first use. Caller must hold the lock."""
+        if namespace in self._vectors:
+            return
+
+        stem = self._stem(namespace)
+        vectors_path = self.cache_dir / f"{stem}.npy"
+        values_path = self.cache_dir / f"{stem}.jsonl"
+        if vectors_path.exists() and values_path.exists():
+            self._vectors[namespace] = np.load(vectors_path)
+            self._values[namespace] = [
+                orjson.loads(line) for line in values_path.read_bytes().splitlines()
+            ]
+        else:
+            self._vectors[namespace] = np.empty((0, 0), dtype=np.float32)
+            self._values[namespace] = []
+
+    def embed(self, texts: list[str]) -> np.ndarray:
+        """Embed texts as L2-normalized float32 row vectors."""
+        vectors = np.asarray(self.embeddings.embed_documents(texts), dtype=np.float32)
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        return vectors / np.where(norms == 0, 1.0, norms)
+
+    def lookup(self, namespace: str, vectors: np.ndarray) -> list[dict | None]:
+        """Return the cached verdict for each vector, or None below the threshold."""
+        with self._lock:
+            self._load(namespace)
+            cached_vectors = self._vectors[namespace]
+            cached_values = self._values[namespace]
+
+            if not len(cached_values) or not len(vectors):
+                results = [None] * len(vectors)
+            else:
+                similarities = vectors @ cached_vectors.T
+                best = similarities.argmax(axis=1)
+                results = [
+                    cached_values[j] if similarities[i, j] >= self.threshold else None
+                    for i, j in enumerate(best)
+                ]
+
+            hits = sum(result is not None for result in results)
+            self.stats["hits"] += hits
+            self.stats["misses"] += len(results) - hits
+        return results
+
+    def add(self, namespace: str, vectors: np.ndarray, values: list[dict]) -> None:
+        """Add verdicts for vectors to a namespace."""
+        if not values:
+            return
+
+        with self._lock:
+            self._load(namespace)
+            existing = self._vectors[namespace]
+            self._vectors[namespace] = (
+                np.vstack([existing, vectors]) if existing.size else vectors
+            )
+            self._values[namespace].extend(values)
+            self._dirty.add(namespace)
+
+    def save(self) -> None:
+        """Persist every namespace that changed since it was loaded."""
+        with self._lock:
+            if not self._dirty:
+                return
+
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            for namespace in self._dirty:
+                stem = self._stem(namespace)
+                np.save(self.cache_dir / f"{stem}.npy", self._vectors[namespace])
+                (self.cache_dir / f"{stem}.jsonl").write_bytes(
+                    b"".join(
+                        orjson.dumps(value) + b"\n" for value in self._values[namespace]
+                    )
+                )
+            self._dirty.clear()
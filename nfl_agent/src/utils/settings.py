@@ -79,12 +79,20 @@ def get_rate_limiter() -> RateLimiter:
     return _rate_limiter
 
 
-def get_chat_model(settings: LLMSettings | None = None):
+def get_chat_model(
+    settings: LLMSettings | None = None,
+    http_client=None,
+    max_retries: int | None = None,
+):
     """
     Create a ChatOpenAI instance with rate limiting and retry configuration.
 
     Args:
         settings: LLMSettings instance. If None, uses default LLMSettings.
+        http_client: Optional httpx.Client to use instead of the OpenAI default,
+            e.g. to share a larger connection pool across worker threads.
+        max_retries: Client retries, overriding RateLimitSettings.max_retries;
+            pass 0 when the caller retries itself.
 
     Returns:
         ChatOpenAI instance configured with rate limiting.
@@ -103,8 +111,11 @@ def get_chat_model(settings: LLMSettings | None = None):
     return ChatOpenAI(
         model=settings.llm_model_name,
         temperature=settings.temperature,
-        max_retries=rate_limit_settings.max_retries,
+        max_retries=rate_limit_settings.max_retries
+        if max_retries is None
+        else max_retries,
         request_timeout=60,
+        http_client=http_client,
     )
 
 
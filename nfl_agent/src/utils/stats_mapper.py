@@ -366,17 +366,10 @@ async def build_team_from_client_async(
         raise ValueError(f"No QB found in depth chart for team {team_id}")
     qb_id = qb_ids[0]
 
-    skill_ids = []
-    skill_ids.extend(depth_chart.get_starter_by_position("RB"))
-    skill_ids.extend(depth_chart.get_starter_by_position("WR", max_wr))
-    skill_ids.extend(depth_chart.get_starter_by_position("TE"))
-
-    def_ids = []
-    def_ids.extend(depth_chart.get_starter_by_position("LDE"))
-    def_ids.extend(depth_chart.get_starter_by_position("RDE"))
-    def_ids.extend(depth_chart.get_starter_by_position("MLB"))
-    def_ids.extend(depth_chart.get_starter_by_position("SLB"))
-    def_ids.extend(depth_chart.get_starter_by_position("LCB"))
+    skill_ids = depth_chart.get_starters_by_positions({"RB": 1, "WR": max_wr, "TE": 1})
+    def_ids = depth_chart.get_starters_by_positions(
+        {"LDE": 1, "RDE": 1, "MLB": 1, "SLB": 1, "LCB": 1}
+    )
 
     all_player_ids = [qb_id] + skill_ids + def_ids
 
@@ -2,8 +2,12 @@ import json
 import os
 from nfl_agent.src.utils.espn_client import ESPNClient
 from nfl_agent.src.utils import stats_mapper
-from nfl_agent.src.models.espn_responses import ESPNDepthChartResponse
-from pytest import fixture
+from nfl_agent.src.models.espn_responses import (
+    ESPNAthleteResponse,
+    ESPNDepthChartResponse,
+)
+from pydantic import ValidationError
+from pytest import fixture, raises
 
 
 @fixture
@@ -12,7 +16,7 @@ def espn_client():
 
 
 @fixture
-def depth_chart() -> ESPNDepthChartResponse:
+def depth_chart_data() -> dict:
     with open(
         os.path.join(
             os.path.dirname(os.path.dirname(__file__)),
@@ -21,7 +25,12 @@ def depth_chart() -> ESPNDepthChartResponse:
         ),
         "r",
     ) as f:
-        return ESPNDepthChartResponse(**json.load(f))
+        return json.load(f)
+
+
+@fixture
+def depth_chart(depth_chart_data: dict) -> ESPNDepthChartResponse:
+    return ESPNDepthChartResponse(**depth_chart_data)
 
 
 def test_get_team_depth_chart(
@@ -31,6 +40,65 @@ def test_get_team_depth_chart(
     assert response is not None
 
 
+def test_depth_chart_from_espn_matches_validation(
+    depth_chart_data: dict, depth_chart: ESPNDepthChartResponse
+):
+    constructed = ESPNDepthChartResponse.from_espn(depth_chart_data)
+
+    assert constructed == depth_chart
+    for position in ("LDE", "QB", "WR"):
+        assert constructed.get_starter_by_position(
+            position
+        ) == depth_chart.get_starter_by_position(position)
+
+
+def test_get_starter_by_position_is_case_insensitive(
+    depth_chart: ESPNDepthChartResponse,
+):
+    assert depth_chart.get_starter_by_position("wr", 3) == (
+        depth_chart.get_starter_by_position("WR", 3)
+    )
+
+
+def test_get_starter_by_position_in_depth_order(depth_chart: ESPNDepthChartResponse):
+    # WR athletes are listed out of rank order (1, 4, 7, 2, ...) in the payload
+    wr_athletes = depth_chart.items[2].positions["wr"].athletes
+    ids_by_rank = {athlete.rank: athlete.get_athlete_id() for athlete in wr_athletes}
+
+    starters = depth_chart.get_starter_by_position("WR", 3)
+
+    assert starters == [ids_by_rank[1], ids_by_rank[2], ids_by_rank[3]]
+
+
+def test_get_starter_by_position_matches_formation_key():
+    athlete = {"rank": 1, "athlete": {"$ref": "http://x/athletes/123?lang=en"}}
+    formation = {
+        "id": "1",
+        "name": "Base",
+        "positions": {"qb": {"athletes": [athlete]}},
+    }
+    depth_chart = ESPNDepthChartResponse.from_espn(
+        {"items": [formation, {**formation, "id": "2"}]}
+    )
+
+    assert depth_chart.get_starter_by_position("QB") == ["123"]
+
+
+def test_athlete_from_espn_rejects_injury_without_type():
+    athlete_data = {
+        "id": "1",
+        "fullName": "Test Player",
+        "height": 74,
+        "weight": 220,
+        "age": 27,
+        "position": {"abbreviation": "QB"},
+        "injuries": [{"status": "Out"}],
+    }
+
+    with raises(ValidationError):
+        ESPNAthleteResponse.from_espn(athlete_data)
+
+
 def test_build_team(espn_client: ESPNClient):
     team = stats_mapper.build_team_from_client(espn_client, team_id="21")
     assert team is not None
@@ -1,11 +1,46 @@
-from nfl_agent.src.tools.article_fetcher import combine_team_info, TeamArticleQueryState
-from nfl_agent.src.models.espn_search import TeamInfo
+import asyncio
+from datetime import datetime
+from unittest.mock import MagicMock
+
+from pytest import fixture
+
+from nfl_agent.prompts.article_relevance.v3 import ArticleRelevanceResponse
+from nfl_agent.src.tools.article_fetcher import TeamArticleQueryState
+from nfl_agent.src.tools.article_fetcher import nodes, utils
+from nfl_agent.src.models.espn_search import ESPNSearchArticle, TeamInfo
+
+
+def make_article(article_id: int) -> ESPNSearchArticle:
+    return ESPNSearchArticle(
+        id=article_id,
+        type="Story",
+        headline=f"Article {article_id}",
+        published=datetime(2025, 1, 1),
+        lastModified=datetime(2025, 1, 1),
+        links={"web": {"href": f"https://espn.com/{article_id}"}},
+    )
+
+
+@fixture
+def read_articles(monkeypatch):
+    """Run node_read_articles with the selected articles summarized as new_info."""
+
+    def _read_articles(state: TeamArticleQueryState, new_info: TeamInfo) -> dict:
+        async def fake_fetch_and_summarize(team_name, articles, max_length):
+            return [new_info for _ in articles]
+
+        monkeypatch.setattr(
+            nodes, "fetch_and_summarize_articles", fake_fetch_and_summarize
+        )
+        return nodes.node_read_articles(state)
+
+    return _read_articles
 
 
 class TestCombineTeamInfo:
-    """Test cases for combine_team_info function covering all field types."""
+    """Test cases for merging summaries in node_read_articles covering all field types."""
 
-    def test_old_team_info_is_none(self):
+    def test_old_team_info_is_none(self, read_articles):
         """When old_team_info is None, should return new_team_info."""
         new_info = TeamInfo(
             name="Eagles",
@@ -20,18 +55,16 @@ class TestCombineTeamInfo:
             "team_id": 21,
             "team_info": None,
             "articles": None,
-            "selected_article": None,
-            "article_content": None,
-            "new_team_info": new_info,
+            "selected_articles": [make_article(1)],
             "articles_read_count": 0,
         }
 
-        result = combine_team_info(state)
+        result = read_articles(state, new_info)
 
         assert result["team_info"] == new_info
         assert result["articles_read_count"] == 1
 
-    def test_list_field_both_none(self):
+    def test_list_field_both_none(self, read_articles):
         """When both old and new list fields are None, keep None."""
         old_info = TeamInfo(name="Eagles", injuries=None)
         new_info = TeamInfo(name="Eagles", injuries=None)
@@ -41,17 +74,15 @@ class TestCombineTeamInfo:
             "team_id": 21,
             "team_info": old_info,
             "articles": None,
-            "selected_article": None,
-            "article_content": None,
-            "new_team_info": new_info,
+            "selected_articles": [make_article(1)],
             "articles_read_count": 0,
         }
 
-        result = combine_team_info(state)
+        result = read_articles(state, new_info)
 
         assert result["team_info"].injuries is None
 
-    def test_list_field_old_none_new_has_values(self):
+    def test_list_field_old_none_new_has_values(self, read_articles):
         """When old list is None and new has values, use new values."""
         old_info = TeamInfo(name="Eagles", injuries=None)
         new_info = TeamInfo(name="Eagles", injuries=["Player A", "Player B"])
@@ -61,17 +92,15 @@ class TestCombineTeamInfo:
             "team_id": 21,
             "team_info": old_info,
             "articles": None,
-            "selected_article": None,
-            "article_content": None,
-            "new_team_info": new_info,
+            "selected_articles": [make_article(1)],
             "articles_read_count": 0,
         }
 
-        result = combine_team_info(state)
+        result = read_articles(state, new_info)
 
         assert result["team_info"].injuries == ["Player A", "Player B"]
 
-    def test_list_field_old_has_values_new_none(self):
+    def test_list_field_old_has_values_new_none(self, read_articles):
         """When old list has values and new is None, keep old values."""
         old_info = TeamInfo(name="Eagles", injuries=["Player A", "Player B"])
         new_info = TeamInfo(name="Eagles", injuries=None)
@@ -81,17 +110,15 @@ class TestCombineTeamInfo:
             "team_id": 21,
             "team_info": old_info,
             "articles": None,
-            "selected_article": None,
-            "article_content": None,
-            "new_team_info": new_info,
+            "selected_articles": [make_article(1)],
             "articles_read_count": 0,
         }
 
-        result = combine_team_info(state)
+        result = read_articles(state, new_info)
 
         assert result["team_info"].injuries == ["Player A", "Player B"]
 
-    def test_list_field_old_empty_new_has_values(self):
+    def test_list_field_old_empty_new_has_values(self, read_articles):
         """When old list is empty and new has values, use new values."""
         old_info = TeamInfo(name="Eagles", injuries=[])
         new_info = TeamInfo(name="Eagles", injuries=["Player A", "Player B"])
@@ -101,17 +128,15 @@ class TestCombineTeamInfo:
             "team_id": 21,
             "team_info": old_info,
             "articles": None,
-            "selected_article": None,
-            "article_content": None,
-            "new_team_info": new_info,
+            "selected_articles": [make_article(1)],
             "articles_read_count": 0,
         }
 
-        result = combine_team_info(state)
+        result = read_articles(state, new_info)
 
         assert result["team_info"].injuries == ["Player A", "Player B"]
 
-    def test_list_field_old_has_values_new_empty(self):
+    def test_list_field_old_has_values_new_empty(self, read_articles):
         """When old list has values and new is empty, keep old values."""
         old_info = TeamInfo(name="Eagles", injuries=["Player A", "Player B"])
         new_info = TeamInfo(name="Eagles", injuries=[])
@@ -121,17 +146,15 @@ class TestCombineTeamInfo:
             "team_id": 21,
             "team_info": old_info,
             "articles": None,
-            "selected_article": None,
-            "article_content": None,
-            "new_team_info": new_info,
+            "selected_articles": [make_article(1)],
             "articles_read_count": 0,
         }
 
-        result = combine_team_info(state)
+        result = read_articles(state, new_info)
 
         assert result["team_info"].injuries == ["Player A", "Player B"]
 
-    def test_list_field_both_have_values_merge_and_deduplicate(self):
+    def test_list_field_both_have_values_merge_and_deduplicate(self, read_articles):
         """When both lists have values, merge and deduplicate."""
         old_info = TeamInfo(name="Eagles", injuries=["Player A", "Player B"])
         new_info = TeamInfo(name="Eagles", injuries=["Player B", "Player C"])
@@ -141,13 +164,11 @@ class TestCombineTeamInfo:
             "team_id": 21,
             "team_info": old_info,
             "articles": None,
-            "selected_article": None,
-            "article_content": None,
-            "new_team_info": new_info,
+            "selected_articles": [make_article(1)],
             "articles_read_count": 0,
         }
 
-        result = combine_team_info(state)
+        result = read_articles(state, new_info)
 
         # Should have all unique items, preserving order (old first, then new)
         assert set(result["team_info"].injuries) == {"Player A", "Player B", "Player C"}
@@ -155,7 +176,7 @@ class TestCombineTeamInfo:
         assert result["team_info"].injuries[1] == "Player B"
         assert result["team_info"].injuries[2] == "Player C"
 
-    def test_list_field_all_fields(self):
+    def test_list_field_all_fields(self, read_articles):
         """Test merging all list fields: injuries, strengths, problem_areas, relevant_players."""
         old_info = TeamInfo(
             name="Eagles",
@@ -177,20 +198,18 @@ class TestCombineTeamInfo:
             "team_id": 21,
             "team_info": old_info,
             "articles": None,
-            "selected_article": None,
-            "article_content": None,
-            "new_team_info": new_info,
+            "selected_articles": [make_article(1)],
             "articles_read_count": 0,
         }
 
-        result = combine_team_info(state)
+        result = read_articles(state, new_info)
 
         assert set(result["team_info"].injuries) == {"Player A", "Player B"}
         assert set(result["team_info"].strengths) == {"Offense", "Special Teams"}
         assert set(result["team_info"].problem_areas) == {"Defense", "Penalties"}
         assert set(result["team_info"].relevant_players) == {"QB1", "RB1"}
 
-    def test_string_field_both_none(self):
+    def test_string_field_both_none(self, read_articles):
         """When both old and new string fields are None, keep None."""
         old_info = TeamInfo(name="Eagles", coaching_summary=None)
         new_info = TeamInfo(name="Eagles", coaching_summary=None)
@@ -200,17 +219,15 @@ class TestCombineTeamInfo:
             "team_id": 21,
             "team_info": old_info,
             "articles": None,
-            "selected_article": None,
-            "article_content": None,
-            "new_team_info": new_info,
+            "selected_articles": [make_article(1)],
             "articles_read_count": 0,
         }
 
-        result = combine_team_info(state)
+        result = read_articles(state, new_info)
 
         assert result["team_info"].coaching_summary is None
 
-    def test_string_field_old_none_new_has_value(self):
+    def test_string_field_old_none_new_has_value(self, read_articles):
         """When old string is None and new has value, use new value."""
         old_info = TeamInfo(name="Eagles", coaching_summary=None)
         new_info = TeamInfo(name="Eagles", coaching_summary="Great coach")
@@ -220,17 +237,15 @@ class TestCombineTeamInfo:
             "team_id": 21,
             "team_info": old_info,
             "articles": None,
-            "selected_article": None,
-            "article_content": None,
-            "new_team_info": new_info,
+            "selected_articles": [make_article(1)],
             "articles_read_count": 0,
         }
 
-        result = combine_team_info(state)
+        result = read_articles(state, new_info)
 
         assert result["team_info"].coaching_summary == "Great coach"
 
-    def test_string_field_old_has_value_new_none(self):
+    def test_string_field_old_has_value_new_none(self, read_articles):
         """When old string has value and new is None, keep old value."""
         old_info = TeamInfo(name="Eagles", coaching_summary="Great coach")
         new_info = TeamInfo(name="Eagles", coaching_summary=None)
@@ -240,17 +255,15 @@ class TestCombineTeamInfo:
             "team_id": 21,
             "team_info": old_info,
             "articles": None,
-            "selected_article": None,
-            "article_content": None,
-            "new_team_info": new_info,
+            "selected_articles": [make_article(1)],
             "articles_read_count": 0,
         }
 
-        result = combine_team_info(state)
+        result = read_articles(state, new_info)
 
         assert result["team_info"].coaching_summary == "Great coach"
 
-    def test_string_field_old_empty_new_has_value(self):
+    def test_string_field_old_empty_new_has_value(self, read_articles):
         """When old string is empty and new has value, use new value."""
         old_info = TeamInfo(name="Eagles", coaching_summary="")
         new_info = TeamInfo(name="Eagles", coaching_summary="Great coach")
@@ -260,17 +273,15 @@ class TestCombineTeamInfo:
             "team_id": 21,
             "team_info": old_info,
             "articles": None,
-            "selected_article": None,
-            "article_content": None,
-            "new_team_info": new_info,
+            "selected_articles": [make_article(1)],
             "articles_read_count": 0,
         }
 
-        result = combine_team_info(state)
+        result = read_articles(state, new_info)
 
         assert result["team_info"].coaching_summary == "Great coach"
 
-    def test_string_field_old_has_value_new_empty(self):
+    def test_string_field_old_has_value_new_empty(self, read_articles):
         """When old string has value and new is empty, keep old value."""
         old_info = TeamInfo(name="Eagles", coaching_summary="Great coach")
         new_info = TeamInfo(name="Eagles", coaching_summary="")
@@ -280,17 +291,15 @@ class TestCombineTeamInfo:
             "team_id": 21,
             "team_info": old_info,
             "articles": None,
-            "selected_article": None,
-            "article_content": None,
-            "new_team_info": new_info,
+            "selected_articles": [make_article(1)],
             "articles_read_count": 0,
         }
 
-        result = combine_team_info(state)
+        result = read_articles(state, new_info)
 
         assert result["team_info"].coaching_summary == "Great coach"
 
-    def test_string_field_both_have_different_values(self):
+    def test_string_field_both_have_different_values(self, read_articles):
         """When both strings have different values, append new to old."""
         old_info = TeamInfo(name="Eagles", coaching_summary="Great offense")
         new_info = TeamInfo(name="Eagles", coaching_summary="Strong defense")
@@ -300,17 +309,15 @@ class TestCombineTeamInfo:
             "team_id": 21,
             "team_info": old_info,
             "articles": None,
-            "selected_article": None,
-            "article_content": None,
-            "new_team_info": new_info,
+            "selected_articles": [make_article(1)],
             "articles_read_count": 0,
         }
 
-        result = combine_team_info(state)
+        result = read_articles(state, new_info)
 
         assert result["team_info"].coaching_summary == "Great offense\n\nStrong defense"
 
-    def test_string_field_new_value_already_in_old(self):
+    def test_string_field_new_value_already_in_old(self, read_articles):
         """When new string value is already contained in old, don't append."""
         old_info = TeamInfo(name="Eagles", coaching_summary="Great offense")
         new_info = TeamInfo(name="Eagles", coaching_summary="Great offense")
@@ -320,18 +327,16 @@ class TestCombineTeamInfo:
             "team_id": 21,
             "team_info": old_info,
             "articles": None,
-            "selected_article": None,
-            "article_content": None,
-            "new_team_info": new_info,
+            "selected_articles": [make_article(1)],
             "articles_read_count": 0,
         }
 
-        result = combine_team_info(state)
+        result = read_articles(state, new_info)
 
         # Should not append duplicate
         assert result["team_info"].coaching_summary == "Great offense"
 
-    def test_string_field_new_value_substring_of_old(self):
+    def test_string_field_new_value_substring_of_old(self, read_articles):
         """When new string is a substring of old, should append because we check exact equality."""
         old_info = TeamInfo(name="Eagles", coaching_summary="Great offense")
         new_info = TeamInfo(name="Eagles", coaching_summary="Great")
@@ -341,18 +346,16 @@ class TestCombineTeamInfo:
             "team_id": 21,
             "team_info": old_info,
             "articles": None,
-            "selected_article": None,
-            "article_content": None,
-            "new_team_info": new_info,
+            "selected_articles": [make_article(1)],
             "articles_read_count": 0,
         }
 
-        result = combine_team_info(state)
+        result = read_articles(state, new_info)
 
         # Should append because "Great" != "Great offense" (exact equality check)
         assert result["team_info"].coaching_summary == "Great offense\n\nGreat"
 
-    def test_mixed_fields_comprehensive(self):
+    def test_mixed_fields_comprehensive(self, read_articles):
         """Test combining all field types together."""
         old_info = TeamInfo(
             name="Eagles",
@@ -376,13 +379,11 @@ class TestCombineTeamInfo:
             "team_id": 21,
             "team_info": old_info,
             "articles": None,
-            "selected_article": None,
-            "article_content": None,
-            "new_team_info": new_info,
+            "selected_articles": [make_article(1)],
             "articles_read_count": 5,
         }
 
-        result = combine_team_info(state)
+        result = read_articles(state, new_info)
 
         assert result["team_info"].name == "Eagles"
         assert "Old summary" in result["team_info"].coaching_summary
@@ -393,7 +394,7 @@ class TestCombineTeamInfo:
         assert set(result["team_info"].relevant_players) == {"QB1", "RB1"}
         assert result["articles_read_count"] == 6
 
-    def test_articles_read_count_increments(self):
+    def test_articles_read_count_increments(self, read_articles):
         """Test that articles_read_count is incremented correctly."""
         old_info = TeamInfo(name="Eagles")
         new_info = TeamInfo(name="Eagles")
@@ -403,12 +404,106 @@ class TestCombineTeamInfo:
             "team_id": 21,
             "team_info": old_info,
             "articles": None,
-            "selected_article": None,
-            "article_content": None,
-            "new_team_info": new_info,
+            "selected_articles": [make_article(1)],
             "articles_read_count": 10,
         }
 
-        result = combine_team_info(state)
+        result = read_articles(state, new_info)
 
         assert result["articles_read_count"] == 11
+
+
+class TestSelectArticles:
+    """Test cases for node_select_articles batch sizing."""
+
+    def _select(self, monkeypatch, articles_read_count: int) -> tuple[dict, list]:
+        counts = []
+
+        def fake_select(team_name, articles, count):
+            counts.append(count)
+            return articles[:count]
+
+        monkeypatch.setattr(nodes, "select_relevant_articles", fake_select)
+        state: TeamArticleQueryState = {
+            "team_name": "Eagles",
+            "team_id": 21,
+            "team_info": None,
+            "articles": [make_article(i) for i in range(10)],
+            "selected_articles": None,
+            "articles_read_count": articles_read_count,
+        }
+        return nodes.node_select_articles(state), counts
+
+    def test_first_batch_covers_min_articles(self, monkeypatch):
+        result, counts = self._select(monkeypatch, 0)
+
+        assert counts == [nodes.MIN_ARTICLES_TO_READ]
+        assert [a.id for a in result["selected_articles"]] == [0, 1, 2, 3, 4]
+        assert [a.id for a in result["articles"]] == [5, 6, 7, 8, 9]
+
+    def test_partial_batch_tops_up_to_min_articles(self, monkeypatch):
+        _, counts = self._select(monkeypatch, 3)
+
+        assert counts == [2]
+
+    def test_reads_one_at_a_time_after_min_articles(self, monkeypatch):
+        _, counts = self._select(monkeypatch, nodes.MIN_ARTICLES_TO_READ)
+
+        assert counts == [1]
+
+    def test_no_articles_skips_selection(self, monkeypatch):
+        monkeypatch.setattr(
+            nodes, "select_relevant_articles", MagicMock(side_effect=AssertionError)
+        )
+        state: TeamArticleQueryState = {
+            "team_name": "Eagles",
+            "team_id": 21,
+            "team_info": None,
+            "articles": [],
+            "selected_articles": None,
+            "articles_read_count": 0,
+        }
+
+        result = nodes.node_select_articles(state)
+
+        assert result["selected_articles"] == []
+        assert nodes.should_read_articles({**state, **result}) == "skip"
+
+
+def test_select_relevant_articles_filters_ids(monkeypatch):
+    """Unknown and repeated IDs are dropped, and at most count are returned."""
+    cache = MagicMock()
+    cache.cached_invoke.return_value = ArticleRelevanceResponse(
+        article_ids=[99, 2, 2, 1, 3]
+    )
+    monkeypatch.setattr(utils, "get_setting", MagicMock())
+    monkeypatch.setattr(utils, "get_chat_model", MagicMock())
+    monkeypatch.setattr(utils, "get_llm_cache", MagicMock(return_value=cache))
+
+    articles = [make_article(i) for i in range(1, 5)]
+    selected = utils.select_relevant_articles("Eagles", articles, count=2)
+
+    assert [a.id for a in selected] == [2, 1]
+
+
+def test_fetch_and_summarize_articles_skips_failures(monkeypatch):
+    """An article that fails to fetch is skipped; the rest keep their order."""
+
+    async def fake_fetch(client, article_url, max_length):
+        if article_url.endswith("/2"):
+            raise ValueError("Failed to extract content from article")
+        return article_url
+
+    async def fake_summarize(team_name, content):
+        return TeamInfo(name=team_name, coaching_summary=content)
+
+    monkeypatch.setattr(utils, "afetch_article_content", fake_fetch)
+    monkeypatch.setattr(utils, "asummarize_article_content", fake_summarize)
+
+    articles = [make_article(i) for i in range(1, 4)]
+    summaries = asyncio.run(utils.fetch_and_summarize_articles("Eagles", articles))
+
+    assert [s.coaching_summary for s in summaries] == [
+        "https://espn.com/1",
+        "https://espn.com/3",
+    ]
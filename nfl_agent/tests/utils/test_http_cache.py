@@ -0,0 +1,32 @@
+import os
+import time
+
+from nfl_agent.src.utils.http_cache import cache_key, cached
+
+
+def test_cache_key_ignores_param_order():
+    url = "https://site.api.espn.com/apis/site/v2/sports/football/nfl/scoreboard"
+    assert cache_key(url, {"week": 1, "dates": "2025"}) == cache_key(
+        url, {"dates": "2025", "week": 1}
+    )
+    assert cache_key(url, {"week": 1}) != cache_key(url, {"week": 2})
+
+
+def test_cached_reuses_fresh_responses_and_refetches_expired(tmp_path):
+    calls = []
+
+    @cached(ttl=60, cache_dir=tmp_path)
+    def fetch(url, params=None):
+        calls.append(url)
+        return b'{"calls": %d}' % len(calls)
+
+    assert fetch("https://example.com/odds") == b'{"calls": 1}'
+    assert fetch("https://example.com/odds") == b'{"calls": 1}'
+    assert len(calls) == 1
+
+    # Age the cached file past its TTL
+    (cached_file,) = tmp_path.glob("*.json")
+    stale = time.time() - 120
+    os.utime(cached_file, (stale, stale))
+
+    assert fetch("https://example.com/odds") == b'{"calls": 2}'
@@ -0,0 +1,34 @@
+from unittest.mock import MagicMock
+
+from pydantic import BaseModel
+
+from nfl_agent.src.utils.llm_cache import LLMCache
+
+
+class Judgment(BaseModel):
+    correct: bool
+
+
+def test_cached_invoke_hits_disk_on_repeat(tmp_path):
+    cache = LLMCache(tmp_path, "gpt-4o", 0.0)
+    chain = MagicMock()
+    chain.invoke.return_value = Judgment(correct=True)
+    messages = [{"role": "user", "content": "Is this correct?"}]
+
+    first = cache.cached_invoke(chain, messages, Judgment)
+    second = cache.cached_invoke(chain, messages, Judgment)
+
+    assert first == second == Judgment(correct=True)
+    assert chain.invoke.call_count == 1
+    assert cache.stats == {"hits": 1, "misses": 1}
+
+
+def test_make_key_depends_on_model_and_messages(tmp_path):
+    messages = [{"role": "user", "content": "a"}]
+    key = LLMCache(tmp_path, "gpt-4o", 0.0).make_key(messages, Judgment)
+
+    assert key == LLMCache(tmp_path, "gpt-4o", 0.0).make_key(messages, Judgment)
+    assert key != LLMCache(tmp_path, "gpt-4o-mini", 0.0).make_key(messages, Judgment)
+    assert key != LLMCache(tmp_path, "gpt-4o", 0.0).make_key(
+        [{"role": "user", "content": "b"}], Judgment
+    )
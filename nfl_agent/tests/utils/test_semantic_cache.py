@@ -0,0 +1,41 @@
+from langchain_core.embeddings import Embeddings
+
+from nfl_agent.src.utils.semantic_cache import SemanticCache
+
+
+class KeywordEmbeddings(Embeddings):
+    """Embeds text as keyword presence flags so similarity is predictable."""
+
+    keywords = ("injury", "questionable", "defense", "offense")
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        return [[float(k in text.lower()) for k in self.keywords] for text in texts]
+
+    def embed_query(self, text: str) -> list[float]:
+        return self.embed_documents([text])[0]
+
+
+def test_lookup_reuses_near_duplicates(tmp_path):
+    cache = SemanticCache(tmp_path, KeywordEmbeddings(), "gpt-4o", threshold=0.95)
+    vectors = cache.embed(["QB injury, questionable"])
+    cache.add("accuracy", vectors, [{"correct": True}])
+
+    results = cache.lookup(
+        "accuracy", cache.embed(["Questionable with injury", "Defense is strong"])
+    )
+
+    assert results == [{"correct": True}, None]
+    assert cache.lookup("relevance", vectors) == [None]
+
+
+def test_save_and_reload(tmp_path):
+    cache = SemanticCache(tmp_path, KeywordEmbeddings(), "gpt-4o")
+    cache.add("accuracy", cache.embed(["injury"]), [{"correct": False}])
+    cache.save()
+
+    reloaded = SemanticCache(tmp_path, KeywordEmbeddings(), "gpt-4o")
+    assert reloaded.lookup("accuracy", reloaded.embed(["injury"])) == [
+        {"correct": False}
+    ]
+    other_model = SemanticCache(tmp_path, KeywordEmbeddings(), "gpt-4o-mini")
+    assert other_model.lookup("accuracy", other_model.embed(["injury"])) == [None]